@@ -1,8 +1,11 @@
 __all__ = ('__version__', 'Character', 'weapons', 'features',
-           'character', 'race', 'background', 'spells')
+           'character', 'race', 'background', 'spells', 'search',
+           'load_many')
 
 from . import weapons, features, race, background, spells
 from .character import Character
+from .rules_search import search
+from .batch import load_many
 
 import os
 
@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 class Shield():
     """A shield that can be worn on one hand."""
     name = "Shield"
@@ -12,8 +15,17 @@ class Shield():
 
     @classmethod
     def improved_version(cls, bonus):
-        bonus = int(bonus)
+        """A magical version of this item with a +``bonus``.
         
+        The same class is returned for repeated calls with the same
+        bonus.
+        
+        """
+        return cls._improved_version(int(bonus))
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _improved_version(cls, bonus):
         class NewShield(cls):
             name = f'+{bonus} ' + cls.name
             base_armor_class = cls.base_armor_class + bonus
@@ -80,8 +92,17 @@ class Armor():
 
     @classmethod
     def improved_version(cls, bonus):
-        bonus = int(bonus)
+        """A magical version of this item with a +``bonus``.
+        
+        The same class is returned for repeated calls with the same
+        bonus.
         
+        """
+        return cls._improved_version(int(bonus))
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _improved_version(cls, bonus):
         class NewArmor(cls):
             name = f'+{bonus} ' + cls.name
             base_armor_class = cls.base_armor_class + bonus
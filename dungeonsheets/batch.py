@@ -0,0 +1,182 @@
+"""Load many character files at once.
+
+Each file is loaded, and its sheet computed, in a pool of worker
+processes (or threads). Results are yielded as soon as each file is
+done, so one slow or broken file doesn't hold up the rest::
+
+    >>> from dungeonsheets import load_many
+    >>> for result in load_many('campaign/', workers=8):
+    ...     if result.error is None:
+    ...         print(result.character.name)
+    ...     else:
+    ...         print(f'{result.filename}: {result.error}')
+
+Characters can't be sent between processes directly, so process
+workers send back the values read from each file (the keyword
+arguments for ``Character()``), and each character is created from
+them once more. Files that define their own classes (or import
+modules) can't be sent this way, and are loaded again instead.
+
+"""
+
+import os
+import pickle
+import warnings
+from collections import namedtuple
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
+
+from . import character_data
+
+
+# ``character`` is None if the file could not be loaded, in which case
+# ``error`` holds the exception. ``warnings`` holds the messages of
+# any warnings raised while loading.
+LoadResult = namedtuple('LoadResult',
+                        ('filename', 'character', 'error', 'warnings'))
+
+EXECUTORS = ('process', 'thread')
+
+
+def character_files(path):
+    """The character files in a directory, sorted by name.
+
+    Python files and character data files (eg. ``.json``) are
+    included. If ``path`` is a file, it is returned by itself.
+
+    """
+    if not os.path.isdir(path):
+        return [path]
+    filenames = []
+    for filename in sorted(os.listdir(path)):
+        if (os.path.splitext(filename)[1] == '.py'
+            or character_data.file_format(filename) is not None):
+            filenames.append(os.path.join(path, filename))
+    return filenames
+
+
+def _load_one(filename, strict, validate, as_props, record_warnings):
+    """Load and validate one character file.
+
+    Returns
+    -------
+    character
+      The character, or None if it could not be loaded. If
+      ``as_props`` is true, the pickled keyword arguments to create it
+      instead (None if they can't be pickled).
+    error : Exception
+      The reason the file could not be loaded, or None.
+    messages : tuple
+      The messages of any warnings, if ``record_warnings`` is true.
+
+    """
+    from .character import character_props
+    with warnings.catch_warnings(record=record_warnings) as caught:
+        if record_warnings:
+            warnings.simplefilter('always')
+        try:
+            props = character_props(filename, strict=strict)
+            if as_props:
+                try:
+                    data = pickle.dumps(props)
+                except Exception:
+                    data = None
+            char = _create(filename, props)
+            if validate:
+                char.compute_sheet()
+            if as_props:
+                char = data
+        except Exception as e:
+            char, error = None, e
+        else:
+            error = None
+    return char, error, tuple(str(w.message) for w in caught or ())
+
+
+def load_many(paths, workers=None, executor='process', strict=False,
+              validate=True):
+    """Load character files in parallel.
+
+    Parameters
+    ----------
+    paths : str or list
+      Character files, or directories of them (see
+      ``character_files()``).
+    workers : int, optional
+      How many files to load at once. Defaults to the number of CPUs.
+      With 1 (or 0), files are loaded one at a time without a pool.
+    executor : str, optional
+      Use a pool of "process" (default) or "thread" workers. Loading
+      is limited by the CPU, so processes are usually faster. Thread
+      workers can't record warnings for each file, so any warnings
+      are raised as usual instead.
+    strict : bool, optional
+      Refuse character files that contain code, instead of importing
+      them (see ``character.read_character_file()``).
+    validate : bool, optional
+      Compute each character's sheet, so that errors in the character
+      (eg. unknown weapons) are found while loading.
+
+    Returns
+    -------
+    results : iterator
+      A ``LoadResult`` for each file, in the order they finish
+      loading.
+
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    filenames = [f for path in paths for f in character_files(os.fspath(path))]
+    if executor not in EXECUTORS:
+        raise ValueError(f'Unknown executor "{executor}". '
+                         f'Valid executors are {EXECUTORS}.')
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    return _load_results(filenames, min(workers, len(filenames)), executor,
+                         strict, validate)
+
+
+def _load_results(filenames, workers, executor, strict, validate):
+    if workers <= 1:
+        for filename in filenames:
+            yield LoadResult(filename, *_load_one(filename, strict, validate,
+                                                  as_props=False,
+                                                  record_warnings=True))
+        return
+    as_props = (executor == 'process')
+    Pool = ProcessPoolExecutor if as_props else ThreadPoolExecutor
+    with Pool(max_workers=workers) as pool:
+        futures = {pool.submit(_load_one, filename, strict, validate,
+                               as_props, record_warnings=as_props): filename
+                   for filename in filenames}
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                char, error, messages = future.result()
+                if as_props and error is None:
+                    # Any warnings were already raised by the worker
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        char = _character(filename, char, strict)
+            except Exception as e:
+                char, error, messages = None, e, ()
+            yield LoadResult(filename, char, error, messages)
+
+
+def _character(filename, data, strict):
+    """Create a character from the values sent back by a worker."""
+    from .character import Character
+    try:
+        props = pickle.loads(data)
+    except Exception:
+        # Eg. classes defined in the character file
+        return Character.load(filename, strict=strict)
+    return _create(filename, props)
+
+
+def _create(filename, props):
+    """Create a character from the values read from ``filename``."""
+    from .character import Character
+    if character_data.file_format(filename) is not None:
+        # Unknown classes, etc. are format errors, as for ``Character.load()``
+        return character_data._create_character(props)
+    return Character(**props)
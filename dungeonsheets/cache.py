@@ -0,0 +1,109 @@
+"""Location and helpers for files cached between runs."""
+
+import json
+import os
+import tempfile
+
+
+CACHE_ENV = 'DUNGEONSHEETS_CACHE_DIR'
+
+
+def cache_dir():
+    """The directory used for cached files.
+    
+    This is the environment variable ``DUNGEONSHEETS_CACHE_DIR`` if
+    set, otherwise ``dungeonsheets`` inside the user's cache directory
+    (``$XDG_CACHE_HOME``, or ``~/.cache``). The directory may not exist
+    yet.
+    
+    """
+    path = os.environ.get(CACHE_ENV)
+    if not path:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+            os.path.expanduser('~'), '.cache')
+        path = os.path.join(base, 'dungeonsheets')
+    return path
+
+
+def write_atomic(filename, data):
+    """Write ``data`` (bytes) to ``filename`` so that other processes
+    never see a partially written file.
+    
+    Missing directories are created.
+    
+    """
+    dirname = os.path.dirname(filename)
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode='wb') as fp:
+            fp.write(data)
+        os.replace(tmp_name, filename)
+    except BaseException:
+        os.remove(tmp_name)
+        raise
+
+
+def write_json(filename, data):
+    """Save ``data`` to ``filename`` as compact JSON (see
+    ``write_atomic()``)."""
+    write_atomic(filename, json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+
+def load_json(filename, fingerprint, build_data, rebuild=True):
+    """Load data cached as JSON, re-building it if it is out of date.
+    
+    Parameters
+    ----------
+    filename : str
+      Path to the cached JSON file.
+    fingerprint : dict
+      Identifies the current data. Cached data whose "fingerprint"
+      entry is different is out of date.
+    build_data : callable
+      Returns the current data, including its "fingerprint".
+    rebuild : bool, optional
+      If true, missing or out-of-date data is re-built with
+      ``build_data()`` and saved, otherwise ``None`` is returned.
+    
+    Returns
+    -------
+    data : dict
+      The cached or re-built data.
+    
+    """
+    try:
+        with open(filename, encoding='utf-8') as fp:
+            data = json.load(fp)
+    except (OSError, ValueError):
+        data = None
+    if isinstance(data, dict) and data.get('fingerprint') == fingerprint:
+        return data
+    if not rebuild:
+        return None
+    data = build_data()
+    try:
+        write_json(filename, data)
+    except OSError:
+        # Cache is not writable, so just use it for this process
+        pass
+    return data
+
+
+def jinja_bytecode_cache():
+    """A cache for compiled jinja templates, shared between processes.
+    
+    Returns
+    -------
+    bytecode_cache : jinja2.FileSystemBytecodeCache
+      Cache in the ``jinja`` sub-directory of ``cache_dir()``, or None
+      if that directory cannot be created.
+    
+    """
+    from jinja2 import FileSystemBytecodeCache
+    directory = os.path.join(cache_dir(), 'jinja')
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory)
@@ -0,0 +1,243 @@
+"""A pre-compiled catalog of the game content in dungeonsheets.
+
+Looking up the names, levels, sources, etc. of all the spells,
+features, and equipment normally means importing every module and
+executing thousands of class bodies. The catalog stores this metadata
+in a single cached file, so that listing and filtering tools can work
+without importing the class modules.
+
+The cached catalog is checked against the dungeonsheets version and
+the modification times of the source files, and re-built if either
+has changed. To build it ahead of time, run::
+
+    $ python -m dungeonsheets.catalog
+
+"""
+
+import importlib
+import os
+from collections import namedtuple
+
+from .cache import cache_dir, load_json, write_json
+
+
+# Bump this whenever the structure of the catalog changes
+CATALOG_FORMAT = 1
+
+CATALOG_FILENAME = 'catalog.json'
+
+# Category -> (module, base class, metadata fields)
+CATEGORIES = {
+    'spells': ('dungeonsheets.spells', 'Spell',
+               ('name', 'level', 'magic_school', 'casting_time',
+                'casting_range', 'components', 'materials', 'duration',
+                'ritual', 'concentration', 'classes')),
+    'features': ('dungeonsheets.features', 'Feature', ('name', 'source')),
+    'weapons': ('dungeonsheets.weapons', 'Weapon',
+                ('name', 'cost', 'base_damage', 'damage_type', 'weight',
+                 'properties')),
+    'armor': ('dungeonsheets.armor', 'Armor',
+              ('name', 'cost', 'base_armor_class', 'dexterity_mod_max',
+               'strength_required', 'stealth_disadvantage', 'weight')),
+    'shields': ('dungeonsheets.armor', 'Shield',
+                ('name', 'cost', 'base_armor_class')),
+    'races': ('dungeonsheets.race', 'Race', ('name', 'size', 'speed')),
+    'backgrounds': ('dungeonsheets.background', 'Background', ('name',)),
+    'magic_items': ('dungeonsheets.magic_items', 'MagicItem',
+                    ('name', 'rarity', 'requires_attunement', 'ac_bonus')),
+    'monsters': ('dungeonsheets.monsters', 'Monster',
+                 ('name', 'description', 'challenge_rating', 'armor_class',
+                  'speed', 'swim_speed', 'fly_speed', 'hp_max')),
+}
+
+# One named tuple per category, eg. ``SpellInfo(attr='Fireball',
+# name='Fireball', level=3, ...)``. ``attr`` is the class's name in
+# its module.
+SpellInfo = namedtuple('SpellInfo', ('attr',) + CATEGORIES['spells'][2])
+FeatureInfo = namedtuple('FeatureInfo', ('attr',) + CATEGORIES['features'][2])
+WeaponInfo = namedtuple('WeaponInfo', ('attr',) + CATEGORIES['weapons'][2])
+ArmorInfo = namedtuple('ArmorInfo', ('attr',) + CATEGORIES['armor'][2])
+ShieldInfo = namedtuple('ShieldInfo', ('attr',) + CATEGORIES['shields'][2])
+RaceInfo = namedtuple('RaceInfo', ('attr',) + CATEGORIES['races'][2])
+BackgroundInfo = namedtuple('BackgroundInfo',
+                            ('attr',) + CATEGORIES['backgrounds'][2])
+MagicItemInfo = namedtuple('MagicItemInfo',
+                           ('attr',) + CATEGORIES['magic_items'][2])
+MonsterInfo = namedtuple('MonsterInfo', ('attr',) + CATEGORIES['monsters'][2])
+
+ENTRY_TYPES = {
+    'spells': SpellInfo,
+    'features': FeatureInfo,
+    'weapons': WeaponInfo,
+    'armor': ArmorInfo,
+    'shields': ShieldInfo,
+    'races': RaceInfo,
+    'backgrounds': BackgroundInfo,
+    'magic_items': MagicItemInfo,
+    'monsters': MonsterInfo,
+}
+
+
+def package_version():
+    """The installed version of dungeonsheets."""
+    filename = os.path.join(os.path.dirname(__file__), '..', 'VERSION')
+    with open(filename) as fp:
+        return fp.read().strip()
+
+
+def source_files():
+    """The python source files that catalog entries are read from."""
+    root = os.path.dirname(os.path.abspath(__file__))
+    files = []
+    for module in sorted({module for module, _, _ in CATEGORIES.values()}):
+        path = os.path.join(root, *module.split('.')[1:])
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, f) for f in sorted(os.listdir(path))
+                         if f.endswith('.py'))
+        else:
+            files.append(path + '.py')
+    return files
+
+
+def catalog_fingerprint():
+    """Describes the sources a catalog was built from.
+
+    A cached catalog is only valid if its fingerprint matches the
+    current one.
+
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    mtimes = {os.path.relpath(f, root): os.stat(f).st_mtime_ns
+              for f in source_files()}
+    return {'format': CATALOG_FORMAT, 'version': package_version(),
+            'mtimes': mtimes}
+
+
+def _field_value(cls, field):
+    value = getattr(cls, field, None)
+    if isinstance(value, property):
+        # Needs an instance to evaluate, which may need an owner
+        try:
+            value = getattr(cls(), field)
+        except Exception:
+            value = cls.__name__ if field == 'name' else None
+    if isinstance(value, tuple):
+        value = list(value)
+    return value
+
+
+def _category_classes(module_name, base_name):
+    """The public subclasses of ``base_name`` in a module, by attribute
+    name."""
+    module = importlib.import_module(module_name)
+    base = getattr(module, base_name)
+    for attr in sorted(dir(module)):
+        if attr.startswith('_'):
+            continue
+        obj = getattr(module, attr)
+        if isinstance(obj, type) and issubclass(obj, base) and obj is not base:
+            yield attr, obj
+
+
+def build_catalog_data():
+    """Import all the game content and collect its metadata.
+
+    Returns
+    -------
+    data : dict
+      JSON-serializable catalog, including its fingerprint. For each
+      category, "fields" lists the column names, and "rows" holds one
+      list of values per class.
+
+    """
+    data = {'fingerprint': catalog_fingerprint()}
+    for category, (module, base, fields) in CATEGORIES.items():
+        rows = [[attr] + [_field_value(cls, field) for field in fields]
+                for attr, cls in _category_classes(module, base)]
+        data[category] = {'fields': ('attr',) + fields, 'rows': rows}
+    return data
+
+
+class Catalog():
+    """Metadata for all of the game content.
+
+    Each category (eg. ``catalog.spells``) is a tuple of named tuples
+    (eg. ``SpellInfo``), sorted by attribute name.
+
+    """
+    def __init__(self, data):
+        self.fingerprint = data['fingerprint']
+        for category, Entry in ENTRY_TYPES.items():
+            rows = data[category]['rows']
+            entries = tuple(Entry(*(tuple(v) if isinstance(v, list) else v
+                                    for v in row))
+                            for row in rows)
+            setattr(self, category, entries)
+
+    def __repr__(self):
+        counts = ', '.join(f'{c}={len(getattr(self, c))}' for c in ENTRY_TYPES)
+        return f'<Catalog: {counts}>'
+
+    def resolve(self, category, entry):
+        """Import the class described by a catalog ``entry``."""
+        module = importlib.import_module(CATEGORIES[category][0])
+        return getattr(module, entry.attr)
+
+
+def catalog_path():
+    """Where the cached catalog file is stored."""
+    return os.path.join(cache_dir(), CATALOG_FILENAME)
+
+
+def build_catalog(filename=None):
+    """Build the catalog and save it to the cache.
+
+    Returns
+    -------
+    catalog : Catalog
+      The newly built catalog.
+
+    """
+    filename = filename or catalog_path()
+    data = build_catalog_data()
+    write_json(filename, data)
+    return Catalog(data)
+
+
+_loaded_catalogs = {}
+
+
+def load_catalog(filename=None, rebuild=True):
+    """Load the cached catalog, re-building it if it is out of date.
+
+    Parameters
+    ----------
+    filename : optional
+      Path to the cached catalog. Defaults to ``catalog.json`` in
+      ``cache.cache_dir()``.
+    rebuild : optional
+      If true, a missing or out-of-date catalog will be re-built
+      (which imports all the game content), otherwise ``None`` is
+      returned.
+
+    Returns
+    -------
+    catalog : Catalog
+      The current catalog.
+
+    """
+    filename = filename or catalog_path()
+    fingerprint = catalog_fingerprint()
+    catalog = _loaded_catalogs.get(filename)
+    if catalog is not None and catalog.fingerprint == fingerprint:
+        return catalog
+    data = load_json(filename, fingerprint, build_catalog_data, rebuild=rebuild)
+    if data is None:
+        return None
+    catalog = Catalog(data)
+    _loaded_catalogs[filename] = catalog
+    return catalog
+
+
+if __name__ == '__main__':
+    print(build_catalog())
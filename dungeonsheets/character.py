@@ -5,12 +5,16 @@ import re
 import os
 import warnings
 from . import exceptions
-import importlib.util
-import jinja2
 import subprocess
+from collections import namedtuple
+from functools import lru_cache
 
-from .stats import Ability, Skill, findattr, ArmorClass, Speed, Initiative
+from .stats import (Ability, Skill, findattr, ArmorClass, Speed, Initiative,
+                    ProficiencyBonus, cached_value)
 from .dice import read_dice_str
+from .cache import jinja_bytecode_cache
+from .character_file import load_character_file
+from . import character_data
 from . import (weapons, race, background, spells, armor, monsters,
                exceptions, classes, features, magic_items)
 from .weapons import Weapon
@@ -26,6 +30,42 @@ __version__ = read('../VERSION').strip()
 
 dice_re = re.compile('(\d+)d(\d+)')
 
+FeaturesCacheInfo = namedtuple('FeaturesCacheInfo', ('hits', 'misses'))
+
+# Immutable snapshots of computed values, see ``Character.compute_sheet()``
+Abilities = namedtuple('Abilities', ('strength', 'dexterity', 'constitution',
+                                     'intelligence', 'wisdom', 'charisma'))
+Skills = namedtuple('Skills', (
+    'acrobatics', 'animal_handling', 'arcana', 'athletics', 'deception',
+    'history', 'insight', 'intimidation', 'investigation', 'medicine',
+    'nature', 'perception', 'performance', 'persuasion', 'religion',
+    'sleight_of_hand', 'stealth', 'survival'))
+WeaponStats = namedtuple('WeaponStats', ('name', 'attack_modifier', 'damage',
+                                         'damage_type'))
+SpellcastingStats = namedtuple('SpellcastingStats', (
+    'name', 'level', 'ability', 'save_dc', 'attack_bonus'))
+CharacterSheet = namedtuple('CharacterSheet', (
+    # Description
+    'name', 'player_name', 'classes_and_levels', 'subclasses', 'background',
+    'race', 'alignment', 'xp', 'inspiration', 'level',
+    # Abilities and skills
+    'proficiency_bonus', 'abilities', 'saving_throw_proficiencies',
+    'skills', 'skill_proficiencies', 'skill_expertise',
+    # Combat
+    'armor_class', 'initiative', 'speed', 'passive_perception',
+    'hit_dice', 'hp_max', 'armor', 'shield', 'weapons',
+    'attacks_and_spellcasting',
+    # Proficiencies, features and personality
+    'proficiencies_text', 'languages', 'features', 'features_text',
+    'features_and_traits', 'personality_traits', 'ideals', 'bonds', 'flaws',
+    # Inventory
+    'cp', 'sp', 'ep', 'gp', 'pp', 'equipment', 'magic_items',
+    'magic_items_text',
+    # Magic
+    'is_spellcaster', 'spellcasting', 'spell_slots', 'spells',
+    'spells_prepared',
+))
+
 __all__ = ('Barbarian', 'Bard', 'Cleric', 'Druid', 'Fighter', 'Monk',
            'Paladin', 'Ranger', 'Rogue', 'Sorcerer', 'Warlock', 'Wizard', )
 
@@ -79,6 +119,7 @@ class Character():
     armor_class = ArmorClass()
     initiative = Initiative()
     speed = Speed()
+    proficiency_bonus = ProficiencyBonus()
     inspiration = 0
     _saving_throw_proficiencies = tuple()  # use to overwrite class proficiencies
     other_weapon_proficiencies = tuple()  # add to class/race proficiencies
@@ -130,6 +171,12 @@ class Character():
     # Features IN MAJOR DEVELOPMENT
     custom_features = list()
     feature_choices = list()
+    # Memoized feature collection, see ``features`` property
+    _features_cache = None
+    _features_index = None
+    _features_key = None
+    _features_hits = 0
+    _features_misses = 0
     
     def __init__(self, **attrs):
         """Takes a bunch of attrs and passes them to ``set_attrs``"""
@@ -172,6 +219,10 @@ class Character():
         self._spells_prepared = list()
         self.custom_features = list()
         self.feature_choices = list()
+        self.invalidate_features()
+        self._derived_values = {}
+        self._features_hits = 0
+        self._features_misses = 0
                 
     def __str__(self):
         return self.name
@@ -233,9 +284,10 @@ class Character():
         elif isinstance(newrace, str):
             try:
                 self._race = findattr(race, newrace)(owner=self)
-            except AttributeError:
+            except AttributeError as e:
                 msg = (f'Race "{newrace}" not defined. '
-                       f'Please add it to ``race.py``')
+                       f'Please add it to ``race.py``.'
+                       + getattr(e, 'hint', ''))
                 self._race = race.Race(owner=self)
                 warnings.warn(msg)
         elif newrace is None:
@@ -255,9 +307,10 @@ class Character():
         elif isinstance(bg, str):
             try:
                 self._background = findattr(background, bg)(owner=self)
-            except AttributeError:
+            except AttributeError as e:
                 msg = (f'Background "{bg}" not defined. '
-                       f'Please add it to ``background.py``')
+                       f'Please add it to ``background.py``.'
+                       + getattr(e, 'hint', ''))
                 self._background = background.Background(owner=self)
                 warnings.warn(msg)
 
@@ -334,29 +387,96 @@ class Character():
     def other_weapon_proficiencies_text(self):
         return tuple(w.name for w in self.other_weapon_proficiencies)
 
+    def _features_state(self):
+        """Everything that the feature collection is derived from.
+        
+        If this value is unchanged, then the cached features are still
+        valid.
+        
+        """
+        return (tuple((c, c.level, c.subclass) for c in self.class_list),
+                self._race, self._background, tuple(self.custom_features))
+
+    def invalidate_features(self):
+        """Discard the cached features so they are rebuilt on next access.
+        
+        Changes to classes, levels, race, background and custom
+        features are detected automatically. This is only needed if
+        the feature lists of those objects are modified in place.
+        
+        """
+        self._features_cache = None
+        self._features_index = None
+        self._features_key = None
+
+    def features_cache_info(self):
+        """Report how often the feature collection was re-used.
+        
+        Returns
+        -------
+        FeaturesCacheInfo
+          Named tuple with the number of cache ``hits`` and ``misses``.
+        
+        """
+        return FeaturesCacheInfo(hits=self._features_hits,
+                                 misses=self._features_misses)
+
     @property
     def features(self):
+        key = self._features_state()
+        if self._features_cache is not None and key == self._features_key:
+            self._features_hits += 1
+            return self._features_cache
+        self._features_misses += 1
         fts = set(self.custom_features)
-        if not self.has_class:
-            return fts
-        for c in self.class_list:
-            fts |= set(c.features)
-        if self.race is not None:
-            fts |= set(getattr(self.race, 'features', ()))
-            # some races have level-based features (Ex: Aasimar)
-            if hasattr(self.race, 'features_by_level'):
-                for lvl in range(1, self.level+1):
-                    fts |= set(self.race.features_by_level[lvl])
-        if self.background is not None:
-            fts |= set(getattr(self.background, 'features', ()))
-        return sorted(tuple(fts), key=(lambda x: x.name))
+        if self.has_class:
+            for c in self.class_list:
+                fts |= set(c.features)
+            if self.race is not None:
+                fts |= set(getattr(self.race, 'features', ()))
+                # some races have level-based features (Ex: Aasimar)
+                if hasattr(self.race, 'features_by_level'):
+                    for lvl in range(1, self.level+1):
+                        fts |= set(self.race.features_by_level[lvl])
+            if self.background is not None:
+                fts |= set(getattr(self.background, 'features', ()))
+        self._features_key = key
+        self._features_cache = tuple(sorted(fts, key=(lambda x: x.name)))
+        # Index each feature under its class and all its base classes
+        index = {}
+        for f in self._features_cache:
+            for cls in type(f).__mro__:
+                index.setdefault(cls, []).append(f)
+        self._features_index = index
+        return self._features_cache
 
     @property
     def custom_features_text(self):
         return tuple([f.name for f in self.custom_features])
 
     def has_feature(self, feat):
-        return any([isinstance(f, feat) for f in self.features])
+        """Does this character have a feature of type ``feat``?"""
+        self.features  # Make sure the index is up to date
+        return feat in self._features_index
+
+    def get_feature(self, feat):
+        """Retrieve this character's feature of type ``feat``.
+        
+        Parameters
+        ----------
+        feat : type
+          The feature class to look for. Subclasses also match.
+        
+        Returns
+        -------
+        Feature
+          The first matching feature (by name), or ``None`` if the
+          character does not have this feature.
+        
+        """
+        self.features  # Make sure the index is up to date
+        matches = self._features_index.get(feat, ())
+        return matches[0] if matches else None
     
     @property
     def saving_throw_proficiencies(self):
@@ -389,12 +509,14 @@ class Character():
                 # compute effective level from PHB pg 164
                 eff_level = 0
                 for c in self.spellcasting_classes:
-                    if type(c) in [classes.Bard, classes.Cleric, classes.Druid,
-                                   classes.Sorceror, classes.Wizard]:
+                    # Compare by name to avoid importing unused classes
+                    class_name = type(c).__name__
+                    if class_name in ('Bard', 'Cleric', 'Druid',
+                                      'Sorceror', 'Wizard'):
                         eff_level += c.level
-                    elif type(c) in [classes.Paladin, classes.Ranger]:
+                    elif class_name in ('Paladin', 'Ranger'):
                         eff_level += c.level // 2
-                    elif type(c) in [classes.Fighter, classes.Rogue]:
+                    elif class_name in ('Fighter', 'Rogue'):
                         eff_level += c.level // 3
                 if eff_level == 0:
                     return 0
@@ -441,9 +563,10 @@ class Character():
                 for mitem in val:
                     try:
                         self.magic_items.append(findattr(magic_items, mitem)(owner=self))
-                    except (AttributeError):
+                    except AttributeError as e:
                         msg = (f'Magic Item "{mitem}" not defined. '
-                               f'Please add it to ``magic_items.py``')
+                               f'Please add it to ``magic_items.py``.'
+                               + getattr(e, 'hint', ''))
                         warnings.warn(msg)
             elif attr == 'weapon_proficiencies':
                 self.other_weapon_proficiencies = ()
@@ -464,9 +587,10 @@ class Character():
                 for f in val:
                     try:
                         _features.append(findattr(features, f))
-                    except AttributeError:
+                    except AttributeError as e:
                         msg = (f'Feature "{f}" not defined. '
-                               f'Please add it to ``features.py``')
+                               f'Please add it to ``features.py``.'
+                               + getattr(e, 'hint', ''))
                         # create temporary feature
                         _features.append(features.create_feature(
                             name=f, source='Unknown',
@@ -479,9 +603,10 @@ class Character():
                 for spell_name in val:
                     try:
                         _spells.append(findattr(spells, spell_name))
-                    except AttributeError:
+                    except AttributeError as e:
                         msg = (f'Spell "{spell_name}" not defined. '
-                               f'Please add it to ``spells.py``')
+                               f'Please add it to ``spells.py``.'
+                               + getattr(e, 'hint', ''))
                         warnings.warn(msg)
                         # Create temporary spell
                         _spells.append(spells.create_spell(name=spell_name, level=9))
@@ -491,10 +616,12 @@ class Character():
                 # Save list of spells to character atribute
                 if attr == 'spells':
                     # Instantiate them all for the spells list
-                    self._spells = tuple(S() for S in _spells)
+                    self._spells = tuple(spells.canonical_spell(S)
+                                         for S in _spells)
                 else:
                     # Instantiate them all for the spells list
-                    self._spells_prepared = tuple(S() for S in _spells)
+                    self._spells_prepared = tuple(spells.canonical_spell(S)
+                                                  for S in _spells)
             else:
                 if not hasattr(self, attr):
                     warnings.warn(f"Setting unknown character attribute {attr}",
@@ -503,12 +630,20 @@ class Character():
                 setattr(self, attr, val)
 
     def spell_save_dc(self, class_type):
-        ability_mod = getattr(self, class_type.spellcasting_ability).modifier
-        return (8 + self.proficiency_bonus + ability_mod)
+        ability = class_type.spellcasting_ability
+        return cached_value(
+            self, ('spell_save_dc', ability),
+            depends_on=(ability, 'proficiency_bonus'),
+            compute=lambda char: (8 + char.proficiency_bonus
+                                  + getattr(char, ability).modifier))
     
     def spell_attack_bonus(self, class_type):
-        ability_mod = getattr(self, class_type.spellcasting_ability).modifier
-        return (self.proficiency_bonus + ability_mod)
+        ability = class_type.spellcasting_ability
+        return cached_value(
+            self, ('spell_attack_bonus', ability),
+            depends_on=(ability, 'proficiency_bonus'),
+            compute=lambda char: (char.proficiency_bonus
+                                  + getattr(char, ability).modifier))
 
     def is_proficient(self, weapon: Weapon):
         """Is the character proficient with this item?
@@ -624,8 +759,9 @@ class Character():
         elif isinstance(weapon, str):
             try:
                 NewWeapon = findattr(weapons, weapon)
-            except AttributeError:
-                raise AttributeError(f'Weapon "{weapon}" is not defined')
+            except AttributeError as e:
+                raise AttributeError(f'Weapon "{weapon}" is not defined.'
+                                     + getattr(e, 'hint', ''))
             weapon_ = NewWeapon(wielder=self)
         elif issubclass(weapon, weapons.Weapon):
             weapon_ = weapon(wielder=self)
@@ -653,23 +789,15 @@ class Character():
     def hit_dice_faces(self, faces):
         self.primary_class.hit_dice_faces = faces
     
-    @property
-    def proficiency_bonus(self):
-        if self.level < 5:
-            prof = 2
-        elif 5 <= self.level < 9:
-            prof = 3
-        elif 9 <= self.level < 13:
-            prof = 4
-        elif 13 <= self.level < 17:
-            prof = 5
-        elif 17 <= self.level:
-            prof = 6
-        return prof
-    
     def can_assume_shape(self, shape: monsters.Monster):
         return hasattr(self, 'Druid') and self.Druid.can_assume_shape(shape)
 
+    def eligible_shapes(self):
+        if hasattr(self, 'Druid'):
+            return self.Druid.eligible_shapes()
+        else:
+            return []
+
     @property
     def all_wild_shapes(self):
         if hasattr(self, 'Druid'):
@@ -690,32 +818,115 @@ class Character():
             self.Druid.wild_shapes = new_shapes
 
     @classmethod
-    def load(cls, character_file):
-        # Create a character from the character definition
-        char_props = read_character_file(character_file)
-        classes = char_props.get('classes', [])
-        # backwards compatability
-        if (len(classes) == 0) and ('character_class' in char_props):
-            char_props['classes'] = [char_props.pop('character_class').lower().capitalize()]
-            char_props['levels'] = [str(char_props.pop('level'))]
+    def load(cls, character_file, strict=False):
+        # Data files (eg. JSON) are read directly
+        if character_data.file_format(character_file) is not None:
+            return character_data.load(character_file)
         # Create the character with loaded properties
-        char = Character(**char_props)
+        char = Character(**character_props(character_file, strict=strict))
         return char
 
     def save(self, filename, template_file='character_template.txt'):
+        # Data files (eg. JSON) don't use the template
+        if character_data.file_format(filename) is not None:
+            character_data.save(self, filename)
+            return
         # Create the template context
         context = dict(
             char=self,
         )
         # Render the template
-        src_path = os.path.join(os.path.dirname(__file__), 'forms/')
-        text = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(src_path or './')
-        ).get_template(template_file).render(context)
+        text = _text_env().get_template(template_file).render(context)
         # Save the file
         with open(filename, mode='w') as f:
             f.write(text)
 
+    def to_dict(self):
+        """Convert this character to plain data, which can be saved
+        as JSON (see ``character_data``)."""
+        return character_data.character_to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a character from data made by ``to_dict()``."""
+        return character_data.character_from_dict(data)
+
+    def compute_sheet(self):
+        """Evaluate every derived value once into an immutable snapshot.
+        
+        Values are computed in dependency order (features and
+        proficiency bonus first, then abilities, skills, etc.), so
+        exporters can read the snapshot instead of repeatedly
+        re-computing properties on the live character.
+        
+        Returns
+        -------
+        CharacterSheet
+          Named tuple with the computed values of this character.
+        
+        """
+        features = self.features
+        proficiency_bonus = self.proficiency_bonus
+        abilities = Abilities(*(getattr(self, ab) for ab in Abilities._fields))
+        skills = Skills(*(getattr(self, sk) for sk in Skills._fields))
+        weapon_stats = tuple(
+            WeaponStats(name=w.name, attack_modifier=w.attack_modifier,
+                        damage=w.damage, damage_type=w.damage_type)
+            for w in self.weapons)
+        spellcasting = tuple(
+            SpellcastingStats(name=c.name, level=c.level,
+                              ability=c.spellcasting_ability,
+                              save_dc=self.spell_save_dc(c),
+                              attack_bonus=self.spell_attack_bonus(c))
+            for c in self.spellcasting_classes)
+        spell_slots = tuple(self.spell_slots(lvl) or 0 for lvl in range(10))
+        return CharacterSheet(
+            name=self.name,
+            player_name=self.player_name,
+            classes_and_levels=self.classes_and_levels,
+            subclasses=tuple(self.subclasses),
+            background=str(self.background),
+            race=str(self.race),
+            alignment=self.alignment,
+            xp=self.xp,
+            inspiration=self.inspiration,
+            level=self.level,
+            proficiency_bonus=proficiency_bonus,
+            abilities=abilities,
+            saving_throw_proficiencies=tuple(self.saving_throw_proficiencies),
+            skills=skills,
+            skill_proficiencies=tuple(self.skill_proficiencies),
+            skill_expertise=tuple(self.skill_expertise),
+            armor_class=self.armor_class,
+            initiative=self.initiative,
+            speed=self.speed,
+            passive_perception=10 + skills.perception,
+            hit_dice=self.hit_dice,
+            hp_max=self.hp_max,
+            armor=str(self.armor),
+            shield=str(self.shield),
+            weapons=weapon_stats,
+            attacks_and_spellcasting=self.attacks_and_spellcasting,
+            proficiencies_text=self.proficiencies_text,
+            languages=self.languages,
+            features=features,
+            features_text=self.features_text,
+            features_and_traits=self.features_and_traits,
+            personality_traits=self.personality_traits,
+            ideals=self.ideals,
+            bonds=self.bonds,
+            flaws=self.flaws,
+            cp=self.cp, sp=self.sp, ep=self.ep, gp=self.gp, pp=self.pp,
+            equipment=self.equipment,
+            magic_items=tuple(self.magic_items),
+            magic_items_text=self.magic_items_text,
+            is_spellcaster=(len(spellcasting) > 0),
+            spellcasting=spellcasting,
+            spell_slots=spell_slots,
+            spells=tuple(self.spells),
+            spells_prepared=tuple(self.spells_prepared),
+        )
+
     def to_pdf(self, filename, **kwargs):
         from .make_sheets import make_sheet
         if filename.endswith('.pdf'):
@@ -724,45 +935,61 @@ class Character():
                    flatten=kwargs.get('flatten', True))
 
         
-def read_character_file(filename):
+@lru_cache(maxsize=None)
+def _text_env():
+    """The shared jinja environment for plain-text templates (eg. for
+    saving characters), created on first use."""
+    import jinja2
+    src_path = os.path.join(os.path.dirname(__file__), 'forms/')
+    return jinja2.Environment(loader=jinja2.FileSystemLoader(src_path),
+                              bytecode_cache=jinja_bytecode_cache())
+
+
+def read_character_file(filename, strict=False, use_cache=True):
     """Create a character object from the given definition file.
     
-    The definition file should be an importable python file, filled
-    with variables describing the character.
+    The definition file should be a python file, filled with
+    variables describing the character. Files that only assign values
+    are read without running them (see ``character_file``).
+    
+    Parameters
+    ----------
+    filename : str
+      The path to the file that will be read.
+    strict : bool, optional
+      If true, refuse files that contain any code, instead of
+      importing them.
+    use_cache : bool, optional
+      If true, files that have been read before are loaded from a
+      cache, keyed by the file's contents.
+    
+    """
+    return load_character_file(filename, strict=strict, use_cache=use_cache)
+
+
+def character_props(filename, strict=False):
+    """The keyword arguments for ``Character()`` given by a character
+    file, or a character data file (eg. JSON).
     
     Parameters
     ----------
     filename : str
-      The path to the file that will be imported.
+      The path to the file that will be read.
+    strict : bool, optional
+      If true, refuse character files that contain any code (see
+      ``read_character_file()``).
     
     """
-    # Parse the file name
-    dir_, fname = os.path.split(os.path.abspath(filename))
-    module_name, ext = os.path.splitext(fname)
-    if ext != '.py':
-        raise ValueError(f"Character definition {filename} is not a python file.")
-    # Check if this file contains the version string
-    version_re = re.compile('dungeonsheets_version\s*=\s*[\'"]([0-9.]+)[\'"]')
-    with open(filename, mode='r') as f:
-        version = None
-        for line in f:
-            match = version_re.match(line)
-            if match:
-                version = match.group(1)
-                break
-        if version is None:
-            # Not a valid DND character file
-            raise exceptions.CharacterFileFormatError(
-                f"No ``dungeonsheets_version = `` entry in `{filename}`.")
-    # Import the module to extract the information
-    spec = importlib.util.spec_from_file_location('module', filename)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    # Prepare a list of properties for this character
-    char_props = {}
-    for prop_name in dir(module):
-        if prop_name[0:2] != '__':
-            char_props[prop_name] = getattr(module, prop_name)
+    # Data files (eg. JSON) are read directly
+    if character_data.file_format(filename) is not None:
+        return character_data.load_props(filename)
+    # Create a character from the character definition
+    char_props = read_character_file(filename, strict=strict)
+    classes = char_props.get('classes', [])
+    # backwards compatability
+    if (len(classes) == 0) and ('character_class' in char_props):
+        char_props['classes'] = [char_props.pop('character_class').lower().capitalize()]
+        char_props['levels'] = [str(char_props.pop('level'))]
     return char_props
 
 
@@ -0,0 +1,423 @@
+"""Save and load characters as JSON or MessagePack data.
+
+Character files (see ``character_file``) are meant to be written by
+hand. For storing many characters, or sending them between programs,
+a character can instead be converted to a plain dictionary with
+``character_to_dict()``. Classes, subclasses, race, background,
+features, items, spells and wild shapes are stored by their canonical
+ID (the name of their class in dungeonsheets, eg. "MagicMissile"), so
+loading them again needs no fuzzy name matching::
+
+    >>> from dungeonsheets import character_data
+    >>> data = character_data.dumps(char)
+    >>> char2 = character_data.loads(data)
+
+``dumps()`` and ``loads()`` work on bytes, so the data can be sent
+over a socket. ``dump_all()`` and ``load_all()`` write and read a
+stream of characters, eg. from ``socket.makefile('rb')``. JSON streams
+hold one character per line. The MessagePack format requires the
+optional ``msgpack`` package.
+
+Every document has a "schema_version". Data written by a newer
+version of dungeonsheets than the one reading it is refused.
+
+"""
+
+import json
+import os
+
+from . import (classes, race, background, features, spells, weapons,
+               armor, magic_items, monsters)
+from .exceptions import CharacterFileFormatError
+
+
+# Bump this whenever the structure of the data changes
+SCHEMA_VERSION = 1
+
+SCHEMA_NAME = 'dungeonsheets.character'
+
+FORMATS = ('json', 'msgpack')
+
+# File extensions for each format
+EXTENSIONS = {
+    '.json': 'json',
+    '.msgpack': 'msgpack',
+    '.mpk': 'msgpack',
+}
+
+ABILITIES = ('strength', 'dexterity', 'constitution', 'intelligence',
+             'wisdom', 'charisma')
+
+# Attributes that are stored as they are
+PLAIN_FIELDS = (
+    'name', 'player_name', 'alignment', 'xp', 'hp_max', 'inspiration',
+    'languages', 'cp', 'sp', 'ep', 'gp', 'pp', 'equipment',
+    'attacks_and_spellcasting', 'personality_traits', 'ideals', 'bonds',
+    'flaws', 'features_and_traits',
+)
+
+# Attributes that are stored as lists of strings (eg. IDs)
+LIST_FIELDS = (
+    'saving_throw_proficiencies', 'skill_proficiencies', 'skill_expertise',
+    'weapon_proficiencies', 'proficiencies_text', 'features',
+    'feature_choices', 'weapons', 'magic_items', 'spells', 'spells_prepared',
+    'wild_shapes',
+)
+
+# Attributes that are stored as a single ID, or None
+ID_FIELDS = ('race', 'background', 'armor', 'shield')
+
+
+def canonical_id(obj, module):
+    """The ID of a game object (or class), eg. "MagicMissile".
+
+    This is the name of the object's class in ``module``. Objects
+    whose class is not in the module (eg. "+1 Longsword", or unknown
+    spells) fall back to their display name, which is looked up with
+    ``stats.findattr()`` when loading.
+
+    """
+    cls = obj if isinstance(obj, type) else type(obj)
+    if getattr(module, cls.__name__, None) is cls:
+        return cls.__name__
+    return cls.name
+
+
+def _resolve(module, id_, base):
+    """The class with a given ID, or the ID itself if it can't be
+    found, so that the character gets the usual warnings."""
+    obj = getattr(module, id_, None) if id_.isidentifier() else None
+    if isinstance(obj, type) and issubclass(obj, base):
+        return obj
+    return id_
+
+
+def _resolve_subclass(char_class, id_):
+    # Subclasses are only listed by their character class
+    if isinstance(char_class, type):
+        for subclass in char_class.subclasses_available:
+            if subclass.__name__ == id_:
+                return subclass
+    return id_
+
+
+def _ids(objects, module):
+    return [canonical_id(obj, module) for obj in objects]
+
+
+def _optional_id(obj, module, default_class):
+    if obj is None or type(obj) is default_class:
+        return None
+    return canonical_id(obj, module)
+
+
+def character_to_dict(char):
+    """Convert a character into plain data.
+
+    Only the choices that define the character are stored, not the
+    values computed from them (eg. armor class), so the result is
+    small and can be loaded by ``character_from_dict()``.
+
+    Returns
+    -------
+    data : dict
+      Contains only strings, numbers, None, lists and dicts.
+
+    """
+    data = {
+        'schema': SCHEMA_NAME,
+        'schema_version': SCHEMA_VERSION,
+        'dungeonsheets_version': char.dungeonsheets_version.strip(),
+    }
+    data.update({field: getattr(char, field) for field in PLAIN_FIELDS})
+    data['classes'] = [{
+        'id': canonical_id(c, classes),
+        'level': c.level,
+        'subclass': None if c.subclass is None else type(c.subclass).__name__,
+    } for c in char.class_list]
+    data['race'] = _optional_id(char.race, race, race.Race)
+    data['background'] = _optional_id(char.background, background,
+                                      background.Background)
+    data['abilities'] = {ab: getattr(char, ab).value for ab in ABILITIES}
+    data['saving_throw_proficiencies'] = list(char._saving_throw_proficiencies)
+    data['skill_proficiencies'] = list(char.skill_proficiencies)
+    data['skill_expertise'] = list(char.skill_expertise)
+    data['weapon_proficiencies'] = _ids(char.other_weapon_proficiencies, weapons)
+    data['proficiencies_text'] = list(char._proficiencies_text)
+    data['features'] = _ids(char.custom_features, features)
+    data['feature_choices'] = list(char.feature_choices)
+    # Natural weapons (eg. claws) are given again by the race
+    wielded = list(char.weapons)
+    for natural in getattr(char.race, 'natural_weapons', ()):
+        for weapon in wielded:
+            if type(weapon) is natural:
+                wielded.remove(weapon)
+                break
+    data['weapons'] = _ids(wielded, weapons)
+    data['magic_items'] = _ids(char.magic_items, magic_items)
+    data['armor'] = None if char.armor is None else canonical_id(char.armor, armor)
+    data['shield'] = None if char.shield is None else canonical_id(char.shield, armor)
+    data['spells'] = _ids(char._spells, spells)
+    data['spells_prepared'] = _ids(char._spells_prepared, spells)
+    data['wild_shapes'] = _ids(char.all_wild_shapes, monsters)
+    return data
+
+
+def check_schema(data):
+    """Make sure that ``data`` is a character this version can read.
+
+    Raises
+    ------
+    CharacterFileFormatError
+      The data is not a character, has a newer schema version, or
+      some of its values have the wrong type.
+
+    """
+    if not isinstance(data, dict) or data.get('schema') != SCHEMA_NAME:
+        raise CharacterFileFormatError('Data is not a dungeonsheets character.')
+    version = data.get('schema_version')
+    if not isinstance(version, int) or not 1 <= version <= SCHEMA_VERSION:
+        raise CharacterFileFormatError(
+            f'Character schema version {version!r} is not supported '
+            f'(up to {SCHEMA_VERSION}). Please upgrade dungeonsheets.')
+    for field in PLAIN_FIELDS:
+        _check_type(data, field, (str, int, float, type(None)))
+    for field in ID_FIELDS:
+        _check_type(data, field, (str, type(None)))
+    for field in LIST_FIELDS:
+        if _check_type(data, field, list):
+            for value in data[field]:
+                _check_value(field, value, str)
+    if _check_type(data, 'abilities', dict):
+        for ability, value in data['abilities'].items():
+            if ability not in ABILITIES:
+                raise CharacterFileFormatError(f'Unknown ability "{ability}".')
+            _check_value(ability, value, int)
+    if _check_type(data, 'classes', list):
+        for char_class in data['classes']:
+            _check_value('classes', char_class, dict)
+            for key in ('id', 'level'):
+                if key not in char_class:
+                    raise CharacterFileFormatError(
+                        f'Character class is missing "{key}".')
+            _check_type(char_class, 'id', str)
+            _check_type(char_class, 'level', int)
+            if char_class['level'] < 1:
+                raise CharacterFileFormatError(
+                    f'Invalid value for "level": {char_class["level"]!r}.')
+            _check_type(char_class, 'subclass', (str, type(None)))
+
+
+def _check_type(data, key, types):
+    """Make sure that ``data[key]`` has one of ``types``, if present.
+
+    Returns
+    -------
+    present : bool
+      Whether ``data`` has ``key``.
+
+    """
+    if key not in data:
+        return False
+    _check_value(key, data[key], types)
+    return True
+
+
+def _check_value(name, value, types):
+    # JSON has no separate booleans and integers, but python does
+    if isinstance(value, bool) and types is int:
+        types = ()
+    if not isinstance(value, types):
+        raise CharacterFileFormatError(
+            f'Invalid value for "{name}": {value!r:.40}.')
+
+
+def _character_props(data):
+    """The keyword arguments for ``Character()``, with the IDs of
+    classes, race and background replaced by the classes themselves."""
+    props = {field: data[field] for field in PLAIN_FIELDS if field in data}
+    char_classes = data.get('classes', [])
+    props['classes'] = [_resolve(classes, c['id'], classes.CharClass)
+                        for c in char_classes]
+    props['levels'] = [c['level'] for c in char_classes]
+    props['subclasses'] = [
+        None if c.get('subclass') is None
+        else _resolve_subclass(cls, c['subclass'])
+        for cls, c in zip(props['classes'], char_classes)]
+    if data.get('race') is not None:
+        props['race'] = _resolve(race, data['race'], race.Race)
+    if data.get('background') is not None:
+        props['background'] = _resolve(background, data['background'],
+                                       background.Background)
+    props.update(data.get('abilities', {}))
+    if data.get('saving_throw_proficiencies'):
+        props['saving_throw_proficiencies'] = tuple(data['saving_throw_proficiencies'])
+    for key in ('skill_proficiencies', 'skill_expertise', 'feature_choices'):
+        props[key] = list(data.get(key, []))
+    if 'proficiencies_text' in data:
+        props['_proficiencies_text'] = list(data['proficiencies_text'])
+    # These are looked up by the character itself
+    for key in ('weapon_proficiencies', 'features', 'weapons',
+                'magic_items', 'spells', 'spells_prepared'):
+        if data.get(key):
+            props[key] = list(data[key])
+    for key in ('armor', 'shield'):
+        if data.get(key) is not None:
+            props[key] = data[key]
+    if data.get('wild_shapes'):
+        props['wild_shapes'] = list(data['wild_shapes'])
+    return props
+
+
+def character_from_dict(data):
+    """Create a character from data made by ``character_to_dict()``.
+
+    Raises
+    ------
+    CharacterFileFormatError
+      The data is not a character, has a newer schema version, or
+      refers to classes, weapons, etc. that don't exist.
+
+    """
+    check_schema(data)
+    return _create_character(_character_props(data))
+
+
+def _create_character(props):
+    from .character import Character
+    try:
+        return Character(**props)
+    except AttributeError as e:
+        # Unknown classes, weapons, etc.
+        raise CharacterFileFormatError(f'Invalid character data: {e}') from None
+
+
+def _msgpack(format):
+    try:
+        import msgpack
+    except ImportError:
+        raise CharacterFileFormatError(
+            f'The "{format}" format requires the "msgpack" package.') from None
+    return msgpack
+
+
+def _check_format(format):
+    if format not in FORMATS:
+        raise ValueError(f'Unknown character data format "{format}". '
+                         f'Valid formats are {FORMATS}.')
+
+
+def dumps(char, format='json'):
+    """Convert a character to bytes in the given format ("json" or
+    "msgpack")."""
+    _check_format(format)
+    data = character_to_dict(char)
+    if format == 'msgpack':
+        return _msgpack(format).packb(data, use_bin_type=True)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _guess_format(data):
+    # Characters are MessagePack maps, which start with one of these
+    first = data[:1]
+    if isinstance(data, bytes) and first and (0x80 <= first[0] <= 0x8f
+                                              or first[0] in (0xde, 0xdf)):
+        return 'msgpack'
+    return 'json'
+
+
+def _decode(data, format=None):
+    if format is None:
+        format = _guess_format(data)
+    _check_format(format)
+    try:
+        if format == 'msgpack':
+            data = _msgpack(format).unpackb(data, raw=False)
+        else:
+            data = json.loads(data)
+    except ValueError as e:
+        raise CharacterFileFormatError(f'Cannot read character data: {e}') from None
+    check_schema(data)
+    return data
+
+
+def loads(data, format=None):
+    """Create a character from bytes made by ``dumps()``.
+
+    If ``format`` is not given, MessagePack is assumed if the data
+    starts like a MessagePack map, otherwise JSON.
+
+    """
+    return character_from_dict(_decode(data, format=format))
+
+
+def file_format(filename):
+    """The format of a character data file, from its extension, or
+    None if it is not a data file."""
+    return EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def save(char, filename, format=None):
+    """Save a character to a data file.
+
+    The format is given by the extension (".json", ".msgpack") unless
+    ``format`` is given.
+
+    """
+    format = format or file_format(filename) or 'json'
+    with open(filename, mode='wb') as fp:
+        fp.write(dumps(char, format=format))
+
+
+def load(filename, format=None):
+    """Load a character from a data file made by ``save()``."""
+    return _create_character(load_props(filename, format=format))
+
+
+def load_props(filename, format=None):
+    """The keyword arguments for ``Character()`` stored in a data file
+    made by ``save()``."""
+    format = format or file_format(filename)
+    with open(filename, mode='rb') as fp:
+        return _character_props(_decode(fp.read(), format=format))
+
+
+def dump_all(chars, fp, format='json'):
+    """Write several characters to a binary file or stream.
+
+    Returns
+    -------
+    count : int
+      The number of characters written.
+
+    """
+    _check_format(format)
+    count = 0
+    for char in chars:
+        data = dumps(char, format=format)
+        fp.write(data + b'\n' if format == 'json' else data)
+        count += 1
+    return count
+
+
+def load_all(fp, format='json'):
+    """Read characters written by ``dump_all()`` from a binary file or
+    stream.
+
+    Characters are read one at a time, so the whole stream does not
+    need to fit in memory.
+
+    Yields
+    ------
+    char : Character
+      Each character in the stream.
+
+    """
+    _check_format(format)
+    if format == 'msgpack':
+        for data in _msgpack(format).Unpacker(fp, raw=False):
+            yield character_from_dict(data)
+        return
+    for line in fp:
+        if line.strip():
+            yield loads(line, format='json')
@@ -0,0 +1,374 @@
+"""Read character files without running them.
+
+Character files are python modules, but nearly all of them only
+assign values to variables::
+
+    dungeonsheets_version = "0.9.4"
+    name = "Rogue1"
+    levels = [20]
+    spells = spells_prepared + __spells_unprepared
+
+``parse_character_source()`` reads such files with ``ast`` and
+evaluates the assignments itself, so no code from the file is ever
+executed. Values may be literals (strings, numbers, lists, tuples,
+dicts, sets, True/False/None), names assigned earlier in the file,
+and sums of these. Anything else (imports, function calls, class
+definitions, etc.) is rejected with an ``UnsafeCharacterFileError``.
+
+"""
+
+import ast
+import hashlib
+import importlib.util
+import marshal
+import math
+import operator
+import os
+import sys
+
+from .cache import cache_dir, write_atomic
+from .exceptions import CharacterFileFormatError, UnsafeCharacterFileError
+
+
+VERSION_NAME = 'dungeonsheets_version'
+
+# Bump this whenever the parser accepts or rejects different files, so
+# that results cached by an older parser are not used
+PARSER_FORMAT = 2
+
+_binary_ops = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+}
+
+_unary_ops = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+_numbers = (int, float)
+
+# Limits on the values that operations in a character file can create,
+# so that a small file cannot use up all the memory or CPU time
+MAX_LENGTH = 100000  # Items in one string, list or tuple
+MAX_TOTAL_LENGTH = 1000000  # Items created by all the operations in a file
+MAX_INT_BITS = 128
+
+# Python 3.7 parses literals as ``Str``, ``Num``, etc. instead of
+# ``Constant``
+_legacy_literals = {
+    'Str': lambda node: node.s,
+    'Bytes': lambda node: node.s,
+    'Num': lambda node: node.n,
+    'NameConstant': lambda node: node.value,
+    'Ellipsis': lambda node: ...,
+}
+
+
+def _is_literal(node):
+    return isinstance(node, ast.Constant) or type(node).__name__ in _legacy_literals
+
+
+def _literal_value(node):
+    if isinstance(node, ast.Constant):
+        return node.value
+    return _legacy_literals[type(node).__name__](node)
+
+
+class _Evaluator():
+    """Evaluates the value of an assignment in a character file."""
+    def __init__(self, filename, namespace):
+        self.filename = filename
+        self.namespace = namespace
+        self.total_length = 0
+
+    def reject(self, node, what):
+        line = getattr(node, 'lineno', '?')
+        raise UnsafeCharacterFileError(
+            f'{what} is not allowed in character files '
+            f'({self.filename}, line {line}).')
+
+    def check_size(self, node, left, right):
+        """Make sure that an operation on ``left`` and ``right`` can't
+        create a value that is too large, before it is computed."""
+        if isinstance(left, int) and isinstance(right, int):
+            bits = max(left.bit_length(), right.bit_length()) + 1
+            if isinstance(node.op, ast.Mult):
+                bits = left.bit_length() + right.bit_length()
+            if bits > MAX_INT_BITS:
+                self.reject(node, 'A number this large')
+        elif not isinstance(left, _numbers):
+            length = len(left) + len(right)
+            self.total_length += length
+            if length > MAX_LENGTH or self.total_length > MAX_TOTAL_LENGTH:
+                self.reject(node, 'A value this long')
+
+    def __call__(self, node):
+        if _is_literal(node):
+            return _literal_value(node)
+        elif isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            values = [self(elt) for elt in node.elts]
+            if isinstance(node, ast.List):
+                return values
+            elif isinstance(node, ast.Tuple):
+                return tuple(values)
+            return set(values)
+        elif isinstance(node, ast.Dict):
+            if None in node.keys:
+                self.reject(node, 'Dictionary unpacking')
+            return {self(k): self(v) for k, v in zip(node.keys, node.values)}
+        elif isinstance(node, ast.Name):
+            try:
+                return self.namespace[node.id]
+            except KeyError:
+                raise CharacterFileFormatError(
+                    f'"{node.id}" is used before it is assigned '
+                    f'({self.filename}, line {node.lineno}).') from None
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _unary_ops:
+            operand = self(node.operand)
+            if not isinstance(operand, _numbers):
+                self.reject(node, 'This operation')
+            return _unary_ops[type(node.op)](operand)
+        elif isinstance(node, ast.BinOp) and type(node.op) in _binary_ops:
+            left, right = self(node.left), self(node.right)
+            # Only numbers can be multiplied, etc., and the sizes of
+            # the results are limited (see ``check_size()``)
+            both_numbers = isinstance(left, _numbers) and isinstance(right, _numbers)
+            same_sequence = (type(left) is type(right)
+                             and isinstance(left, (str, list, tuple)))
+            if not (both_numbers or (isinstance(node.op, ast.Add) and same_sequence)):
+                self.reject(node, 'This operation')
+            self.check_size(node, left, right)
+            try:
+                result = _binary_ops[type(node.op)](left, right)
+            except ArithmeticError as e:
+                raise CharacterFileFormatError(
+                    f'{e} ({self.filename}, line {node.lineno}).') from None
+            if isinstance(result, float) and not math.isfinite(result):
+                self.reject(node, 'A number this large')
+            return result
+        self.reject(node, type(node).__name__)
+
+
+def _assigned_names(target):
+    if isinstance(target, ast.Name):
+        return [target.id]
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        return [name for elt in target.elts for name in _assigned_names(elt)]
+    return None
+
+
+def _assign(namespace, target, value, evaluator):
+    if isinstance(target, ast.Name):
+        namespace[target.id] = value
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        values = list(value) if isinstance(value, (list, tuple)) else None
+        if values is None or len(values) != len(target.elts):
+            raise CharacterFileFormatError(
+                f'Cannot unpack {value!r} ({evaluator.filename}, '
+                f'line {target.lineno}).')
+        for elt, elt_value in zip(target.elts, values):
+            _assign(namespace, elt, elt_value, evaluator)
+    else:
+        evaluator.reject(target, 'Assigning to attributes or items')
+
+
+def parse_character_source(source, filename='<character file>'):
+    """Read the variables defined in the source of a character file.
+
+    Parameters
+    ----------
+    source : str
+      The contents of the character file.
+    filename : str, optional
+      Used in error messages.
+
+    Returns
+    -------
+    char_props : dict
+      The value of each variable, except those starting with "__".
+
+    Raises
+    ------
+    CharacterFileFormatError
+      The source is not a character file.
+    UnsafeCharacterFileError
+      The source contains code other than simple assignments.
+
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        raise CharacterFileFormatError(f'Cannot read {filename}: {e}') from None
+    # Check that this is a character file before looking any further
+    has_version = any(
+        isinstance(node, ast.Assign)
+        and any(_assigned_names(t) == [VERSION_NAME] for t in node.targets)
+        and _is_literal(node.value) and isinstance(_literal_value(node.value), str)
+        for node in tree.body)
+    if not has_version:
+        raise CharacterFileFormatError(
+            f"No ``{VERSION_NAME} = `` entry in `{filename}`.")
+    namespace = {}
+    evaluate = _Evaluator(filename, namespace)
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            value = evaluate(node.value)
+            for target in node.targets:
+                _assign(namespace, target, value, evaluate)
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            _assign(namespace, node.target, evaluate(node.value), evaluate)
+        elif isinstance(node, ast.Expr) and _is_literal(node.value):
+            # Docstrings and other bare values do nothing
+            continue
+        elif isinstance(node, ast.Pass):
+            continue
+        else:
+            evaluate.reject(node, f'"{type(node).__name__}" statement')
+    return {name: value for name, value in namespace.items()
+            if not name.startswith('__')}
+
+
+def exec_character_file(filename):
+    """Read a character file by running it as a python module.
+
+    Only use this for trusted files that cannot be read by
+    ``parse_character_source()``, eg. because they define custom
+    classes.
+
+    """
+    module_name = os.path.splitext(os.path.basename(filename))[0]
+    spec = importlib.util.spec_from_file_location(
+        f'dungeonsheets_character_{module_name}', filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {name: value for name, value in vars(module).items()
+            if not name.startswith('__')}
+
+
+def character_cache_dir():
+    """Where parsed character files are cached."""
+    return os.path.join(cache_dir(), 'characters')
+
+
+def _package_version():
+    from .catalog import package_version
+    return package_version()
+
+
+def _cache_file(key):
+    return os.path.join(character_cache_dir(), key[:2], key[2:])
+
+
+def _read_cache(key):
+    try:
+        with open(_cache_file(key), mode='rb') as fp:
+            return marshal.load(fp)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_cache(key, value):
+    try:
+        write_atomic(_cache_file(key), marshal.dumps(value))
+    except (OSError, ValueError):
+        # Caching is optional, and some values can't be stored
+        pass
+
+
+def _cache_prefix():
+    # The marshal format depends on the python version
+    return (f'{_package_version()}\0{PARSER_FORMAT}\0'
+            f'{sys.implementation.cache_tag}\0').encode('utf-8')
+
+
+def _stat_key(filename):
+    """Cache key for a file that has not been modified."""
+    stat = os.stat(filename)
+    text = f'{os.path.abspath(filename)}\0{stat.st_mtime_ns}\0{stat.st_size}'
+    return 'stat-' + hashlib.sha256(_cache_prefix() + text.encode('utf-8')).hexdigest()
+
+
+def _parse_cached(filename):
+    """Parse a character file, using the cache where possible.
+
+    The cache maps the hash of the file's contents (and the
+    dungeonsheets version) to the result: either the parsed values,
+    or a note that the file is invalid or needs to be imported. A
+    second entry, keyed on the file's path, size and modification
+    time, remembers the content hash, so unchanged files are not even
+    read.
+
+    Returns
+    -------
+    status : str
+      "valid", "invalid" or "unsafe".
+    result
+      The parsed values if "valid", otherwise the error message.
+
+    """
+    stat_key = _stat_key(filename)
+    content_key = _read_cache(stat_key)
+    entry = _read_cache(content_key) if isinstance(content_key, str) else None
+    if entry is None:
+        with open(filename, mode='rb') as fp:
+            source = fp.read()
+        content_key = hashlib.sha256(_cache_prefix() + source).hexdigest()
+        entry = _read_cache(content_key)
+        if entry is None:
+            try:
+                entry = ('valid', parse_character_source(source.decode('utf-8'),
+                                                         filename=filename))
+            except UnsafeCharacterFileError as e:
+                entry = ('unsafe', str(e))
+            except (CharacterFileFormatError, UnicodeDecodeError) as e:
+                entry = ('invalid', str(e))
+            _write_cache(content_key, entry)
+        _write_cache(stat_key, content_key)
+    return entry
+
+
+def load_character_file(filename, strict=False, use_cache=True):
+    """Read the variables defined in a character file.
+
+    Parameters
+    ----------
+    filename : str
+      Path to the character file (``.py``).
+    strict : bool, optional
+      If true, files that contain code are rejected. Otherwise, they
+      are run as a python module, as long as they contain a
+      ``dungeonsheets_version`` entry.
+    use_cache : bool, optional
+      If true, re-use the result from an earlier call with the same
+      file contents (see ``character_cache_dir()``). Files that are
+      imported are never cached, since their result may change.
+
+    Returns
+    -------
+    char_props : dict
+      The value of each variable, except those starting with "__".
+
+    """
+    if os.path.splitext(filename)[1] != '.py':
+        raise ValueError(f"Character definition {filename} is not a python file.")
+    if use_cache:
+        status, result = _parse_cached(filename)
+        if status == 'valid':
+            return result
+        elif status == 'invalid':
+            raise CharacterFileFormatError(result)
+        elif strict:
+            raise UnsafeCharacterFileError(result)
+        return exec_character_file(filename)
+    with open(filename, mode='r', encoding='utf-8') as fp:
+        source = fp.read()
+    try:
+        return parse_character_source(source, filename=filename)
+    except UnsafeCharacterFileError:
+        if strict:
+            raise
+        return exec_character_file(filename)
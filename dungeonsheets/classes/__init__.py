@@ -1,20 +1,43 @@
+"""Character classes (eg. Fighter, Wizard).
+
+Each class's module is only imported when the class is first
+requested (eg. ``classes.Wizard``), so that a character only pays for
+the classes, and their features, that it actually uses.
+
+"""
+
+from .classes import CharClass
+from ..module_index import import_lazy_name
+
 __all__ = ('CharClass', 'Barbarian', 'Bard', 'Cleric', 'Druid', 'Fighter',
            'Monk', 'Paladin', 'Ranger', 'Rogue', 'Sorceror', 'Warlock',
            'Wizard', 'RevisedRanger', 'available_classes')
 
-from .classes import CharClass
-from .barbarian import Barbarian
-from .bard import Bard
-from .cleric import Cleric
-from .druid import Druid
-from .fighter import Fighter
-from .monk import Monk
-from .paladin import Paladin
-from .ranger import (Ranger, RevisedRanger)
-from .rogue import Rogue
-from .sorceror import Sorceror
-from .warlock import Warlock
-from .wizard import Wizard
-
-available_classes = [Barbarian, Bard, Cleric, Druid, Fighter, Monk, Paladin,
-                     Ranger, Rogue, Sorceror, Warlock, Wizard, RevisedRanger]
+_class_modules = {
+    'Barbarian': 'barbarian',
+    'Bard': 'bard',
+    'Cleric': 'cleric',
+    'Druid': 'druid',
+    'Fighter': 'fighter',
+    'Monk': 'monk',
+    'Paladin': 'paladin',
+    'Ranger': 'ranger',
+    'RevisedRanger': 'ranger',
+    'Rogue': 'rogue',
+    'Sorceror': 'sorceror',
+    'Warlock': 'warlock',
+    'Wizard': 'wizard',
+}
+
+
+def __getattr__(name):
+    if name == 'available_classes':
+        return [import_lazy_name(globals(), _class_modules, cls)
+                for cls in ('Barbarian', 'Bard', 'Cleric', 'Druid', 'Fighter',
+                            'Monk', 'Paladin', 'Ranger', 'Rogue', 'Sorceror',
+                            'Warlock', 'Wizard', 'RevisedRanger')]
+    return import_lazy_name(globals(), _class_modules, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 from collections import defaultdict
-from ..features import Feature, FeatureSelector
+from ..features import FeaturesByLevel
+from ..spells import canonical_spell
 
 
 class CharClass():
@@ -33,25 +34,22 @@ class CharClass():
         self.owner = owner
         # For ex: add "char.Monk" attribute
         setattr(self.owner, self.name, self)
-        # Instantiate the features
-        self.features_by_level = defaultdict(list)
+        # Features are instantiated as each level is reached
         cls = type(self)
-        for i in range(1, 21):
-            fs = []
-            for f in cls.features_by_level[i]:
-                if issubclass(f, FeatureSelector):
-                    fs.append(f(owner=self.owner,
-                                feature_choices=feature_choices))
-                elif issubclass(f, Feature):
-                    fs.append(f(owner=self.owner))
-            self.features_by_level[i] = fs
+        self.features_by_level = FeaturesByLevel(
+            owner=self.owner, sources=[cls.features_by_level],
+            feature_choices=feature_choices)
         for k, v in params.items():
             setattr(self, k, v)
-        self.spells_known = [S() for S in cls.spells_known]
-        self.spells_prepared = [S() for S in cls.spells_prepared]
+        self.spells_known = [canonical_spell(S) for S in cls.spells_known]
+        self.spells_prepared = [canonical_spell(S)
+                                for S in cls.spells_prepared]
 
         # Apply subclass
-        self.subclass = self.select_subclass(subclass)
+        if isinstance(subclass, type) and issubclass(subclass, SubClass):
+            self.subclass = subclass(owner=self.owner)
+        else:
+            self.subclass = self.select_subclass(subclass)
         if isinstance(self.subclass, SubClass):
             self.apply_subclass(feature_choices=feature_choices)
 
@@ -73,15 +71,8 @@ class CharClass():
         if not isinstance(self.subclass, SubClass):
             return
         subcls = self.subclass
-        for i in range(1, 21):
-            fs = []
-            for f in subcls.features_by_level[i]:
-                if issubclass(f, FeatureSelector):
-                    fs.append(f(owner=self.owner,
-                                feature_choices=feature_choices))
-                elif issubclass(f, Feature):
-                    fs.append(f(owner=self.owner))
-            self.features_by_level[i].extend(fs)
+        self.features_by_level.feature_choices = feature_choices
+        self.features_by_level.add_source(subcls.features_by_level)
         for attr in ('weapon_proficiencies', '_proficiencies_text'):
             new_list = tuple(getattr(self, attr, ())) + tuple(getattr(self.subclass, attr, ()))
             setattr(self, attr, new_list)
@@ -92,8 +83,10 @@ class CharClass():
                                      subcls.spellcasting_ability)
         self.spell_slots_by_level = (self.spell_slots_by_level or
                                      subcls.spell_slots_by_level)
-        self.spells_known.extend([S() for S in subcls.spells_known])
-        self.spells_prepared.extend([S() for S in subcls.spells_prepared])
+        self.spells_known.extend([canonical_spell(S)
+                                  for S in subcls.spells_known])
+        self.spells_prepared.extend([canonical_spell(S)
+                                     for S in subcls.spells_prepared])
     
     @property
     def features(self):
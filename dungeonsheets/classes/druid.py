@@ -205,28 +205,28 @@ class Druid(CharClass):
                 try:
                     NewMonster = findattr(monsters, shape)
                     new_shape = NewMonster()
-                except AttributeError:
-                    msg = f'Wild shape "{shape}" not found. Please add it to ``monsters.py``'
+                except AttributeError as e:
+                    msg = (f'Wild shape "{shape}" not found. '
+                           f'Please add it to ``monsters.py``.'
+                           + getattr(e, 'hint', ''))
                     raise exceptions.MonsterError(msg)
             actual_shapes.append(new_shape)
         # Save the updated list for later
         self._wild_shapes = actual_shapes
         
-    def can_assume_shape(self, shape: monsters.Monster)-> bool:
-        """Determine if a given shape meets the requirements for transforming.
+    def wild_shape_limits(self):
+        """The limits on which beasts this Druid can wild shape into.
         
         See Pg 66 of player's handbook.
         
-        Parameters
-        ==========
-        shape
-          A monster that the Druid wishes to transform into.
-        
         Returns
         =======
-        can_assume
-          True if the monster meets the C/R, swim and flying speed
-          restrictions.
+        max_cr
+          Highest challenge rating allowed.
+        max_swim
+          Fastest swimming speed allowed, or None if there is no limit.
+        max_fly
+          Fastest flying speed allowed, or None if there is no limit.
         
         """
         # Determine acceptable states based on druid level
@@ -252,6 +252,26 @@ class Druid(CharClass):
                 max_cr = 1
             elif self.level >= 6:
                 max_cr = math.floor(self.level / 3)
+        return max_cr, max_swim, max_fly
+    
+    def can_assume_shape(self, shape: monsters.Monster)-> bool:
+        """Determine if a given shape meets the requirements for transforming.
+        
+        See Pg 66 of player's handbook.
+        
+        Parameters
+        ==========
+        shape
+          A monster that the Druid wishes to transform into.
+        
+        Returns
+        =======
+        can_assume
+          True if the monster meets the C/R, swim and flying speed
+          restrictions.
+        
+        """
+        max_cr, max_swim, max_fly = self.wild_shape_limits()
         # Check if the beast shape can be assumed
         valid_cr = (max_cr is None or shape.challenge_rating <= max_cr)
         valid_swim = (max_swim is None or shape.swim_speed <= max_swim)
@@ -259,6 +279,22 @@ class Druid(CharClass):
         can_assume = shape.is_beast and valid_cr and valid_swim and valid_fly
         return can_assume
     
+    def eligible_shapes(self):
+        """Every beast in ``monsters.py`` that this Druid can assume
+        with wild shape, regardless of which ones they have chosen.
+        
+        Returns
+        =======
+        shapes
+          List of monsters, sorted by challenge rating.
+        
+        """
+        max_cr, max_swim, max_fly = self.wild_shape_limits()
+        shapes = monsters.monster_index().find(
+            max_cr=max_cr, creature_type='beast', max_swim=max_swim,
+            max_fly=max_fly)
+        return [Shape() for Shape in shapes]
+    
     @property
     def spells(self):
         return tuple(S() for S in self.spells_prepared)
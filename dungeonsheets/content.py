@@ -0,0 +1,391 @@
+"""Load spells and features from data files.
+
+Rather than writing a Python class for every spell or feature, new
+content can be described in JSON or TOML files and loaded at runtime::
+
+    {
+      "spells": {
+        "Frost Fingers": {
+          "level": 1,
+          "casting_time": "1 action",
+          "components": "V, S",
+          "duration": "Instantaneous",
+          "school": "Evocation",
+          "classes": ["Wizard"],
+          "description": "Freezing cold blasts from your fingertips..."
+        }
+      },
+      "features": {
+        "Frost Touch": {"source": "Wizard", "description": "..."}
+      }
+    }
+
+Sections may also be lists of entries, each with a "name". Files with
+the ``.jsonl`` extension hold one entry per line, with a "type" of
+either "spell" or "feature", and are read one line at a time. A
+``.json`` file whose top level is not divided into sections is read as
+a mapping of spell names to spells.
+
+Loaded content is validated and then added to ``dungeonsheets.spells``
+and ``dungeonsheets.features``, where character files can find it like
+any built-in spell or feature. To check a data file, run::
+
+    $ python -m dungeonsheets.content my_spells.json
+
+"""
+
+import json
+import os
+import re
+import sys
+
+from . import spells as _spells, features as _features
+from .exceptions import ContentError
+from .stats import findattr, normalize_name
+
+
+def _parse_int(value):
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f'expected an integer, not {value!r}')
+    return value
+
+
+def _parse_str(value):
+    if not isinstance(value, str):
+        raise ValueError(f'expected a string, not {value!r}')
+    return value
+
+
+def _parse_bool(value):
+    if not isinstance(value, bool):
+        raise ValueError(f'expected true or false, not {value!r}')
+    return value
+
+
+def _parse_names(value):
+    """A list of names, or one comma-separated string of them."""
+    if isinstance(value, str):
+        value = value.split(',')
+    if not isinstance(value, (list, tuple)) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f'expected a list of names, not {value!r}')
+    return tuple(v.strip() for v in value if v.strip())
+
+
+def _parse_level(value):
+    level = _parse_int(value)
+    if not 0 <= level <= 9:
+        raise ValueError(f'spell level must be 0 to 9, not {level}')
+    return level
+
+
+_components_re = re.compile(r'\s*([VSM](?:\s*,\s*[VSM])*)\s*(?:\((.*)\))?\s*$',
+                            flags=re.DOTALL)
+
+
+def parse_components(value):
+    """Split a components string (eg. "V, S, M (a bit of fleece)") into
+    the components and the materials.
+
+    Returns
+    -------
+    components : tuple
+      Some of "V", "S", and "M".
+    materials : str
+      The material components, or "" if there are none.
+
+    """
+    if isinstance(value, (list, tuple)):
+        components, materials = tuple(value), ''
+    else:
+        match = _components_re.match(_parse_str(value))
+        if match is None:
+            raise ValueError(f'cannot read components {value!r}')
+        components = tuple(c.strip() for c in match.group(1).split(','))
+        materials = (match.group(2) or '').strip()
+    if not set(components) <= {'V', 'S', 'M'}:
+        raise ValueError(f'unknown components in {value!r}')
+    return components, materials
+
+
+# Field name -> (class attribute, parser)
+SPELL_FIELDS = {
+    'level': ('level', _parse_level),
+    'casting_time': ('casting_time', _parse_str),
+    'casting_range': ('casting_range', _parse_str),
+    'range': ('casting_range', _parse_str),
+    'components': ('components', parse_components),
+    'materials': ('materials', _parse_str),
+    'duration': ('duration', _parse_str),
+    'ritual': ('ritual', _parse_bool),
+    'concentration': ('_concentration', _parse_bool),
+    'magic_school': ('magic_school', _parse_str),
+    'school': ('magic_school', _parse_str),
+    'classes': ('classes', _parse_names),
+    'description': ('__doc__', _parse_str),
+}
+
+FEATURE_FIELDS = {
+    'source': ('source', _parse_str),
+    'needs_implementation': ('needs_implementation', _parse_bool),
+    'spells_known': ('spells_known', _parse_names),
+    'spells_prepared': ('spells_prepared', _parse_names),
+    'description': ('__doc__', _parse_str),
+}
+
+
+def class_name(name):
+    """A python class name for a spell or feature name, eg. "Tenser's
+    Floating Disk" -> "TensersFloatingDisk"."""
+    words = re.findall('[a-zA-Z0-9]+', name.replace("'", '').replace('’', ''))
+    result = ''.join(w[0].upper() + w[1:] for w in words)
+    if not result or result[0].isdigit():
+        result = '_' + result
+    return result
+
+
+def _attributes(kind, name, entry, fields):
+    """Validate the fields of ``entry``, and convert them to class
+    attributes."""
+    if not isinstance(name, str) or not name.strip():
+        raise ContentError(f'{kind} has no name: {entry!r}')
+    if not isinstance(entry, dict):
+        raise ContentError(f'{kind} "{name}" should be a table of fields, '
+                           f'not {entry!r}')
+    attrs = {'name': name.strip()}
+    unknown = sorted(set(entry) - set(fields) - {'name', 'type'})
+    if unknown:
+        raise ContentError(f'{kind} "{name}" has unknown fields {unknown}. '
+                           f'Valid fields are {sorted(fields)}.')
+    for field, value in entry.items():
+        if field in ('name', 'type'):
+            continue
+        attr, parse = fields[field]
+        try:
+            value = parse(value)
+        except ValueError as e:
+            raise ContentError(f'{kind} "{name}", field "{field}": {e}') from None
+        if field == 'components':
+            value, materials = value
+            if materials:
+                attrs.setdefault('materials', materials)
+        attrs[attr] = value
+    return attrs
+
+
+def make_spell(name, entry):
+    """Create a ``Spell`` subclass from a data file entry.
+
+    Parameters
+    ----------
+    name : str
+      The spell's name.
+    entry : dict
+      The spell's fields (see ``SPELL_FIELDS``).
+
+    """
+    attrs = _attributes('Spell', name, entry, SPELL_FIELDS)
+    if 'level' not in attrs:
+        raise ContentError(f'Spell "{name}" has no level.')
+    return type(class_name(name), (_spells.Spell,), attrs)
+
+
+def make_feature(name, entry, new_spells=None):
+    """Create a ``Feature`` subclass from a data file entry.
+
+    Parameters
+    ----------
+    name : str
+      The feature's name.
+    entry : dict
+      The feature's fields (see ``FEATURE_FIELDS``).
+    new_spells : dict, optional
+      Spells that are not registered yet, by normalized name. Spells
+      granted by the feature are looked up here first.
+
+    """
+    attrs = _attributes('Feature', name, entry, FEATURE_FIELDS)
+    new_spells = new_spells or {}
+    for attr in ('spells_known', 'spells_prepared'):
+        spell_list = []
+        for spell_name in attrs.get(attr, ()):
+            spell = new_spells.get(normalize_name(spell_name))
+            if spell is None:
+                try:
+                    spell = findattr(_spells, spell_name)
+                except AttributeError as e:
+                    raise ContentError(f'Feature "{name}": {e}') from None
+            spell_list.append(spell)
+        if attr in attrs:
+            attrs[attr] = tuple(spell_list)
+    return type(class_name(name), (_features.Feature,), attrs)
+
+
+def _section_entries(section, kind):
+    """(name, entry) pairs for a section of a data file, which may be
+    either a mapping of names to entries, or a list of entries."""
+    if isinstance(section, dict):
+        yield from section.items()
+    elif isinstance(section, list):
+        for entry in section:
+            yield (entry.get('name') if isinstance(entry, dict) else None), entry
+    else:
+        raise ContentError(f'"{kind}" should be a table or list of entries.')
+
+
+def _read_toml(filename):
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ContentError(f'Reading {filename} requires python 3.11+ or '
+                               'the "tomli" package.') from None
+    with open(filename, mode='rb') as fp:
+        try:
+            return tomllib.load(fp)
+        except tomllib.TOMLDecodeError as e:
+            raise ContentError(f'{filename}: {e}') from None
+
+
+def read_entries(filename):
+    """Read the entries in a content data file.
+
+    ``.jsonl`` files are read one line at a time, so they don't need
+    to fit in memory all at once.
+
+    Yields
+    ------
+    kind : str
+      Either "spell" or "feature".
+    name : str
+      The name of the spell or feature.
+    entry : dict
+      The fields of the spell or feature.
+
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.jsonl':
+        with open(filename, encoding='utf-8') as fp:
+            for line_num, line in enumerate(fp, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError as e:
+                    raise ContentError(f'{filename}, line {line_num}: {e}') from None
+                kind = entry.get('type') if isinstance(entry, dict) else None
+                if kind not in ('spell', 'feature'):
+                    raise ContentError(f'{filename}, line {line_num}: "type" '
+                                       'should be "spell" or "feature".')
+                yield kind, entry.get('name'), entry
+        return
+    if extension == '.toml':
+        data = _read_toml(filename)
+    elif extension == '.json':
+        with open(filename, encoding='utf-8') as fp:
+            try:
+                data = json.load(fp)
+            except ValueError as e:
+                raise ContentError(f'{filename}: {e}') from None
+    else:
+        raise ContentError(f'Unknown content file type: {filename}')
+    if not isinstance(data, dict):
+        raise ContentError(f'{filename} should contain a table of entries.')
+    if not set(data) & {'spells', 'features'}:
+        # Older files are a flat mapping of spell names to spells
+        data = {'spells': data}
+    for section, kind in (('spells', 'spell'), ('features', 'feature')):
+        for name, entry in _section_entries(data.get(section, {}), section):
+            yield kind, name, entry
+
+
+def _register(package, classes):
+    namespace = vars(package)
+    namespace.update({cls.__name__: cls for cls in classes})
+    package.__all__ = tuple(package.__all__) + tuple(
+        cls.__name__ for cls in classes if cls.__name__ not in package.__all__)
+
+
+def register_spells(spell_classes):
+    """Make spells available as ``dungeonsheets.spells.<ClassName>``.
+
+    A spell with the same class name as an existing spell replaces it.
+
+    """
+    _register(_spells, spell_classes)
+
+
+def register_features(feature_classes):
+    """Make features available as ``dungeonsheets.features.<ClassName>``
+    and through ``features.features_by_source()``.
+
+    A feature with the same class name as an existing feature replaces
+    it.
+
+    """
+    _register(_features, feature_classes)
+    sources = _features.registered_sources
+    for cls in feature_classes:
+        if cls.source:
+            names = sources.get(cls.source, ())
+            if cls.__name__ not in names:
+                sources[cls.source] = names + (cls.__name__,)
+
+
+def load_content(*filenames, register=True):
+    """Load spells and features from data files.
+
+    All files are read and validated before anything is registered,
+    so an invalid file leaves the existing content unchanged.
+
+    Parameters
+    ----------
+    filenames
+      Paths to ``.json``, ``.jsonl`` or ``.toml`` data files.
+    register : optional
+      If false, the new classes are returned but not added to
+      ``dungeonsheets.spells`` and ``dungeonsheets.features``.
+
+    Returns
+    -------
+    content : dict
+      "spells" and "features", each a list of the new classes.
+
+    Raises
+    ------
+    ContentError
+      A file cannot be read, or one of its entries is not valid.
+
+    """
+    spell_entries, feature_entries = [], []
+    for filename in filenames:
+        for kind, name, entry in read_entries(filename):
+            if kind == 'spell':
+                spell_entries.append((name, entry))
+            else:
+                feature_entries.append((name, entry))
+    new_spells = [make_spell(name, entry) for name, entry in spell_entries]
+    by_name = {normalize_name(s.name): s for s in new_spells}
+    new_features = [make_feature(name, entry, new_spells=by_name)
+                    for name, entry in feature_entries]
+    if register:
+        register_spells(new_spells)
+        register_features(new_features)
+    return {'spells': new_spells, 'features': new_features}
+
+
+def main(argv=None):
+    filenames = sys.argv[1:] if argv is None else argv
+    try:
+        content = load_content(*filenames, register=False)
+    except ContentError as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    print(f'{len(content["spells"])} spells and {len(content["features"])} '
+          f'features are valid.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,3 +12,20 @@ class LatexNotFoundError(LatexError):
 
 class MonsterError(AttributeError):
     """Error retriving or using a D&D Monster."""
+
+class UnknownNameError(AttributeError):
+    """No spell, weapon, etc. has the given name.
+
+    ``hint`` suggests similar names (see ``stats.did_you_mean()``), or
+    is empty if none were found.
+
+    """
+    def __init__(self, message, hint=''):
+        super().__init__(message + hint)
+        self.hint = hint
+
+class ContentError(ValueError):
+    """A spell, feature, etc. in a content data file is not valid."""
+
+class UnsafeCharacterFileError(CharacterFileFormatError):
+    """The character file contains code, not just values."""
@@ -0,0 +1,187 @@
+"""Which features are granted by each class, subclass, race and
+background, and at which level.
+
+Character classes list their features in ``features_by_level``, but
+these are only turned into features when a class is instantiated for
+a character. The registry reads the same tables without creating
+any characters, so questions like "what does a 6th level Circle of the
+Moon druid gain?" can be answered directly::
+
+    >>> from dungeonsheets.feature_registry import feature_registry
+    >>> registry = feature_registry()
+    >>> registry.features_at('Druid', 6, subclass='Circle of the Moon')
+    [<class 'dungeonsheets.features.druid.PrimalStrike'>]
+
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+from .catalog import _category_classes
+from .stats import normalize_name
+
+
+# ``kind`` is one of "class", "subclass", "race", "background" or
+# "option". Options are the choices offered by a ``FeatureSelector``,
+# which is given as ``selector``.
+FeatureGrant = namedtuple('FeatureGrant',
+                          ('feature', 'kind', 'owner', 'level', 'selector'))
+
+
+def _level_grants(kind, owner, features_by_level):
+    for level, features in sorted(features_by_level.items()):
+        for feature in features:
+            yield FeatureGrant(feature, kind, owner, level, None)
+
+
+def collect_grants():
+    """Read the features granted by all the classes, subclasses, races
+    and backgrounds.
+
+    Returns
+    -------
+    grants : list
+      ``FeatureGrant`` tuples.
+
+    """
+    from . import classes, features
+    grants = []
+    for char_class in classes.available_classes:
+        grants.extend(_level_grants('class', char_class,
+                                    char_class.features_by_level))
+        for subclass in char_class.subclasses_available:
+            grants.extend(_level_grants('subclass', subclass,
+                                        subclass.features_by_level))
+    for _, race in _category_classes('dungeonsheets.race', 'Race'):
+        grants.extend(FeatureGrant(f, 'race', race, 1, None) for f in race.features)
+        grants.extend(_level_grants('race', race, race.features_by_level))
+    for _, background in _category_classes('dungeonsheets.background',
+                                           'Background'):
+        grants.extend(FeatureGrant(f, 'background', background, 1, None)
+                      for f in background.features)
+    # The choices offered by feature selectors
+    for grant in list(grants):
+        if issubclass(grant.feature, features.FeatureSelector):
+            grants.extend(FeatureGrant(option, 'option', grant.owner,
+                                       grant.level, grant.feature)
+                          for option in grant.feature.options.values())
+    # Subclasses shared by several classes are only listed once
+    return list(dict.fromkeys(grants))
+
+
+class FeatureRegistry():
+    """An index of ``FeatureGrant`` tuples by owner, level and feature.
+
+    Owners (classes, subclasses, races and backgrounds) can be given
+    either as the class itself, or by name (eg. "Druid", "Circle of
+    the Moon", "MoonCircle").
+
+    Parameters
+    ----------
+    grants
+      ``FeatureGrant`` tuples, eg. from ``collect_grants()``.
+
+    """
+    def __init__(self, grants):
+        self.grants = tuple(grants)
+        self._by_owner = {}
+        self._by_feature = {}
+        self._owners = {}
+        for grant in self.grants:
+            levels = self._by_owner.setdefault(grant.owner, {})
+            levels.setdefault(grant.level, []).append(grant)
+            self._by_feature.setdefault(grant.feature, []).append(grant)
+            for name in (grant.owner.__name__, getattr(grant.owner, 'name', '')):
+                if isinstance(name, str) and name:
+                    self._owners.setdefault(normalize_name(name), grant.owner)
+
+    def __len__(self):
+        return len(self.grants)
+
+    def __repr__(self):
+        return f'<FeatureRegistry: {len(self)} grants>'
+
+    def owner(self, owner):
+        """Resolve a class, subclass, race or background from its
+        name."""
+        if isinstance(owner, type):
+            return owner
+        try:
+            return self._owners[normalize_name(owner)]
+        except KeyError:
+            raise KeyError(f'No class, subclass, race or background named '
+                           f'"{owner}"') from None
+
+    def _owners_for(self, owner, subclass):
+        owners = [self.owner(owner)]
+        if subclass is not None:
+            owners.append(self.owner(subclass))
+        return owners
+
+    def grants_at(self, owner, level, subclass=None, options=False):
+        """The ``FeatureGrant`` tuples for exactly ``level``.
+
+        Parameters
+        ----------
+        owner
+          A class, race or background, or its name.
+        level : int
+          The level gained.
+        subclass : optional
+          Also include features from this subclass.
+        options : optional
+          If true, include the choices offered by any feature
+          selectors.
+
+        """
+        grants = []
+        for resolved in self._owners_for(owner, subclass):
+            grants.extend(g for g in self._by_owner.get(resolved, {}).get(level, ())
+                          if options or g.kind != 'option')
+        return grants
+
+    def features_at(self, owner, level, subclass=None):
+        """The features gained at exactly ``level``, class features
+        first, then subclass features."""
+        return [g.feature for g in self.grants_at(owner, level, subclass)]
+
+    def features_up_to(self, owner, level, subclass=None):
+        """All the features gained from level 1 up to ``level``."""
+        features = []
+        for lvl in range(1, level + 1):
+            features.extend(self.features_at(owner, lvl, subclass))
+        return features
+
+    def progression(self, owner, subclass=None, max_level=20):
+        """The features gained at each level, eg. for a progression
+        table.
+
+        Returns
+        -------
+        progression : dict
+          Maps each level from 1 to ``max_level`` to a list of features.
+
+        """
+        return {level: self.features_at(owner, level, subclass)
+                for level in range(1, max_level + 1)}
+
+    def sources_of(self, feature):
+        """Every ``FeatureGrant`` that gives ``feature``."""
+        return list(self._by_feature.get(feature, ()))
+
+    def options(self, selector):
+        """The features that can be chosen with a ``FeatureSelector``."""
+        return list(dict.fromkeys(
+            g.feature for g in self.grants
+            if g.kind == 'option' and g.selector is selector))
+
+
+@lru_cache(maxsize=None)
+def feature_registry():
+    """The ``FeatureRegistry`` for all the built-in game content.
+
+    Built on first use, which imports every class, race and
+    background.
+
+    """
+    return FeatureRegistry(collect_grants())
@@ -1,17 +1,74 @@
-from .features import Feature, create_feature
-
-from .barbarian import *
-from .bard import *
-from .cleric import *
-from .druid import *
-from .fighter import *
-from .monk import *
-from .paladin import *
-from .ranger import *
-from .rogue import *
-from .sorceror import *
-from .warlock import *
-from .wizard import *
-from .races import *
-from .backgrounds import *
-from .feats import *
+"""Features granted by classes, races, backgrounds and feats.
+
+The features are split across several modules (``monk``,
+``races``, etc.), which are only imported when one of their features
+is first requested (eg. ``features.MartialArts``).
+``feature_index.py`` records which module defines each feature, and
+which features come from each source; re-generate it with ``python -m
+dungeonsheets.module_index`` after adding new features.
+
+"""
+
+import sys
+
+from .features import Feature, FeatureSelector, FeaturesByLevel, create_feature
+from .feature_index import FEATURE_MODULES, FEATURE_SOURCES
+from ..module_index import import_lazy_name
+
+__all__ = ('Feature', 'FeatureSelector', 'FeaturesByLevel',
+           'create_feature', 'features_by_source',
+           'loaded_feature') + tuple(FEATURE_MODULES)
+
+
+# Source -> names of features registered at runtime (see
+# ``dungeonsheets.content``)
+registered_sources = {}
+
+
+def __getattr__(name):
+    return import_lazy_name(globals(), FEATURE_MODULES, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(FEATURE_MODULES))
+
+
+def features_by_source(source):
+    """All the features with the given ``source``.
+    
+    Parameters
+    ----------
+    source : str
+      Where the features come from, eg. ``"Monk"`` or ``"Monk (Way
+      of the Four Elements)"``.
+    
+    Returns
+    -------
+    features : list
+      The ``Feature`` subclasses with this source.
+    
+    """
+    names = FEATURE_SOURCES.get(source, ()) + registered_sources.get(source, ())
+    return [getattr(sys.modules[__name__], name)
+            for name in dict.fromkeys(names)]
+
+
+def loaded_feature(name):
+    """The feature called ``name``, only if its module is already imported.
+    
+    No character can have a feature whose module has never been
+    imported, so this lets callers check for a feature without the
+    cost of importing it.
+    
+    Returns
+    -------
+    feature
+      The ``Feature`` subclass, or None if it has not been imported.
+    
+    """
+    if name in globals():
+        # Already requested, or registered from a data file
+        return globals()[name]
+    module_name = FEATURE_MODULES.get(name)
+    module = sys.modules.get(f'{__name__}.{module_name}')
+    return getattr(module, name, None)
@@ -0,0 +1,1710 @@
+# This file is generated by "python -m dungeonsheets.module_index".
+# Do not edit it directly.
+
+FEATURE_MODULES = {
+    'AbjurationSavant': 'wizard',
+    'AccursedSpecter': 'warlock',
+    'AcidResistance': 'races',
+    'AcolyteOfNature': 'cleric',
+    'ActionSurge': 'fighter',
+    'Actor': 'feats',
+    'AdditionalFightingStyle': 'fighter',
+    'AdditionalMagicalSecrets': 'bard',
+    'AdeptMarksman': 'fighter',
+    'AgonizingBlast': 'warlock',
+    'AllEyesOnYou': 'backgrounds',
+    'AlterMemories': 'wizard',
+    'AmbushMaster': 'rogue',
+    'AmongTheDead': 'warlock',
+    'Amphibious': 'races',
+    'AncestralProtectors': 'barbarian',
+    'AnimalCompanion': 'ranger',
+    'ArcaneAbjuration': 'cleric',
+    'ArcaneArcherLore': 'fighter',
+    'ArcaneCharge': 'fighter',
+    'ArcaneDeflection': 'wizard',
+    'ArcaneInitiate': 'cleric',
+    'ArcaneMastery': 'cleric',
+    'ArcaneRecovery': 'wizard',
+    'ArcaneShot': 'fighter',
+    'ArcaneWard': 'wizard',
+    'Archdruid': 'druid',
+    'Archery': 'ranger',
+    'ArcticSpells': 'druid',
+    'ArmorOfHexes': 'warlock',
+    'ArmorOfShadows': 'warlock',
+    'ArtificersLore': 'races',
+    'ArtisansBlessing': 'cleric',
+    'AscendantStep': 'warlock',
+    'AspectOfTheMoon': 'warlock',
+    'Assassinate': 'rogue',
+    'AuraOfCourage': 'paladin',
+    'AuraOfDevotion': 'paladin',
+    'AuraOfProtection': 'paladin',
+    'AuraOfTheGuardian': 'paladin',
+    'AvatarOfBattle': 'cleric',
+    'AwakenedMind': 'warlock',
+    'BalmOfTheSummerCourt': 'druid',
+    'BanishingArrow': 'fighter',
+    'BardBattleMagic': 'bard',
+    'BardExpertise': 'bard',
+    'BardExtraAttack': 'bard',
+    'BardFightingStyle': 'bard',
+    'BardicInspiration': 'bard',
+    'BattleragerArmor': 'barbarian',
+    'BattleragerCharge': 'barbarian',
+    'BearAspect': 'barbarian',
+    'BearAttunement': 'barbarian',
+    'BearSpirit': 'barbarian',
+    'BeastAspect': 'barbarian',
+    'BeastSpeech': 'warlock',
+    'BeastSpells': 'druid',
+    'BeastsDefense': 'ranger',
+    'BeguilingArrow': 'fighter',
+    'BeguilingDefenses': 'warlock',
+    'BeguilingInfluence': 'warlock',
+    'BendLuck': 'sorceror',
+    'BenignTransposition': 'wizard',
+    'BestialFury': 'ranger',
+    'BewitchingWhispers': 'warlock',
+    'BladeFlourish': 'bard',
+    'Bladesong': 'wizard',
+    'BlessedHealer': 'cleric',
+    'BlessingOfTheForge': 'cleric',
+    'BlessingOfTheTrickster': 'cleric',
+    'BlessingsOfKnowledge': 'cleric',
+    'BlindSense': 'rogue',
+    'BonusCantrip': 'druid',
+    'BonusProficiencyCavalier': 'fighter',
+    'BonusProficiencySamurai': 'fighter',
+    'BookOfAncientSecrets': 'warlock',
+    'BornToTheSaddle': 'fighter',
+    'Brave': 'races',
+    'BreathOfWinter': 'monk',
+    'BreathWeapon': 'races',
+    'BrutalCritical': 'barbarian',
+    'BullyingShot': 'fighter',
+    'Bulwark': 'fighter',
+    'BurstingArrow': 'fighter',
+    'ByPopularDemand': 'backgrounds',
+    'CallToTheWave': 'races',
+    'CarefulSpell': 'sorceror',
+    'CelestialResilience': 'warlock',
+    'CelestialResistance': 'races',
+    'ChainsOfCarceri': 'warlock',
+    'ChannelDivinity': 'cleric',
+    'ChannelDivinityPaladin': 'paladin',
+    'CharmAnimalsAndPlants': 'cleric',
+    'CircleForms': 'druid',
+    'CircleOfMortality': 'cleric',
+    'CircleSpells': 'druid',
+    'CitySecrets': 'backgrounds',
+    'CleansingTouch': 'paladin',
+    'ClenchOfTheNorthWind': 'monk',
+    'CloakOfFlies': 'warlock',
+    'CloakOfShadows': 'monk',
+    'CoastSpells': 'druid',
+    'ColossusSlayer': 'ranger',
+    'CombatInspiration': 'bard',
+    'CombatSuperiority': 'fighter',
+    'CombatWildShape': 'druid',
+    'CommandUndead': 'wizard',
+    'CommandersStrike': 'fighter',
+    'CompanionsBond': 'ranger',
+    'ConjurationSavant': 'wizard',
+    'ConsultTheSpirits': 'barbarian',
+    'ControlAirAndWater': 'races',
+    'ControlledChaos': 'sorceror',
+    'CoordinatedAttack': 'ranger',
+    'CoronaOfLight': 'cleric',
+    'Countercharm': 'bard',
+    'CourtFunctionary': 'backgrounds',
+    'CreateThrall': 'warlock',
+    'CriminalContact': 'backgrounds',
+    'CunningAction': 'rogue',
+    'CunningArtisan': 'races',
+    'CurvingShot': 'fighter',
+    'CuttingWords': 'bard',
+    'DampenElements': 'cleric',
+    'DangerSense': 'barbarian',
+    'DarkDelirium': 'warlock',
+    'DarkOnesBlessing': 'warlock',
+    'DarkOnesOwnLuck': 'warlock',
+    'Darkvision': 'races',
+    'DazingShot': 'fighter',
+    'DeadeyeShot': 'fighter',
+    'DeathStrike': 'rogue',
+    'Defense': 'ranger',
+    'DefensiveTactics': 'ranger',
+    'DeflectMissiles': 'monk',
+    'DeflectingShroud': 'wizard',
+    'DefyDeath': 'warlock',
+    'DesertAura': 'barbarian',
+    'DesertSoul': 'barbarian',
+    'DesertSpells': 'druid',
+    'DestroyUndead': 'cleric',
+    'DestructiveWrath': 'cleric',
+    'DetectPortal': 'ranger',
+    'DevilsSight': 'warlock',
+    'DiamondSoul': 'monk',
+    'DisarmingAttack': 'fighter',
+    'DisarmingShot': 'fighter',
+    'DiscipleOfLife': 'cleric',
+    'DiscipleOfTheElements': 'monk',
+    'Discovery': 'backgrounds',
+    'DistantSpell': 'sorceror',
+    'DistantStrike': 'ranger',
+    'DistractingStrike': 'fighter',
+    'DivinationSavant': 'wizard',
+    'DivineFury': 'barbarian',
+    'DivineHealth': 'paladin',
+    'DivineIntervention': 'cleric',
+    'DivineMagic': 'sorceror',
+    'DivineSense': 'paladin',
+    'DivineSmite': 'paladin',
+    'DivineStrike': 'cleric',
+    'DivineStrikeForge': 'cleric',
+    'DivineStrikeLife': 'cleric',
+    'DivineStrikeNature': 'cleric',
+    'DivineStrikeTempest': 'cleric',
+    'DivineStrikeTrickery': 'cleric',
+    'DivineStrikeWar': 'cleric',
+    'DraconicAncestry': 'races',
+    'DraconicPresence': 'sorceror',
+    'DraconicResilience': 'sorceror',
+    'DraconicResistance': 'races',
+    'DragonAncestor': 'sorceror',
+    'DragonWings': 'sorceror',
+    'DreadAmbusher': 'ranger',
+    'DreadfulWord': 'warlock',
+    'DrowMagic': 'races',
+    'DrunkardsLuck': 'monk',
+    'DrunkenTechnique': 'monk',
+    'Dueling': 'ranger',
+    'DurableMagic': 'wizard',
+    'DurableSummons': 'wizard',
+    'DwarvenResilience': 'races',
+    'DwarvenToughness': 'races',
+    'EagleAspect': 'barbarian',
+    'EagleAttunement': 'barbarian',
+    'EagleSpirit': 'barbarian',
+    'EarForDeceit': 'rogue',
+    'EarToTheGround': 'backgrounds',
+    'EarthWalk': 'races',
+    'EldritchInvocation': 'warlock',
+    'EldritchKnightSpellcasting': 'fighter',
+    'EldritchMaster': 'warlock',
+    'EldritchSight': 'warlock',
+    'EldritchSmite': 'warlock',
+    'EldritchSpear': 'warlock',
+    'EldritchStrike': 'fighter',
+    'ElegantCourtier': 'fighter',
+    'ElegantManeuver': 'rogue',
+    'ElementalAffinity': 'sorceror',
+    'ElementalAttunement': 'monk',
+    'ElementalWildShape': 'druid',
+    'ElfCantrip': 'races',
+    'ElkAspect': 'barbarian',
+    'ElkAttunement': 'barbarian',
+    'ElkSpirit': 'barbarian',
+    'Elusive': 'rogue',
+    'EmissaryOfPeace': 'paladin',
+    'EmissaryOfRedemption': 'paladin',
+    'EmissaryOfTheSea': 'races',
+    'EmpoweredEvocation': 'wizard',
+    'EmpoweredHealing': 'sorceror',
+    'EmpoweredSpell': 'sorceror',
+    'EmptyBody': 'monk',
+    'EnchantmentSavant': 'wizard',
+    'EnfeeblingArrow': 'fighter',
+    'EnthrallingPerformance': 'bard',
+    'EntropicWard': 'warlock',
+    'EscapeTheHorde': 'ranger',
+    'EternalMountainDefense': 'monk',
+    'EtherealStep': 'ranger',
+    'Evasion': 'rogue',
+    'EvasiveFootwork': 'fighter',
+    'EverReadyShot': 'fighter',
+    'EvocationSavant': 'wizard',
+    'ExceptionalTraining': 'ranger',
+    'ExpertDivination': 'wizard',
+    'ExpertForgery': 'races',
+    'ExtendedSpell': 'sorceror',
+    'ExtraAttackBarbarian': 'barbarian',
+    'ExtraAttackBladesinging': 'wizard',
+    'ExtraAttackFighter': 'fighter',
+    'ExtraAttackMonk': 'monk',
+    'ExtraAttackPaladin': 'paladin',
+    'ExtraAttackRanger': 'ranger',
+    'EyeForDetail': 'rogue',
+    'EyeForWeakness': 'rogue',
+    'EyesOfTheDark': 'sorceror',
+    'EyesOfTheGrave': 'cleric',
+    'EyesOfTheRuneKeeper': 'warlock',
+    'FaithfulSummons': 'druid',
+    'FalseIdentity': 'backgrounds',
+    'FanaticalFocus': 'barbarian',
+    'FancyFootwork': 'rogue',
+    'FangsOfTheFireSnake': 'monk',
+    'FastHands': 'rogue',
+    'FastMovement': 'barbarian',
+    'FavoredByTheGods': 'sorceror',
+    'FavoredEnemy': 'ranger',
+    'FavoredEnemyRevised': 'ranger',
+    'FeintingAttack': 'fighter',
+    'FelineAgility': 'races',
+    'FeralInstinct': 'barbarian',
+    'FeralSenses': 'ranger',
+    'FerociousCharger': 'fighter',
+    'FeyAncestry': 'races',
+    'FeyPresence': 'warlock',
+    'FiendishResilience': 'warlock',
+    'FiendishVigor': 'warlock',
+    'FighterFightingStyle': 'fighter',
+    'FightingSpirit': 'fighter',
+    'FirbolgMagic': 'races',
+    'FireResistance': 'races',
+    'FistOfFourThunders': 'monk',
+    'FistOfUnbrokenAir': 'monk',
+    'FlamesOfThePhoenix': 'monk',
+    'FleetOfFoot': 'ranger',
+    'FlurryOfBlows': 'monk',
+    'FocusedConjuration': 'wizard',
+    'FoeSlayer': 'ranger',
+    'FontOfInspiration': 'bard',
+    'FontOfMagic': 'sorceror',
+    'ForcefulShot': 'fighter',
+    'ForestSpells': 'druid',
+    'Frenzy': 'barbarian',
+    'GazeOfTwoMinds': 'warlock',
+    'GhostlyGaze': 'warlock',
+    'GiantKiller': 'ranger',
+    'GiftOfTheDepths': 'warlock',
+    'GiftOfTheEverLivingOnes': 'warlock',
+    'GnomeCunning': 'races',
+    'GoadingAttack': 'fighter',
+    'GongOfTheSummit': 'monk',
+    'GraspOfHadar': 'warlock',
+    'GraspingArrow': 'fighter',
+    'GrasslandSpells': 'druid',
+    'GreatWeaponFighting': 'fighter',
+    'GreatWeaponMaster': 'feats',
+    'GreaterFavoredEnemy': 'ranger',
+    'GreaterPortent': 'wizard',
+    'GrimHarvest': 'wizard',
+    'GuardianSpirit': 'druid',
+    'GuardiansOfTheDepths': 'races',
+    'GuidedStrike': 'cleric',
+    'GuildMembership': 'backgrounds',
+    'Gunsmith': 'fighter',
+    'HalflingNimbleness': 'races',
+    'HealingHands': 'races',
+    'HealingLight': 'warlock',
+    'HeartOfTheStorm': 'sorceror',
+    'HearthOfMoonlightAndShadow': 'druid',
+    'HeightenedSpell': 'sorceror',
+    'HellishResistance': 'races',
+    'HemorrhagingCritical': 'fighter',
+    'HexWarrior': 'warlock',
+    'HexbladesCurse': 'warlock',
+    'HiddenPaths': 'druid',
+    'HiddenStep': 'races',
+    'HideInPlainSight': 'ranger',
+    'HideInPlainSightRevised': 'ranger',
+    'HoldBreath': 'races',
+    'HoldTheLine': 'fighter',
+    'HolyNimbus': 'paladin',
+    'HordeBreaker': 'ranger',
+    'HoundOfIllOmen': 'sorceror',
+    'HourOfReaping': 'monk',
+    'HungryJaws': 'races',
+    'HuntersPrey': 'ranger',
+    'HuntersSense': 'ranger',
+    'HurlThroughHell': 'warlock',
+    'HypnoticGaze': 'wizard',
+    'IllusionSavant': 'wizard',
+    'IllusoryReality': 'wizard',
+    'IllusorySelf': 'wizard',
+    'Imposter': 'rogue',
+    'ImprovedAbjuration': 'wizard',
+    'ImprovedCritical': 'fighter',
+    'ImprovedDivineSmite': 'paladin',
+    'ImprovedDuplicity': 'cleric',
+    'ImprovedFlare': 'cleric',
+    'ImprovedMinorIllusion': 'wizard',
+    'ImprovedPactWeapon': 'warlock',
+    'ImprovedWarMagic': 'fighter',
+    'IndestructibleLife': 'warlock',
+    'Indomitable': 'fighter',
+    'IndomitableMight': 'barbarian',
+    'InfernalLegacy': 'races',
+    'InfiltrationExpertise': 'rogue',
+    'Inheritance': 'backgrounds',
+    'InsightfulFighting': 'rogue',
+    'InsightfulManipulator': 'rogue',
+    'InspiringSurge': 'fighter',
+    'InstinctiveGaze': 'wizard',
+    'IntimidatingPresence': 'barbarian',
+    'IntoxicatedFrenzy': 'monk',
+    'InuredToUndeath': 'wizard',
+    'Invocation': 'warlock',
+    'InvokeDuplicity': 'cleric',
+    'IronMind': 'ranger',
+    'JackOfAllTrades': 'bard',
+    'KeeperOfSouls': 'cleric',
+    'KeptInStyle': 'backgrounds',
+    'Ki': 'monk',
+    'KiEmpoweredStrikes': 'monk',
+    'KnightlyRegard': 'backgrounds',
+    'KnowYourEnemy': 'fighter',
+    'KnowledgeOfTheAncients': 'cleric',
+    'LanceOfLethargy': 'warlock',
+    'LandsStride': 'druid',
+    'LayOnHands': 'paladin',
+    'LibraryAccess': 'backgrounds',
+    'LifeDrinker': 'warlock',
+    'LightBearer': 'races',
+    'LightningReload': 'fighter',
+    'LoreProficiencies': 'bard',
+    'Lucky': 'races',
+    'LungingAttack': 'fighter',
+    'MaddeningHex': 'warlock',
+    'MageHandLegerdemain': 'rogue',
+    'MagicArrow': 'fighter',
+    'MagicUsersNemesis': 'ranger',
+    'MagicalAmbush': 'rogue',
+    'MagicalSecrets': 'bard',
+    'MalleableIllusions': 'wizard',
+    'Maneuver': 'fighter',
+    'ManeuveringAttack': 'fighter',
+    'MantleOfInspiration': 'bard',
+    'MantleOfMajesty': 'bard',
+    'MantleOfWhispers': 'bard',
+    'MartialArts': 'monk',
+    'MaskOfManyFaces': 'warlock',
+    'MaskOfTheWild': 'races',
+    'MasterDuelist': 'rogue',
+    'MasterOfHexes': 'warlock',
+    'MasterOfIntrigue': 'rogue',
+    'MasterOfMyriadForms': 'warlock',
+    'MasterOfNature': 'cleric',
+    'MasterOfTactics': 'rogue',
+    'MasterTransmuter': 'wizard',
+    'MastersFlourish': 'bard',
+    'MasteryOfDeath': 'monk',
+    'MenacingAttack': 'fighter',
+    'MercenaryLife': 'backgrounds',
+    'MergeWithStone': 'races',
+    'Metamagic': 'sorceror',
+    'MightySummoner': 'druid',
+    'MilitaryRank': 'backgrounds',
+    'Mimicry': 'races',
+    'MindlessRage': 'barbarian',
+    'MingleWithTheWind': 'races',
+    'MinionsOfChaos': 'warlock',
+    'MinorAlchemy': 'wizard',
+    'MinorIllusion': 'wizard',
+    'MireTheMind': 'warlock',
+    'Misdirection': 'rogue',
+    'MistStance': 'monk',
+    'MistyEscape': 'warlock',
+    'MistyVisions': 'warlock',
+    'MountainBorn': 'races',
+    'MountainSpells': 'druid',
+    'MultiattackDefense': 'ranger',
+    'MultiattackRanger': 'ranger',
+    'MysticArcanum': 'warlock',
+    'NaturalArmor': 'races',
+    'NaturalExplorer': 'ranger',
+    'NaturalExplorerRevised': 'ranger',
+    'NaturalIllusionist': 'races',
+    'NaturalRecovery': 'druid',
+    'NaturallyStealthy': 'races',
+    'NaturesSanctuary': 'druid',
+    'NaturesWard': 'druid',
+    'NecromancySavant': 'wizard',
+    'NecroticShroud': 'races',
+    'OneWithShadows': 'warlock',
+    'OneWithTheBlade': 'monk',
+    'OpenHandTechnique': 'monk',
+    'Opportunist': 'monk',
+    'OtherworldlyLeap': 'warlock',
+    'OtherworldlyWings': 'sorceror',
+    'Overchannel': 'wizard',
+    'PactBoon': 'warlock',
+    'PactOfTheBlade': 'warlock',
+    'PactOfTheChain': 'warlock',
+    'PactOfTheTome': 'warlock',
+    'PaladinFightingStyle': 'paladin',
+    'Panache': 'rogue',
+    'Parry': 'fighter',
+    'PathOfTheKensei': 'monk',
+    'PathToTheGrave': 'cleric',
+    'PatientDefense': 'monk',
+    'PeerlessSkill': 'bard',
+    'PerfectSelf': 'monk',
+    'PersistentRage': 'barbarian',
+    'PiercingArrow': 'fighter',
+    'PiercingShot': 'fighter',
+    'PlanarWarrior': 'ranger',
+    'Portent': 'wizard',
+    'PositionOfPrivilege': 'backgrounds',
+    'PotentCantrip': 'wizard',
+    'PotentSpellcasting': 'cleric',
+    'PowerSurge': 'wizard',
+    'PowerfulBuild': 'races',
+    'PrecisionAttack': 'fighter',
+    'PreserveLife': 'cleric',
+    'PrimalChampion': 'barbarian',
+    'PrimalStrike': 'druid',
+    'PrimevalAwareness': 'ranger',
+    'PrimevalAwarenessRevised': 'ranger',
+    'ProjectedWard': 'wizard',
+    'Protection': 'fighter',
+    'ProtectiveSpirit': 'paladin',
+    'PsychicBlades': 'bard',
+    'PurityOfBody': 'monk',
+    'PurityOfSpirit': 'paladin',
+    'PushingAttack': 'fighter',
+    'QuickDraw': 'fighter',
+    'QuickenedSpell': 'sorceror',
+    'QuiveringPalm': 'monk',
+    'RadianceOfTheDawn': 'cleric',
+    'RadiantConsumption': 'races',
+    'RadiantSoul': 'races',
+    'RadiantSunBolt': 'monk',
+    'Rage': 'barbarian',
+    'RageBeyondDeath': 'barbarian',
+    'RagingDesert': 'barbarian',
+    'RagingSea': 'barbarian',
+    'RagingStorm': 'barbarian',
+    'RagingTundra': 'barbarian',
+    'RakishAudacity': 'rogue',
+    'Rally': 'fighter',
+    'RallyingCry': 'fighter',
+    'RangerFightingStyle': 'ranger',
+    'RangersCompanion': 'ranger',
+    'RapidRepair': 'fighter',
+    'RapidStrike': 'fighter',
+    'ReachToTheBlaze': 'races',
+    'ReadThoughts': 'cleric',
+    'RebukeTheViolent': 'paladin',
+    'RecklessAbandon': 'barbarian',
+    'RecklessAttack': 'barbarian',
+    'Relentless': 'fighter',
+    'RelentlessEndurance': 'races',
+    'RelentlessHex': 'warlock',
+    'RelentlessRage': 'barbarian',
+    'ReliableTalent': 'rogue',
+    'RemarkableAthelete': 'fighter',
+    'RepellingBlast': 'warlock',
+    'Researcher': 'backgrounds',
+    'RespectOfTheStoutFolk': 'backgrounds',
+    'Retaliation': 'barbarian',
+    'RideTheWind': 'monk',
+    'Riposte': 'fighter',
+    'RiverOfHungryFlame': 'monk',
+    'RogueExpertise': 'rogue',
+    'RoyalEnvoy': 'fighter',
+    'RushOfTheGaleSpirits': 'monk',
+    'RusticHospitality': 'backgrounds',
+    'SacredWeapon': 'paladin',
+    'SafeHaven': 'backgrounds',
+    'SaintOfForgeAndFire': 'cleric',
+    'SavageAttacks': 'races',
+    'SculptSpells': 'wizard',
+    'SculptorOfFlesh': 'warlock',
+    'SeaAura': 'barbarian',
+    'SeaSoul': 'barbarian',
+    'SearingArcStrike': 'monk',
+    'SearingSunburst': 'monk',
+    'SearingVengeance': 'warlock',
+    'SecondStoryWork': 'rogue',
+    'SecondWind': 'fighter',
+    'SeekingArrow': 'fighter',
+    'SentinelAtDeathsDoor': 'cleric',
+    'ShadowArrow': 'fighter',
+    'ShadowArts': 'monk',
+    'ShadowLore': 'bard',
+    'ShadowStep': 'monk',
+    'ShadowWalk': 'sorceror',
+    'ShadowyDodge': 'ranger',
+    'ShapeTheFlowingRiver': 'monk',
+    'Shapechanger': 'wizard',
+    'ShareSpells': 'ranger',
+    'SharpenTheBlade': 'monk',
+    'ShelterOfTheFaithful': 'backgrounds',
+    'ShieldingStorm': 'barbarian',
+    'ShipsPassage': 'backgrounds',
+    'ShroudOfShadow': 'warlock',
+    'SignOfIllOmen': 'warlock',
+    'SignatureSpells': 'wizard',
+    'Skirmisher': 'rogue',
+    'SlayersCounter': 'ranger',
+    'SlayersPrey': 'ranger',
+    'SlipperyMind': 'rogue',
+    'SlowFall': 'monk',
+    'SneakAttack': 'rogue',
+    'SongOfDefense': 'wizard',
+    'SongOfRest': 'bard',
+    'SongOfVictory': 'wizard',
+    'SorcerousRestoration': 'sorceror',
+    'SoulOfDeceit': 'rogue',
+    'SoulOfTheForge': 'cleric',
+    'SpeakWithSmallBeasts': 'races',
+    'SpectralDefense': 'ranger',
+    'SpeechOfBeastAndLeaf': 'races',
+    'SpeechOfTheWoods': 'druid',
+    'SpellBombardment': 'sorceror',
+    'SpellBreaker': 'cleric',
+    'SpellMastery': 'wizard',
+    'SpellResistance': 'wizard',
+    'SpellThief': 'rogue',
+    'SpikedRetribution': 'barbarian',
+    'SpiritSeeker': 'barbarian',
+    'SpiritShield': 'barbarian',
+    'SpiritTotem': 'druid',
+    'SpiritWalker': 'barbarian',
+    'SplitEnchantment': 'wizard',
+    'StalkersDodge': 'ranger',
+    'StalkersFlurry': 'ranger',
+    'StandAgainstTheTide': 'ranger',
+    'SteadyEye': 'rogue',
+    'SteelWill': 'ranger',
+    'StepOfTheWind': 'monk',
+    'StillnessOfMind': 'monk',
+    'StoneCamouflage': 'races',
+    'Stonecunning': 'races',
+    'StonesEndurance': 'races',
+    'StormAura': 'barbarian',
+    'StormGuide': 'sorceror',
+    'StormOfClawsAndFangs': 'ranger',
+    'StormSoul': 'barbarian',
+    'Stormborn': 'cleric',
+    'StormsFury': 'sorceror',
+    'StoutResilience': 'races',
+    'StrengthBeforeDeath': 'fighter',
+    'StrengthOfTheGrave': 'sorceror',
+    'StrokeOfLuck': 'rogue',
+    'StudentOfWar': 'fighter',
+    'StunningStrike': 'monk',
+    'SubtleSpell': 'sorceror',
+    'SuddenStrike': 'rogue',
+    'SunShield': 'monk',
+    'SunlightSensitivity': 'races',
+    'SuperiorBeastsDefense': 'ranger',
+    'SuperiorCritical': 'fighter',
+    'SuperiorDarkvision': 'races',
+    'SuperiorHuntersDefense': 'ranger',
+    'SuperiorInspiration': 'bard',
+    'SuperiorMobility': 'rogue',
+    'SupernaturalDefense': 'ranger',
+    'SupremeHealing': 'cleric',
+    'SupremeSneak': 'rogue',
+    'Survivalist': 'rogue',
+    'Survivor': 'fighter',
+    'SwampSpells': 'druid',
+    'SweepingAttack': 'fighter',
+    'SweepingCinderStrike': 'monk',
+    'SwordsProficiency': 'bard',
+    'TacticalWit': 'wizard',
+    'TempestuousMagic': 'sorceror',
+    'TheThirdEye': 'wizard',
+    'ThiefOfFiveFates': 'warlock',
+    'ThiefsReflexes': 'rogue',
+    'ThirstingBlade': 'warlock',
+    'ThoughtShield': 'warlock',
+    'ThousandForms': 'druid',
+    'ThunderboltStrike': 'cleric',
+    'TidesOfChaos': 'sorceror',
+    'TigerAspect': 'barbarian',
+    'TigerAttunement': 'barbarian',
+    'TigerSpirit': 'barbarian',
+    'TimelessBody': 'monk',
+    'Tinker': 'races',
+    'TipsySway': 'monk',
+    'TirelessSpirit': 'fighter',
+    'TombOfLevistus': 'warlock',
+    'TongueOfTheSunAndMoon': 'monk',
+    'TotemSpirit': 'barbarian',
+    'TotemicAttunement': 'barbarian',
+    'TouchOfDeath': 'monk',
+    'TouchOfTheLongDeath': 'monk',
+    'Trance': 'races',
+    'Tranquility': 'monk',
+    'TransmutationSavant': 'wizard',
+    'TransmutersStone': 'wizard',
+    'TrickstersEscape': 'warlock',
+    'TripingAttack': 'fighter',
+    'TundraAura': 'barbarian',
+    'TundraSoul': 'barbarian',
+    'TurnTheUnholy': 'paladin',
+    'TurnUndead': 'cleric',
+    'TwinnedSpell': 'sorceror',
+    'TwoWeaponFighting': 'ranger',
+    'UmbralForm': 'sorceror',
+    'UmbralSight': 'ranger',
+    'UnarmoredDefenseBarbarian': 'barbarian',
+    'UnarmoredDefenseMonk': 'monk',
+    'UnarmoredMovement': 'monk',
+    'UnbreakableMajesty': 'bard',
+    'UncannyDodge': 'rogue',
+    'UndeadThralls': 'wizard',
+    'UnderdarkScout': 'ranger',
+    'UnderdarkSpells': 'druid',
+    'UndyingNature': 'warlock',
+    'UnearthlyRecovery': 'sorceror',
+    'UnendingBreath': 'races',
+    'UnerringAccuracy': 'monk',
+    'UnerringEye': 'rogue',
+    'UnwaveringMark': 'fighter',
+    'UseMagicDevice': 'rogue',
+    'UthgardtHeritage': 'backgrounds',
+    'Vanish': 'ranger',
+    'VengefulAncestors': 'barbarian',
+    'VersatileTrickster': 'rogue',
+    'ViciousIntent': 'fighter',
+    'VigilantDefender': 'fighter',
+    'ViolentShot': 'fighter',
+    'VisionsOfDistantRealms': 'warlock',
+    'VisionsOfThePast': 'cleric',
+    'VoiceOfTheChainMaster': 'warlock',
+    'Volley': 'ranger',
+    'WalkerInDreams': 'druid',
+    'Wanderer': 'backgrounds',
+    'WarGodsBlessing': 'cleric',
+    'WarMagic': 'fighter',
+    'WarPriest': 'cleric',
+    'WardingFlare': 'cleric',
+    'WardingManeuver': 'fighter',
+    'WarriorOfTheGods': 'barbarian',
+    'WatchersEye': 'backgrounds',
+    'WaterWhip': 'monk',
+    'WaveOfRollingEarth': 'monk',
+    'WeaponBond': 'fighter',
+    'WhirlwindAttack': 'ranger',
+    'WhispersOfTheGrave': 'warlock',
+    'WholenessOfBody': 'monk',
+    'WildMagicSurge': 'sorceror',
+    'WildShape': 'druid',
+    'WindSoul': 'sorceror',
+    'WingingShot': 'fighter',
+    'WitchSight': 'warlock',
+    'WolfAspect': 'barbarian',
+    'WolfAttunement': 'barbarian',
+    'WolfSpirit': 'barbarian',
+    'WordsOfTerror': 'bard',
+    'WrathOfTheStorm': 'cleric',
+    'ZealousPresence': 'barbarian',
+}
+
+FEATURE_SOURCES = {
+    '': (
+        'CombatSuperiority',
+        'Survivalist',
+        'Tinker',
+    ),
+    'Background (Acolyte)': (
+        'ShelterOfTheFaithful',
+    ),
+    'Background (Charlattan)': (
+        'FalseIdentity',
+    ),
+    'Background (City Watch)': (
+        'WatchersEye',
+    ),
+    'Background (Clan Crafter)': (
+        'RespectOfTheStoutFolk',
+    ),
+    'Background (Cloistered Scholar)': (
+        'LibraryAccess',
+    ),
+    'Background (Courtier)': (
+        'CourtFunctionary',
+    ),
+    'Background (Criminal)': (
+        'CriminalContact',
+    ),
+    'Background (Entertainer)': (
+        'ByPopularDemand',
+    ),
+    'Background (Faction Agent)': (
+        'SafeHaven',
+    ),
+    'Background (Far Traveler)': (
+        'AllEyesOnYou',
+    ),
+    'Background (Folk Hero)': (
+        'RusticHospitality',
+    ),
+    'Background (Guild Artisan)': (
+        'GuildMembership',
+    ),
+    'Background (Hermit)': (
+        'Discovery',
+    ),
+    'Background (Inheritor)': (
+        'Inheritance',
+    ),
+    'Background (Knight of the Order)': (
+        'KnightlyRegard',
+    ),
+    'Background (Mercenary Veteran)': (
+        'MercenaryLife',
+    ),
+    'Background (Noble)': (
+        'PositionOfPrivilege',
+    ),
+    'Background (Outlander)': (
+        'Wanderer',
+    ),
+    'Background (Sage)': (
+        'Researcher',
+    ),
+    'Background (Sailor)': (
+        'ShipsPassage',
+    ),
+    'Background (Soldier)': (
+        'MilitaryRank',
+    ),
+    'Background (Urban Bounty Hunter)': (
+        'EarToTheGround',
+    ),
+    'Background (Urchin)': (
+        'CitySecrets',
+    ),
+    'Background (Uthgardt Tribe Member)': (
+        'UthgardtHeritage',
+    ),
+    'Background (Waterdhavian Noble)': (
+        'KeptInStyle',
+    ),
+    'Barbarian': (
+        'BrutalCritical',
+        'DangerSense',
+        'ExtraAttackBarbarian',
+        'FastMovement',
+        'FeralInstinct',
+        'IndomitableMight',
+        'PersistentRage',
+        'PrimalChampion',
+        'Rage',
+        'RecklessAttack',
+        'RelentlessRage',
+        'UnarmoredDefenseBarbarian',
+    ),
+    'Barbarian (Ancestral Guardian)': (
+        'AncestralProtectors',
+        'ConsultTheSpirits',
+        'SpiritShield',
+        'VengefulAncestors',
+    ),
+    'Barbarian (Battlerager)': (
+        'BattleragerArmor',
+        'BattleragerCharge',
+        'RecklessAbandon',
+        'SpikedRetribution',
+    ),
+    'Barbarian (Berserker)': (
+        'Frenzy',
+        'IntimidatingPresence',
+        'MindlessRage',
+        'Retaliation',
+    ),
+    'Barbarian (Storm Herald)': (
+        'DesertAura',
+        'DesertSoul',
+        'RagingDesert',
+        'RagingSea',
+        'RagingStorm',
+        'RagingTundra',
+        'SeaAura',
+        'SeaSoul',
+        'ShieldingStorm',
+        'StormAura',
+        'StormSoul',
+        'TundraAura',
+        'TundraSoul',
+    ),
+    'Barbarian (Totem Warrior)': (
+        'BearAspect',
+        'BearAttunement',
+        'BearSpirit',
+        'BeastAspect',
+        'EagleAspect',
+        'EagleAttunement',
+        'EagleSpirit',
+        'ElkAspect',
+        'ElkAttunement',
+        'ElkSpirit',
+        'SpiritSeeker',
+        'SpiritWalker',
+        'TigerAspect',
+        'TigerAttunement',
+        'TigerSpirit',
+        'TotemSpirit',
+        'TotemicAttunement',
+        'WolfAspect',
+        'WolfAttunement',
+        'WolfSpirit',
+    ),
+    'Barbarian (Zealot)': (
+        'DivineFury',
+        'FanaticalFocus',
+        'RageBeyondDeath',
+        'WarriorOfTheGods',
+        'ZealousPresence',
+    ),
+    'Bard': (
+        'BardExpertise',
+        'BardicInspiration',
+        'Countercharm',
+        'FontOfInspiration',
+        'JackOfAllTrades',
+        'MagicalSecrets',
+        'SongOfRest',
+        'SuperiorInspiration',
+    ),
+    'Bard (College of Glamour)': (
+        'EnthrallingPerformance',
+        'MantleOfInspiration',
+        'MantleOfMajesty',
+        'UnbreakableMajesty',
+    ),
+    'Bard (College of Lore)': (
+        'AdditionalMagicalSecrets',
+        'CuttingWords',
+        'LoreProficiencies',
+        'PeerlessSkill',
+    ),
+    'Bard (College of Swords)': (
+        'BardFightingStyle',
+        'BladeFlourish',
+        'MastersFlourish',
+        'SwordsProficiency',
+    ),
+    'Bard (College of Valor)': (
+        'BardBattleMagic',
+        'BardExtraAttack',
+        'CombatInspiration',
+    ),
+    'Bard (College of Whispers)': (
+        'MantleOfWhispers',
+        'PsychicBlades',
+        'ShadowLore',
+        'WordsOfTerror',
+    ),
+    'Class (Many)': (
+        'LandsStride',
+    ),
+    'Class (many)': (
+        'Evasion',
+        'UncannyDodge',
+    ),
+    'Cleric': (
+        'ChannelDivinity',
+        'DestroyUndead',
+        'DivineIntervention',
+        'DivineStrike',
+        'PotentSpellcasting',
+        'TurnUndead',
+    ),
+    'Cleric (Arcana Domain)': (
+        'ArcaneAbjuration',
+        'ArcaneInitiate',
+        'ArcaneMastery',
+        'SpellBreaker',
+    ),
+    'Cleric (Forge Domain)': (
+        'ArtisansBlessing',
+        'BlessingOfTheForge',
+        'DivineStrikeForge',
+        'SaintOfForgeAndFire',
+        'SoulOfTheForge',
+    ),
+    'Cleric (Grave Domain)': (
+        'CircleOfMortality',
+        'EyesOfTheGrave',
+        'KeeperOfSouls',
+        'PathToTheGrave',
+        'SentinelAtDeathsDoor',
+    ),
+    'Cleric (Knowledge Domain)': (
+        'BlessingsOfKnowledge',
+        'KnowledgeOfTheAncients',
+        'ReadThoughts',
+        'VisionsOfThePast',
+    ),
+    'Cleric (Life Domain)': (
+        'BlessedHealer',
+        'DiscipleOfLife',
+        'DivineStrikeLife',
+        'PreserveLife',
+        'SupremeHealing',
+    ),
+    'Cleric (Light Domain)': (
+        'CoronaOfLight',
+        'ImprovedFlare',
+        'RadianceOfTheDawn',
+        'WardingFlare',
+    ),
+    'Cleric (Nature Domain)': (
+        'AcolyteOfNature',
+        'CharmAnimalsAndPlants',
+        'DampenElements',
+        'DivineStrikeNature',
+        'MasterOfNature',
+    ),
+    'Cleric (Tempest Domain)': (
+        'DestructiveWrath',
+        'DivineStrikeTempest',
+        'Stormborn',
+        'ThunderboltStrike',
+        'WrathOfTheStorm',
+    ),
+    'Cleric (Trickery Domain)': (
+        'BlessingOfTheTrickster',
+        'DivineStrikeTrickery',
+        'ImprovedDuplicity',
+        'InvokeDuplicity',
+    ),
+    'Cleric (War Domain)': (
+        'AvatarOfBattle',
+        'DivineStrikeWar',
+        'GuidedStrike',
+        'WarGodsBlessing',
+        'WarPriest',
+    ),
+    'Druid': (
+        'Archdruid',
+        'BeastSpells',
+        'WildShape',
+    ),
+    'Druid (Circle of Dreams)': (
+        'BalmOfTheSummerCourt',
+    ),
+    'Druid (Circle of the Land)': (
+        'ArcticSpells',
+        'BonusCantrip',
+        'CircleSpells',
+        'CoastSpells',
+        'DesertSpells',
+        'ForestSpells',
+        'GrasslandSpells',
+        'MountainSpells',
+        'NaturalRecovery',
+        'NaturesSanctuary',
+        'NaturesWard',
+        'SwampSpells',
+        'UnderdarkSpells',
+    ),
+    'Druid (Circle of the Moon)': (
+        'CircleForms',
+        'CombatWildShape',
+        'ElementalWildShape',
+        'HearthOfMoonlightAndShadow',
+        'HiddenPaths',
+        'PrimalStrike',
+        'ThousandForms',
+        'WalkerInDreams',
+    ),
+    'Druid (Circle of the Shepherd)': (
+        'FaithfulSummons',
+        'GuardianSpirit',
+        'MightySummoner',
+        'SpeechOfTheWoods',
+        'SpiritTotem',
+    ),
+    'Feats': (
+        'Actor',
+        'GreatWeaponMaster',
+    ),
+    'Fighter': (
+        'ActionSurge',
+        'ExtraAttackFighter',
+        'FighterFightingStyle',
+        'GreatWeaponFighting',
+        'Indomitable',
+        'Protection',
+        'SecondWind',
+    ),
+    'Fighter (Arcane Archer)': (
+        'ArcaneArcherLore',
+        'ArcaneShot',
+        'BanishingArrow',
+        'BeguilingArrow',
+        'BurstingArrow',
+        'CurvingShot',
+        'EnfeeblingArrow',
+        'EverReadyShot',
+        'GraspingArrow',
+        'MagicArrow',
+        'PiercingArrow',
+        'SeekingArrow',
+        'ShadowArrow',
+    ),
+    'Fighter (Battle Master)': (
+        'KnowYourEnemy',
+        'Relentless',
+        'StudentOfWar',
+    ),
+    'Fighter (Cavalier)': (
+        'BonusProficiencyCavalier',
+        'BornToTheSaddle',
+        'FerociousCharger',
+        'HoldTheLine',
+        'UnwaveringMark',
+        'VigilantDefender',
+        'WardingManeuver',
+    ),
+    'Fighter (Champion)': (
+        'AdditionalFightingStyle',
+        'ImprovedCritical',
+        'RemarkableAthelete',
+        'SuperiorCritical',
+        'Survivor',
+    ),
+    'Fighter (Eldritch Knight)': (
+        'ArcaneCharge',
+        'EldritchKnightSpellcasting',
+        'EldritchStrike',
+        'ImprovedWarMagic',
+        'WarMagic',
+        'WeaponBond',
+    ),
+    'Fighter (Gunslinger': (
+        'AdeptMarksman',
+    ),
+    'Fighter (Gunslinger)': (
+        'Gunsmith',
+        'HemorrhagingCritical',
+        'LightningReload',
+        'QuickDraw',
+        'RapidRepair',
+        'ViciousIntent',
+    ),
+    'Fighter (Purple Dragon Knight)': (
+        'Bulwark',
+        'InspiringSurge',
+        'RallyingCry',
+        'RoyalEnvoy',
+    ),
+    'Fighter (Samurai)': (
+        'BonusProficiencySamurai',
+        'ElegantCourtier',
+        'FightingSpirit',
+        'RapidStrike',
+        'StrengthBeforeDeath',
+        'TirelessSpirit',
+    ),
+    'Fighter Maneuver (Battle Master)': (
+        'CommandersStrike',
+        'DisarmingAttack',
+        'DistractingStrike',
+        'EvasiveFootwork',
+        'FeintingAttack',
+        'GoadingAttack',
+        'LungingAttack',
+        'Maneuver',
+        'ManeuveringAttack',
+        'MenacingAttack',
+        'Parry',
+        'PrecisionAttack',
+        'PushingAttack',
+        'Rally',
+        'Riposte',
+        'SweepingAttack',
+        'TripingAttack',
+    ),
+    'Gunslinger (Trick Shot)': (
+        'BullyingShot',
+        'DazingShot',
+        'DeadeyeShot',
+        'DisarmingShot',
+        'ForcefulShot',
+        'PiercingShot',
+        'ViolentShot',
+        'WingingShot',
+    ),
+    'Monk': (
+        'DeflectMissiles',
+        'DiamondSoul',
+        'EmptyBody',
+        'ExtraAttackMonk',
+        'FlurryOfBlows',
+        'Ki',
+        'KiEmpoweredStrikes',
+        'MartialArts',
+        'PatientDefense',
+        'PerfectSelf',
+        'PurityOfBody',
+        'SlowFall',
+        'StepOfTheWind',
+        'StillnessOfMind',
+        'StunningStrike',
+        'TimelessBody',
+        'TongueOfTheSunAndMoon',
+        'UnarmoredDefenseMonk',
+        'UnarmoredMovement',
+    ),
+    'Monk (Way of Shadow)': (
+        'CloakOfShadows',
+        'Opportunist',
+        'ShadowArts',
+        'ShadowStep',
+    ),
+    'Monk (Way of the Drunken Master)': (
+        'DrunkardsLuck',
+        'DrunkenTechnique',
+        'IntoxicatedFrenzy',
+        'TipsySway',
+    ),
+    'Monk (Way of the Four Elements)': (
+        'BreathOfWinter',
+        'ClenchOfTheNorthWind',
+        'DiscipleOfTheElements',
+        'ElementalAttunement',
+        'EternalMountainDefense',
+        'FangsOfTheFireSnake',
+        'FistOfFourThunders',
+        'FistOfUnbrokenAir',
+        'FlamesOfThePhoenix',
+        'GongOfTheSummit',
+        'MistStance',
+        'RideTheWind',
+        'RiverOfHungryFlame',
+        'RushOfTheGaleSpirits',
+        'ShapeTheFlowingRiver',
+        'SweepingCinderStrike',
+        'WaterWhip',
+        'WaveOfRollingEarth',
+    ),
+    'Monk (Way of the Kensei)': (
+        'OneWithTheBlade',
+        'PathOfTheKensei',
+        'SharpenTheBlade',
+        'UnerringAccuracy',
+    ),
+    'Monk (Way of the Open Hand)': (
+        'OpenHandTechnique',
+        'QuiveringPalm',
+        'Tranquility',
+        'WholenessOfBody',
+    ),
+    'Monk (Way of the Sun Soul)': (
+        'HourOfReaping',
+        'MasteryOfDeath',
+        'RadiantSunBolt',
+        'SearingArcStrike',
+        'SearingSunburst',
+        'SunShield',
+        'TouchOfDeath',
+        'TouchOfTheLongDeath',
+    ),
+    'Paladin': (
+        'AuraOfCourage',
+        'AuraOfProtection',
+        'ChannelDivinityPaladin',
+        'CleansingTouch',
+        'DivineHealth',
+        'DivineSense',
+        'DivineSmite',
+        'ExtraAttackPaladin',
+        'ImprovedDivineSmite',
+        'LayOnHands',
+        'PaladinFightingStyle',
+    ),
+    'Paladin (Oath of Devotion)': (
+        'AuraOfDevotion',
+        'HolyNimbus',
+        'PurityOfSpirit',
+        'SacredWeapon',
+        'TurnTheUnholy',
+    ),
+    'Paladin (Oath of Redemption)': (
+        'AuraOfTheGuardian',
+        'EmissaryOfPeace',
+        'EmissaryOfRedemption',
+        'ProtectiveSpirit',
+        'RebukeTheViolent',
+    ),
+    'Race': (
+        'Amphibious',
+        'Darkvision',
+        'PowerfulBuild',
+        'SuperiorDarkvision',
+    ),
+    'Race (Aasimar)': (
+        'CelestialResistance',
+        'HealingHands',
+        'LightBearer',
+    ),
+    'Race (Air Genasi)': (
+        'MingleWithTheWind',
+        'UnendingBreath',
+    ),
+    'Race (Dark Elf)': (
+        'DrowMagic',
+        'SunlightSensitivity',
+    ),
+    'Race (Deep Gnome)': (
+        'StoneCamouflage',
+    ),
+    'Race (Dragonborn)': (
+        'BreathWeapon',
+        'DraconicAncestry',
+        'DraconicResistance',
+    ),
+    'Race (Dwarf)': (
+        'DwarvenResilience',
+        'Stonecunning',
+    ),
+    'Race (Earth Genasi)': (
+        'EarthWalk',
+        'MergeWithStone',
+    ),
+    'Race (Elf)': (
+        'FeyAncestry',
+        'Trance',
+    ),
+    'Race (Fallen Aasimar)': (
+        'NecroticShroud',
+    ),
+    'Race (Firbolg)': (
+        'FirbolgMagic',
+        'HiddenStep',
+        'SpeechOfBeastAndLeaf',
+    ),
+    'Race (Fire Genasi)': (
+        'FireResistance',
+        'ReachToTheBlaze',
+    ),
+    'Race (Forest Gnome)': (
+        'NaturalIllusionist',
+        'SpeakWithSmallBeasts',
+    ),
+    'Race (Gnome)': (
+        'GnomeCunning',
+    ),
+    'Race (Goliath)': (
+        'MountainBorn',
+        'StonesEndurance',
+    ),
+    'Race (Half-Orc)': (
+        'RelentlessEndurance',
+        'SavageAttacks',
+    ),
+    'Race (Halfling)': (
+        'Brave',
+        'HalflingNimbleness',
+        'Lucky',
+    ),
+    'Race (High-Elf)': (
+        'ElfCantrip',
+    ),
+    'Race (Hill Dwarf)': (
+        'DwarvenToughness',
+    ),
+    'Race (Kenku)': (
+        'ExpertForgery',
+        'Mimicry',
+    ),
+    'Race (Lightfoot Halfling)': (
+        'NaturallyStealthy',
+    ),
+    'Race (Lizardfolk)': (
+        'CunningArtisan',
+        'HoldBreath',
+        'HungryJaws',
+        'NaturalArmor',
+    ),
+    'Race (Protector Aasimar)': (
+        'RadiantSoul',
+    ),
+    'Race (Rock Gnome)': (
+        'ArtificersLore',
+    ),
+    'Race (Scourge Aasimar)': (
+        'RadiantConsumption',
+    ),
+    'Race (Stout Halfling)': (
+        'StoutResilience',
+    ),
+    'Race (Tabaxi)': (
+        'FelineAgility',
+    ),
+    'Race (Tiefling)': (
+        'HellishResistance',
+        'InfernalLegacy',
+    ),
+    'Race (Triton)': (
+        'ControlAirAndWater',
+        'EmissaryOfTheSea',
+        'GuardiansOfTheDepths',
+    ),
+    'Race (Water Genasi)': (
+        'AcidResistance',
+        'CallToTheWave',
+    ),
+    'Race (Wood Elf)': (
+        'MaskOfTheWild',
+    ),
+    'Ranger': (
+        'Archery',
+        'Defense',
+        'Dueling',
+        'ExtraAttackRanger',
+        'FavoredEnemy',
+        'FeralSenses',
+        'FoeSlayer',
+        'HideInPlainSight',
+        'NaturalExplorer',
+        'PrimevalAwareness',
+        'RangerFightingStyle',
+        'TwoWeaponFighting',
+        'Vanish',
+    ),
+    'Ranger (Beast Master)': (
+        'BestialFury',
+        'ExceptionalTraining',
+        'RangersCompanion',
+        'ShareSpells',
+    ),
+    'Ranger (Gloom Stalker)': (
+        'DreadAmbusher',
+        'IronMind',
+        'ShadowyDodge',
+        'StalkersFlurry',
+        'UmbralSight',
+    ),
+    'Ranger (Horizon Walker)': (
+        'DetectPortal',
+        'DistantStrike',
+        'EtherealStep',
+        'PlanarWarrior',
+        'SpectralDefense',
+    ),
+    'Ranger (Hunter)': (
+        'ColossusSlayer',
+        'DefensiveTactics',
+        'EscapeTheHorde',
+        'GiantKiller',
+        'HordeBreaker',
+        'HuntersPrey',
+        'MultiattackDefense',
+        'MultiattackRanger',
+        'StandAgainstTheTide',
+        'SteelWill',
+        'SuperiorHuntersDefense',
+        'Volley',
+        'WhirlwindAttack',
+    ),
+    'Ranger (Monster Slayer)': (
+        'HuntersSense',
+        'MagicUsersNemesis',
+        'SlayersCounter',
+        'SlayersPrey',
+        'SupernaturalDefense',
+    ),
+    'Revised Ranger': (
+        'FavoredEnemyRevised',
+        'FleetOfFoot',
+        'GreaterFavoredEnemy',
+        'HideInPlainSightRevised',
+        'NaturalExplorerRevised',
+        'PrimevalAwarenessRevised',
+    ),
+    'Revised Ranger (Animal Companion)': (
+        'AnimalCompanion',
+    ),
+    'Revised Ranger (Beast Conclave)': (
+        'BeastsDefense',
+        'CompanionsBond',
+        'CoordinatedAttack',
+        'StormOfClawsAndFangs',
+        'SuperiorBeastsDefense',
+    ),
+    'Revised Ranger (Deep Stalker Conclave)': (
+        'StalkersDodge',
+        'UnderdarkScout',
+    ),
+    'Rogue': (
+        'BlindSense',
+        'CunningAction',
+        'Elusive',
+        'ReliableTalent',
+        'RogueExpertise',
+        'SlipperyMind',
+        'SneakAttack',
+        'StrokeOfLuck',
+    ),
+    'Rogue (Arcane Trickster)': (
+        'MageHandLegerdemain',
+        'MagicalAmbush',
+        'SpellThief',
+        'VersatileTrickster',
+    ),
+    'Rogue (Assassin)': (
+        'Assassinate',
+        'DeathStrike',
+        'Imposter',
+        'InfiltrationExpertise',
+    ),
+    'Rogue (Inquisitive)': (
+        'EarForDeceit',
+        'EyeForDetail',
+        'EyeForWeakness',
+        'InsightfulFighting',
+        'SteadyEye',
+        'UnerringEye',
+    ),
+    'Rogue (Masterind)': (
+        'SoulOfDeceit',
+    ),
+    'Rogue (Mastermind)': (
+        'InsightfulManipulator',
+        'MasterOfIntrigue',
+        'MasterOfTactics',
+        'Misdirection',
+    ),
+    'Rogue (Scout)': (
+        'AmbushMaster',
+        'Skirmisher',
+        'SuddenStrike',
+        'SuperiorMobility',
+    ),
+    'Rogue (Swashbuckler)': (
+        'ElegantManeuver',
+        'FancyFootwork',
+        'MasterDuelist',
+        'Panache',
+        'RakishAudacity',
+    ),
+    'Rogue (Thief)': (
+        'FastHands',
+        'SecondStoryWork',
+        'SupremeSneak',
+        'ThiefsReflexes',
+        'UseMagicDevice',
+    ),
+    'Sorceror': (
+        'FontOfMagic',
+        'SorcerousRestoration',
+    ),
+    'Sorceror (Divine Soul)': (
+        'DivineMagic',
+        'EmpoweredHealing',
+        'FavoredByTheGods',
+        'OtherworldlyWings',
+        'UnearthlyRecovery',
+    ),
+    'Sorceror (Draconic Bloodline)': (
+        'DraconicPresence',
+        'DraconicResilience',
+        'DragonAncestor',
+        'DragonWings',
+        'ElementalAffinity',
+    ),
+    'Sorceror (Metamagic)': (
+        'CarefulSpell',
+        'DistantSpell',
+        'EmpoweredSpell',
+        'ExtendedSpell',
+        'HeightenedSpell',
+        'Metamagic',
+        'QuickenedSpell',
+        'SubtleSpell',
+        'TwinnedSpell',
+    ),
+    'Sorceror (Shadow Magic)': (
+        'EyesOfTheDark',
+        'HoundOfIllOmen',
+        'ShadowWalk',
+        'StrengthOfTheGrave',
+        'UmbralForm',
+    ),
+    'Sorceror (Storm Sorcery)': (
+        'HeartOfTheStorm',
+        'StormGuide',
+        'StormsFury',
+        'TempestuousMagic',
+        'WindSoul',
+    ),
+    'Sorceror (Wild Magic)': (
+        'BendLuck',
+        'ControlledChaos',
+        'SpellBombardment',
+        'TidesOfChaos',
+        'WildMagicSurge',
+    ),
+    'Warlock': (
+        'EldritchInvocation',
+        'EldritchMaster',
+        'MysticArcanum',
+        'PactBoon',
+        'PactOfTheBlade',
+        'PactOfTheChain',
+        'PactOfTheTome',
+    ),
+    'Warlock (Archfey Patron)': (
+        'BeguilingDefenses',
+        'DarkDelirium',
+        'FeyPresence',
+        'MistyEscape',
+    ),
+    'Warlock (Eldritch Invocations)': (
+        'AgonizingBlast',
+        'ArmorOfShadows',
+        'AscendantStep',
+        'AspectOfTheMoon',
+        'BeastSpeech',
+        'BeguilingInfluence',
+        'BewitchingWhispers',
+        'BookOfAncientSecrets',
+        'ChainsOfCarceri',
+        'CloakOfFlies',
+        'DevilsSight',
+        'DreadfulWord',
+        'EldritchSight',
+        'EldritchSmite',
+        'EldritchSpear',
+        'EyesOfTheRuneKeeper',
+        'FiendishVigor',
+        'GazeOfTwoMinds',
+        'GhostlyGaze',
+        'GiftOfTheDepths',
+        'GiftOfTheEverLivingOnes',
+        'GraspOfHadar',
+        'ImprovedPactWeapon',
+        'Invocation',
+        'LanceOfLethargy',
+        'LifeDrinker',
+        'MaddeningHex',
+        'MaskOfManyFaces',
+        'MasterOfMyriadForms',
+        'MinionsOfChaos',
+        'MireTheMind',
+        'MistyVisions',
+        'OneWithShadows',
+        'OtherworldlyLeap',
+        'RelentlessHex',
+        'RepellingBlast',
+        'SculptorOfFlesh',
+        'ShroudOfShadow',
+        'SignOfIllOmen',
+        'ThiefOfFiveFates',
+        'ThirstingBlade',
+        'TombOfLevistus',
+        'TrickstersEscape',
+        'VisionsOfDistantRealms',
+        'VoiceOfTheChainMaster',
+        'WhispersOfTheGrave',
+        'WitchSight',
+    ),
+    'Warlock (Great Old One Patron)': (
+        'AwakenedMind',
+        'CreateThrall',
+        'EntropicWard',
+        'ThoughtShield',
+    ),
+    'Warlock (Hexblade)': (
+        'AccursedSpecter',
+        'ArmorOfHexes',
+        'HexWarrior',
+        'HexbladesCurse',
+        'MasterOfHexes',
+    ),
+    'Warlock (The Celestial Patron)': (
+        'CelestialResilience',
+        'HealingLight',
+        'SearingVengeance',
+    ),
+    'Warlock (The Fiend Patron)': (
+        'DarkOnesBlessing',
+        'DarkOnesOwnLuck',
+        'FiendishResilience',
+        'HurlThroughHell',
+    ),
+    'Warlock (The Undying Patron)': (
+        'AmongTheDead',
+        'DefyDeath',
+        'IndestructibleLife',
+        'UndyingNature',
+    ),
+    'Wizard': (
+        'ArcaneRecovery',
+        'SignatureSpells',
+        'SpellMastery',
+    ),
+    'Wizard (School of Abjuration)': (
+        'AbjurationSavant',
+        'ArcaneWard',
+        'ImprovedAbjuration',
+        'ProjectedWard',
+        'SpellResistance',
+    ),
+    'Wizard (School of Bladesinging)': (
+        'Bladesong',
+        'ExtraAttackBladesinging',
+        'SongOfDefense',
+        'SongOfVictory',
+    ),
+    'Wizard (School of Conjuration)': (
+        'BenignTransposition',
+        'ConjurationSavant',
+        'DurableSummons',
+        'FocusedConjuration',
+        'MinorIllusion',
+    ),
+    'Wizard (School of Divination)': (
+        'DivinationSavant',
+        'ExpertDivination',
+        'GreaterPortent',
+        'Portent',
+        'TheThirdEye',
+    ),
+    'Wizard (School of Enchanment)': (
+        'AlterMemories',
+        'InstinctiveGaze',
+        'SplitEnchantment',
+    ),
+    'Wizard (School of Enchantment)': (
+        'EnchantmentSavant',
+        'HypnoticGaze',
+    ),
+    'Wizard (School of Evocation)': (
+        'EmpoweredEvocation',
+        'EvocationSavant',
+        'Overchannel',
+        'PotentCantrip',
+        'SculptSpells',
+    ),
+    'Wizard (School of Illusion)': (
+        'IllusionSavant',
+        'IllusoryReality',
+        'IllusorySelf',
+        'ImprovedMinorIllusion',
+        'MalleableIllusions',
+    ),
+    'Wizard (School of Necromancy)': (
+        'CommandUndead',
+        'GrimHarvest',
+        'InuredToUndeath',
+        'NecromancySavant',
+        'UndeadThralls',
+    ),
+    'Wizard (School of Transmutation)': (
+        'MasterTransmuter',
+        'MinorAlchemy',
+        'Shapechanger',
+        'TransmutationSavant',
+        'TransmutersStone',
+    ),
+    'Wizard (School of War Magic)': (
+        'ArcaneDeflection',
+        'DeflectingShroud',
+        'DurableMagic',
+        'PowerSurge',
+        'TacticalWit',
+    ),
+}
@@ -1,4 +1,6 @@
-from .. import weapons
+from collections import defaultdict
+
+from .. import weapons, spells
 
 
 def create_feature(**params):
@@ -34,14 +36,16 @@ class Feature():
 
     def __init__(self, owner=None):
         self.owner = owner
-        self.spells_known = [S() for S in self.spells_known]
-        self.spells_prepared = [S() for S in self.spells_prepared]
+        self.spells_known = [spells.canonical_spell(S)
+                             for S in self.spells_known]
+        self.spells_prepared = [spells.canonical_spell(S)
+                                for S in self.spells_prepared]
 
     def __eq__(self, other):
         return (self.name == other.name) and (self.source == other.source)
 
     def __hash__(self):
-        return 0
+        return hash((self.name, self.source))
 
     def __str__(self):
         return self.name
@@ -86,3 +90,57 @@ class FeatureSelector(Feature):
                 new_feat = feat_class(owner=owner)
                 new_feat.source = t.source
         return new_feat
+
+
+class FeaturesByLevel(defaultdict):
+    """The features for each level of a class or race, instantiated lazily.
+    
+    Features for a given level are only created when that level is
+    first requested, so a low-level character does not pay for
+    features it will never have. Additional sources (eg. a subclass)
+    can be added after creation with ``add_source()``.
+    
+    Parameters
+    ----------
+    owner
+      The character that the features belong to.
+    sources
+      Mappings of level to a list of ``Feature`` subclasses.
+    feature_choices
+      Selections to resolve any ``FeatureSelector`` features.
+    
+    """
+    def __init__(self, owner, sources=(), feature_choices=()):
+        super().__init__(list)
+        self.owner = owner
+        self.sources = list(sources)
+        self.feature_choices = feature_choices
+    
+    def _instantiate(self, source, level):
+        fs = []
+        for f in source.get(level, ()):
+            if issubclass(f, FeatureSelector):
+                fs.append(f(owner=self.owner,
+                            feature_choices=self.feature_choices))
+            elif issubclass(f, Feature):
+                fs.append(f(owner=self.owner))
+        return fs
+    
+    def add_source(self, source):
+        """Add features from ``source``, a mapping of level to
+        ``Feature`` subclasses."""
+        self.sources.append(source)
+        # Levels that were already created get the new features too.
+        # Resolving a FeatureSelector may create more levels, which
+        # already include the new source.
+        for level, fs in list(self.items()):
+            fs.extend(self._instantiate(source, level))
+    
+    def __missing__(self, level):
+        # Store the list before filling it, since resolving a
+        # FeatureSelector may look up the owner's features again
+        fs = []
+        self[level] = fs
+        for source in self.sources:
+            fs.extend(self._instantiate(source, level))
+        return fs
@@ -96,7 +96,7 @@ class Dueling(Feature):
         +2 attack roll bonus if melee weapon is not two handed
         """
         if (isinstance(weapon, weapons.MeleeWeapon)
-                and "two-handed" not in weapon.properties.lower()):
+                and not weapon.property_flags & weapons.WeaponProperty.TWO_HANDED):
             weapon.damage_bonus += 2
 
     
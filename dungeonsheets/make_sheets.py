@@ -6,17 +6,23 @@ import argparse
 import importlib.util
 import os
 import subprocess
+import sys
 import warnings
 import re
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from io import StringIO
+from itertools import repeat
 
 from fdfgen import forge_fdf
 import pdfrw
-from jinja2 import Environment, PackageLoader
 
 from . import character as _char
-from . import exceptions, classes
+from . import exceptions, classes, startup_profile
 from .stats import mod_str
+from .cache import jinja_bytecode_cache
 
 
 """Program to take character definitions and build a PDF of the
@@ -45,15 +51,41 @@ def rst_to_latex(rst):
     return tex
 
 
-jinja_env = Environment(
-    loader=PackageLoader('dungeonsheets', 'forms'),
-    block_start_string='[%',
-    block_end_string='%]',
-    variable_start_string='[[',
-    variable_end_string=']]',
-)
-jinja_env.filters['rst_to_latex'] = rst_to_latex
-jinja_env.filters['mod_str'] = mod_str
+def create_jinja_env():
+    """Prepare a jinja environment for rendering LaTeX templates.
+    
+    Compiled templates are stored in a bytecode cache, so they are
+    only parsed again when the template changes. Most code should use
+    the shared environment from ``latex_env()`` instead.
+    
+    """
+    from jinja2 import Environment, PackageLoader
+    env = Environment(
+        loader=PackageLoader('dungeonsheets', 'forms'),
+        block_start_string='[%',
+        block_end_string='%]',
+        variable_start_string='[[',
+        variable_end_string=']]',
+        bytecode_cache=jinja_bytecode_cache(),
+    )
+    env.filters['rst_to_latex'] = rst_to_latex
+    env.filters['mod_str'] = mod_str
+    return env
+
+
+@lru_cache(maxsize=None)
+def latex_env():
+    """The shared jinja environment for LaTeX templates, created on
+    first use."""
+    return create_jinja_env()
+
+
+def __getattr__(name):
+    # ``jinja_env`` used to be created on import, so keep it working
+    # for existing code without paying for it up front
+    if name == 'jinja_env':
+        return latex_env()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 CHECKBOX_ON = 'Yes'
@@ -70,23 +102,37 @@ def text_box(string):
     return new_string
 
 
-def create_druid_shapes_pdf(character, basename):
-    template = jinja_env.get_template('druid_shapes_template.tex')
-    return create_latex_pdf(character, basename, template)
+def prepare_sheet(character):
+    """Compute the snapshot of values shown on the character's sheets.
+    
+    Characters without weapons get an unarmed strike so the attack
+    section of the character sheet isn't blank.
+    
+    """
+    if len(character.weapons) == 0:
+        character.wield_weapon('unarmed')
+    return character.compute_sheet()
+
+
+def create_druid_shapes_pdf(character, basename, sheet=None):
+    template = latex_env().get_template('druid_shapes_template.tex')
+    return create_latex_pdf(character, basename, template, sheet=sheet)
 
 
-def create_spellbook_pdf(character, basename):
-    template = jinja_env.get_template('spellbook_template.tex')
-    return create_latex_pdf(character, basename, template)
+def create_spellbook_pdf(character, basename, sheet=None):
+    template = latex_env().get_template('spellbook_template.tex')
+    return create_latex_pdf(character, basename, template, sheet=sheet)
 
 
-def create_features_pdf(character, basename):
-    template = jinja_env.get_template('features_template.tex')
-    return create_latex_pdf(character, basename, template)
+def create_features_pdf(character, basename, sheet=None):
+    template = latex_env().get_template('features_template.tex')
+    return create_latex_pdf(character, basename, template, sheet=sheet)
 
 
-def create_latex_pdf(character, basename, template):
-    tex = template.render(character=character)
+def create_latex_pdf(character, basename, template, sheet=None):
+    if sheet is None:
+        sheet = character.compute_sheet()
+    tex = template.render(character=character, sheet=sheet)
     # Create tex document
     tex_file = f'{basename}.tex'
     with open(tex_file, mode='w') as f:
@@ -117,35 +163,36 @@ def create_latex_pdf(character, basename, template):
             raise exceptions.LatexError(f'Processing of {basename}.tex failed.')
 
 
-def create_spells_pdf(character, basename, flatten=False):
+def create_spells_pdf(character, basename, flatten=False, sheet=None):
+    if sheet is None:
+        sheet = character.compute_sheet()
     classes_and_levels = ' / '.join([c.name + ' ' + str(c.level)
-                                     for c in character.spellcasting_classes])
-    abilities = ' / '.join([c.spellcasting_ability.upper()[:3]
-                            for c in character.spellcasting_classes])
-    DCs = ' / '.join([str(character.spell_save_dc(c))
-                      for c in character.spellcasting_classes])
-    bonuses = ' / '.join([mod_str(character.spell_attack_bonus(c))
-                          for c in character.spellcasting_classes])
-    spell_level = lambda x : (x or 0)
+                                     for c in sheet.spellcasting])
+    abilities = ' / '.join([c.ability.upper()[:3]
+                            for c in sheet.spellcasting])
+    DCs = ' / '.join([str(c.save_dc) for c in sheet.spellcasting])
+    bonuses = ' / '.join([mod_str(c.attack_bonus)
+                          for c in sheet.spellcasting])
+    slots = sheet.spell_slots
     fields = {
         'Spellcasting Class 2': classes_and_levels,
         'SpellcastingAbility 2': abilities,
         'SpellSaveDC  2': DCs,
         'SpellAtkBonus 2': bonuses,
         # Number of spell slots
-        'SlotsTotal 19': spell_level(character.spell_slots(1)),
-        'SlotsTotal 20': spell_level(character.spell_slots(2)),
-        'SlotsTotal 21': spell_level(character.spell_slots(3)),
-        'SlotsTotal 22': spell_level(character.spell_slots(4)),
-        'SlotsTotal 23': spell_level(character.spell_slots(5)),
-        'SlotsTotal 24': spell_level(character.spell_slots(6)),
-        'SlotsTotal 25': spell_level(character.spell_slots(7)),
-        'SlotsTotal 26': spell_level(character.spell_slots(8)),
-        'SlotsTotal 27': spell_level(character.spell_slots(9)),
+        'SlotsTotal 19': slots[1],
+        'SlotsTotal 20': slots[2],
+        'SlotsTotal 21': slots[3],
+        'SlotsTotal 22': slots[4],
+        'SlotsTotal 23': slots[5],
+        'SlotsTotal 24': slots[6],
+        'SlotsTotal 25': slots[7],
+        'SlotsTotal 26': slots[8],
+        'SlotsTotal 27': slots[9],
     }
     # Cantrips
     cantrip_fields = (f'Spells 10{i}' for i in (14, 16, 17, 18, 19, 20, 21, 22))
-    cantrips = (spl for spl in character.spells if spl.level == 0)
+    cantrips = (spl for spl in sheet.spells if spl.level == 0)
     for spell, field_name in zip(cantrips, cantrip_fields):
         fields[field_name] = str(spell)
     # Spells for each level
@@ -172,13 +219,12 @@ def create_spells_pdf(character, basename, flatten=False):
         9: (327, 326, 3079, 3080, 3081, 3082, 3083, ),
     }
     for level in field_numbers.keys():
-        spells = tuple(spl for spl in character.spells if spl.level == level)
+        spells = tuple(spl for spl in sheet.spells if spl.level == level)
         field_names = tuple(f'Spells {i}' for i in field_numbers[level])
         prep_names = tuple(f'Check Box {i}' for i in prep_numbers[level])
         for spell, field, chk_field in zip(spells, field_names, prep_names):
             fields[field] = str(spell)
-            is_prepared = any([spell == Spl
-                               for Spl in character.spells_prepared])
+            is_prepared = spell in sheet.spells_prepared
             fields[chk_field] = CHECKBOX_ON if is_prepared else CHECKBOX_OFF
         # # Uncomment to post field names instead:
         # for field in field_names:
@@ -189,78 +235,82 @@ def create_spells_pdf(character, basename, flatten=False):
     make_pdf(fields, src_pdf=src_pdf, basename=basename, flatten=flatten)
 
 
-def create_character_pdf(character, basename, flatten=False):
+def create_character_pdf(character, basename, flatten=False, sheet=None):
+    if sheet is None:
+        sheet = prepare_sheet(character)
+    abilities = sheet.abilities
+    skills = sheet.skills
     # Prepare the list of fields
     fields = {
         # Character description
-        'CharacterName': character.name,
-        'ClassLevel': character.classes_and_levels,
-        'Background': str(character.background),
-        'PlayerName': character.player_name,
-        'Race ': str(character.race),
-        'Alignment': character.alignment,
-        'XP': str(character.xp),
-        'Inspiration': str(character.inspiration),
+        'CharacterName': sheet.name,
+        'ClassLevel': sheet.classes_and_levels,
+        'Background': sheet.background,
+        'PlayerName': sheet.player_name,
+        'Race ': sheet.race,
+        'Alignment': sheet.alignment,
+        'XP': str(sheet.xp),
+        'Inspiration': str(sheet.inspiration),
         # Abilities
-        'ProfBonus': mod_str(character.proficiency_bonus),
-        'STRmod': str(character.strength.value),
-        'STR': mod_str(character.strength.modifier),
-        'DEXmod ': str(character.dexterity.value),
-        'DEX': mod_str(character.dexterity.modifier),
-        'CONmod': str(character.constitution.value),
-        'CON': mod_str(character.constitution.modifier),
-        'INTmod': str(character.intelligence.value),
-        'INT': mod_str(character.intelligence.modifier),
-        'WISmod': str(character.wisdom.value),
-        'WIS': mod_str(character.wisdom.modifier),
-        'CHamod': str(character.charisma.value),
-        'CHA': mod_str(character.charisma.modifier),
-        'AC': str(character.armor_class),
-        'Initiative': str(character.initiative),
-        'Speed': str(character.speed),
-        'Passive': 10 + character.perception,
+        'ProfBonus': mod_str(sheet.proficiency_bonus),
+        'STRmod': str(abilities.strength.value),
+        'STR': mod_str(abilities.strength.modifier),
+        'DEXmod ': str(abilities.dexterity.value),
+        'DEX': mod_str(abilities.dexterity.modifier),
+        'CONmod': str(abilities.constitution.value),
+        'CON': mod_str(abilities.constitution.modifier),
+        'INTmod': str(abilities.intelligence.value),
+        'INT': mod_str(abilities.intelligence.modifier),
+        'WISmod': str(abilities.wisdom.value),
+        'WIS': mod_str(abilities.wisdom.modifier),
+        'CHamod': str(abilities.charisma.value),
+        'CHA': mod_str(abilities.charisma.modifier),
+        'AC': str(sheet.armor_class),
+        'Initiative': str(sheet.initiative),
+        'Speed': str(sheet.speed),
+        'Passive': sheet.passive_perception,
         # Saving throws (proficiencies handled later)
-        'ST Strength': mod_str(character.strength.saving_throw),
-        'ST Dexterity': mod_str(character.dexterity.saving_throw),
-        'ST Constitution': mod_str(character.constitution.saving_throw),
-        'ST Intelligence': mod_str(character.intelligence.saving_throw),
-        'ST Wisdom': mod_str(character.wisdom.saving_throw),
-        'ST Charisma': mod_str(character.charisma.saving_throw),
+        'ST Strength': mod_str(abilities.strength.saving_throw),
+        'ST Dexterity': mod_str(abilities.dexterity.saving_throw),
+        'ST Constitution': mod_str(abilities.constitution.saving_throw),
+        'ST Intelligence': mod_str(abilities.intelligence.saving_throw),
+        'ST Wisdom': mod_str(abilities.wisdom.saving_throw),
+        'ST Charisma': mod_str(abilities.charisma.saving_throw),
         # Skills (proficiencies handled below)
-        'Acrobatics': mod_str(character.acrobatics),
-        'Animal': mod_str(character.animal_handling),
-        'Arcana': mod_str(character.arcana),
-        'Athletics': mod_str(character.athletics),
-        'Deception ': mod_str(character.deception),
-        'History ': mod_str(character.history),
-        'Insight': mod_str(character.insight),
-        'Intimidation': mod_str(character.intimidation),
-        'Investigation ': mod_str(character.investigation),
-        'Medicine': mod_str(character.medicine),
-        'Nature': mod_str(character.nature),
-        'Perception ': mod_str(character.perception),
-        'Performance': mod_str(character.performance),
-        'Persuasion': mod_str(character.persuasion),
-        'Religion': mod_str(character.religion),
-        'SleightofHand': mod_str(character.sleight_of_hand),
-        'Stealth ': mod_str(character.stealth),
-        'Survival': mod_str(character.survival),
+        'Acrobatics': mod_str(skills.acrobatics),
+        'Animal': mod_str(skills.animal_handling),
+        'Arcana': mod_str(skills.arcana),
+        'Athletics': mod_str(skills.athletics),
+        'Deception ': mod_str(skills.deception),
+        'History ': mod_str(skills.history),
+        'Insight': mod_str(skills.insight),
+        'Intimidation': mod_str(skills.intimidation),
+        'Investigation ': mod_str(skills.investigation),
+        'Medicine': mod_str(skills.medicine),
+        'Nature': mod_str(skills.nature),
+        'Perception ': mod_str(skills.perception),
+        'Performance': mod_str(skills.performance),
+        'Persuasion': mod_str(skills.persuasion),
+        'Religion': mod_str(skills.religion),
+        'SleightofHand': mod_str(skills.sleight_of_hand),
+        'Stealth ': mod_str(skills.stealth),
+        'Survival': mod_str(skills.survival),
         # Hit points
-        'HDTotal': character.hit_dice,
-        'HPMax': str(character.hp_max),
+        'HDTotal': sheet.hit_dice,
+        'HPMax': str(sheet.hp_max),
         # Personality traits and other features
-        'PersonalityTraits ': text_box(character.personality_traits),
-        'Ideals': text_box(character.ideals),
-        'Bonds': text_box(character.bonds),
-        'Flaws': text_box(character.flaws),
-        'Features and Traits': text_box(character.features_text + character.features_and_traits),
+        'PersonalityTraits ': text_box(sheet.personality_traits),
+        'Ideals': text_box(sheet.ideals),
+        'Bonds': text_box(sheet.bonds),
+        'Flaws': text_box(sheet.flaws),
+        'Features and Traits': text_box(sheet.features_text + sheet.features_and_traits),
         # Inventory
-        'CP': character.cp,
-        'SP': character.sp,
-        'EP': character.ep,
-        'GP': character.gp,
-        'PP': character.pp,
-        'Equipment': text_box(character.magic_items_text + character.equipment),
+        'CP': sheet.cp,
+        'SP': sheet.sp,
+        'EP': sheet.ep,
+        'GP': sheet.gp,
+        'PP': sheet.pp,
+        'Equipment': text_box(sheet.magic_items_text + sheet.equipment),
     }
     # Check boxes for proficiencies
     ST_boxes = {
@@ -271,7 +321,7 @@ def create_character_pdf(character, basename, flatten=False):
         'wisdom': 'Check Box 21',
         'charisma': 'Check Box 22',
     }
-    for ability in character.saving_throw_proficiencies:
+    for ability in sheet.saving_throw_proficiencies:
         fields[ST_boxes[ability]] = CHECKBOX_ON
     # Add skill proficiencies
     skill_boxes = {
@@ -294,7 +344,7 @@ def create_character_pdf(character, basename, flatten=False):
         'stealth': 'Check Box 39',
         'survival': 'Check Box 40',
     }
-    for skill in character.skill_proficiencies:
+    for skill in sheet.skill_proficiencies:
         try:
             fields[skill_boxes[skill.replace(' ', '_').lower()]] = CHECKBOX_ON
         except KeyError:
@@ -303,23 +353,21 @@ def create_character_pdf(character, basename, flatten=False):
     weapon_fields = [('Wpn Name', 'Wpn1 AtkBonus', 'Wpn1 Damage'),
                      ('Wpn Name 2', 'Wpn2 AtkBonus ', 'Wpn2 Damage '),
                      ('Wpn Name 3', 'Wpn3 AtkBonus  ', 'Wpn3 Damage '),]
-    if len(character.weapons) == 0:
-        character.wield_weapon('unarmed')
-    for _fields, weapon in zip(weapon_fields, character.weapons):
+    for _fields, weapon in zip(weapon_fields, sheet.weapons):
         name_field, atk_field, dmg_field = _fields
         fields[name_field] = weapon.name
         fields[atk_field] = '{:+d}'.format(weapon.attack_modifier)
         fields[dmg_field] = f'{weapon.damage}/{weapon.damage_type}'
     # Other attack information
-    attack_str = f'Armor: {character.armor}'
+    attack_str = f'Armor: {sheet.armor}'
     attack_str += '\n \n'
-    attack_str += f'Shield: {character.shield}'
+    attack_str += f'Shield: {sheet.shield}'
     attack_str += '\n \n'
-    attack_str += character.attacks_and_spellcasting
+    attack_str += sheet.attacks_and_spellcasting
     fields['AttacksSpellcasting'] = text_box(attack_str)
     # Other proficiencies and languages
-    prof_text = "Proficiencies:\n" + text_box(character.proficiencies_text)
-    prof_text += "\n\nLanguages:\n" + text_box(character.languages)
+    prof_text = "Proficiencies:\n" + text_box(sheet.proficiencies_text)
+    prof_text += "\n\nLanguages:\n" + text_box(sheet.languages)
     fields['ProficienciesLang'] = prof_text
     # Prepare the actual PDF
     dirname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'forms/')
@@ -439,34 +487,38 @@ def make_sheet(character_file, character=None, flatten=False):
     """
     if character is None:
         character = _char.Character.load(character_file)
+    sheet = prepare_sheet(character)
     # Set the fields in the FDF
     char_base = os.path.splitext(character_file)[0] + '_char'
     sheets = [char_base + '.pdf']
     pages = []
     char_pdf = create_character_pdf(character=character, basename=char_base,
-                                    flatten=flatten)
+                                    flatten=flatten, sheet=sheet)
     pages.append(char_pdf)
-    if character.is_spellcaster:
+    if sheet.is_spellcaster:
         # Create spell sheet
         spell_base = '{:s}_spells'.format(
             os.path.splitext(character_file)[0])
-        create_spells_pdf(character=character, basename=spell_base, flatten=flatten)
+        create_spells_pdf(character=character, basename=spell_base,
+                          flatten=flatten, sheet=sheet)
         sheets.append(spell_base + '.pdf')
-    if len(character.features) > 0:
+    if len(sheet.features) > 0:
         feat_base = '{:s}_feats'.format(
             os.path.splitext(character_file)[0])
         try:
-            create_features_pdf(character=character, basename=feat_base)
+            create_features_pdf(character=character, basename=feat_base,
+                                sheet=sheet)
         except exceptions.LatexNotFoundError as e:
             log.warning('``pdflatex`` not available. Skipping features book '
                         f'for {character.name}')
         else:
             sheets.append(feat_base + '.pdf')
-    if character.is_spellcaster:
+    if sheet.is_spellcaster:
         # Create spell book
         spellbook_base = os.path.splitext(character_file)[0] + '_spellbook'
         try:
-            create_spellbook_pdf(character=character, basename=spellbook_base)
+            create_spellbook_pdf(character=character, basename=spellbook_base,
+                                 sheet=sheet)
         except exceptions.LatexNotFoundError as e:
             log.warning('``pdflatex`` not available. Skipping spellbook '
                         f'for {character.name}')
@@ -477,7 +529,8 @@ def make_sheet(character_file, character=None, flatten=False):
     if len(wild_shapes) > 0:
         shapes_base = os.path.splitext(character_file)[0] + '_wild_shapes'
         try:
-            create_druid_shapes_pdf(character=character, basename=shapes_base)
+            create_druid_shapes_pdf(character=character, basename=shapes_base,
+                                    sheet=sheet)
         except exceptions.LatexNotFoundError as e:
             log.warning('``pdflatex`` not available. Skipping wild shapes list '
                         f'for {character.name}')
@@ -517,25 +570,123 @@ def merge_pdfs(src_filenames, dest_filename, clean_up=False):
 load_character_file = _char.read_character_file
 
 
+# ``status`` is "done", "invalid" (not a character file) or "failed",
+# in which case ``error`` holds the reason.
+BuildResult = namedtuple('BuildResult', ('filename', 'status', 'error'))
+
+
+def _build_sheet(character_file, flatten):
+    """Build one character's PDF, catching any errors so that one
+    character can't stop the others."""
+    try:
+        make_sheet(character_file=character_file, flatten=flatten)
+    except exceptions.CharacterFileFormatError as e:
+        return BuildResult(character_file, 'invalid', str(e))
+    except Exception:
+        return BuildResult(character_file, 'failed', traceback.format_exc())
+    return BuildResult(character_file, 'done', None)
+
+
+def make_sheets(character_files, jobs=None, flatten=False):
+    """Prepare PDF character sheets for several characters at once.
+    
+    Each character is built in its own worker process, so most of the
+    time spent waiting for ``pdftk`` and ``pdflatex`` overlaps.
+    
+    Parameters
+    ----------
+    character_files : list
+        Files to load characters from, see ``make_sheet()``.
+    jobs : int, optional
+        How many characters to build at once. Defaults to the number
+        of CPUs.
+    flatten : bool, optional
+        If true, the resulting PDFs won't be fillable forms.
+    
+    Returns
+    -------
+    results : iterator
+        A ``BuildResult`` for each file, in the same order as
+        ``character_files``.
+    
+    """
+    if jobs is not None and jobs < 0:
+        raise ValueError(f'Number of jobs must be 0 or more, not {jobs}.')
+    character_files = list(character_files)
+    jobs = min(jobs or os.cpu_count() or 1, max(len(character_files), 1))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(_build_sheet, character_files, repeat(flatten))
+
+
+def _make_sheets_parallel(filenames, jobs, flatten, explicit):
+    """Build sheets on a process pool and report on each file, then
+    give a summary.
+    
+    Returns
+    -------
+    exit_code : int
+        1 if any files failed (or explicitly given files were invalid),
+        otherwise 0.
+    
+    """
+    counts = {'done': 0, 'invalid': 0, 'failed': 0}
+    for result in make_sheets(filenames, jobs=jobs, flatten=flatten):
+        print(f"Processing {os.path.splitext(result.filename)[0]}..."
+              f"{result.status}")
+        if result.status == 'failed' or (explicit and result.error):
+            print(result.error, file=sys.stderr)
+        counts[result.status] += 1
+    print(f"{counts['done']} built, {counts['invalid']} invalid, "
+          f"{counts['failed']} failed.")
+    if counts['failed'] or (explicit and counts['invalid']):
+        return 1
+    return 0
+
+
+def _job_count(value):
+    """Parse the ``--jobs`` option, which must be 0 or more."""
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f'must be 0 or more, not {jobs}')
+    return jobs
+
+
 def main():
     # Prepare an argument parser
     parser = argparse.ArgumentParser(
         description='Prepare Dungeons and Dragons character sheets as PDFs')
-    parser.add_argument('filename', type=str, nargs="?",
-                        help="Python file with character definition")
+    parser.add_argument('filename', type=str, nargs="*",
+                        help="Python file(s) with character definition")
     parser.add_argument('--editable', '-e', action="store_true",
                         help="Keep the PDF fields in place once processed.")
+    parser.add_argument('--jobs', '-j', type=_job_count, default=1, metavar='N',
+                        help="Build up to N characters at once in separate "
+                        "processes (0 means one per CPU).")
     parser.add_argument('--debug', '-d', action="store_true",
                         help="Provide verbose logging for debugging purposes.")
+    parser.add_argument('--profile-startup', action="store_true",
+                        help="Report the time and memory needed to import "
+                        "dungeonsheets and prepare templates, then exit.")
     args = parser.parse_args()
     # Prepare logging if necessary
     if args.debug:
         logging.basicConfig(level=logging.DEBUG)
+    # Report on start-up costs if requested
+    if args.profile_startup or os.environ.get(startup_profile.PROFILE_ENV):
+        report = startup_profile.format_report(startup_profile.profile_startup())
+        if args.profile_startup:
+            print(report)
+            return
+        print(report, file=sys.stderr)
     # Process the requested files
-    if args.filename is None:
+    if not args.filename:
         filenames = [f for f in os.listdir('.') if os.path.splitext(f)[1] == '.py']
     else:
-        filenames = [args.filename]
+        filenames = args.filename
+    if args.jobs != 1 and len(filenames) > 1:
+        return _make_sheets_parallel(filenames, jobs=args.jobs,
+                                     flatten=(not args.editable),
+                                     explicit=bool(args.filename))
     for filename in filenames:
         print(f"Processing {os.path.splitext(filename)[0]}...", end='')
         try:
@@ -553,4 +704,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Generate the name indexes used to lazily import large packages.
+
+Packages like ``dungeonsheets.spells`` are split into many modules,
+most of which are not needed for any given character. Rather than
+importing all of them up front, the package looks up which module
+defines a name in a generated index and only imports that module
+when the name is first requested.
+
+After adding, removing or renaming classes in these packages, update
+the indexes with::
+
+    $ python -m dungeonsheets.module_index
+
+"""
+
+import ast
+import importlib
+import os
+
+
+# Feature modules, in order of precedence: if two modules define a
+# feature with the same name, the later one is used.
+FEATURE_MODULES = ['barbarian', 'bard', 'cleric', 'druid', 'fighter', 'monk',
+                   'paladin', 'ranger', 'rogue', 'sorceror', 'warlock',
+                   'wizard', 'races', 'backgrounds', 'feats']
+
+HEADER = ('# This file is generated by "python -m dungeonsheets.module_index".\n'
+          '# Do not edit it directly.\n')
+
+
+def import_lazy_name(namespace, index, name):
+    """Import ``name`` into a lazily-loaded package.
+
+    Intended to be called from the package's module-level
+    ``__getattr__``. Every name from the same module is saved into the
+    package's namespace, so they will not need to be looked up again.
+    Names that are already in the namespace (eg. content registered
+    by ``content.load_content()``) are kept.
+
+    Parameters
+    ----------
+    namespace : dict
+      The package's ``globals()``.
+    index : dict
+      Maps each public name to the module (relative to the package)
+      that defines it.
+    name : str
+      The name being requested.
+
+    """
+    package = namespace['__name__']
+    try:
+        module_name = index[name]
+    except KeyError:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{module_name}', package)
+    for attr, mod in index.items():
+        if mod == module_name:
+            namespace.setdefault(attr, getattr(module, attr))
+    return namespace[name]
+
+
+def package_dir(package):
+    """The directory containing the source of ``package``, without
+    importing it."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(root, *package.split('.'))
+
+
+def module_names(package, prefix):
+    """The (sorted) names of the modules in ``package`` that start with
+    ``prefix``."""
+    names = [os.path.splitext(f)[0] for f in os.listdir(package_dir(package))
+             if f.startswith(prefix) and f.endswith('.py')]
+    return sorted(names)
+
+
+def public_names(filename):
+    """Top-level public classes and variables defined in a source file.
+
+    The file is parsed but not executed.
+
+    """
+    with open(filename, encoding='utf-8') as fp:
+        tree = ast.parse(fp.read(), filename=filename)
+    names = []
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            targets = [node.name]
+        elif isinstance(node, ast.Assign):
+            targets = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        else:
+            continue
+        names.extend(t for t in targets if not t.startswith('_'))
+    return names
+
+
+def build_index(package, modules):
+    """Map each public name in the ``modules`` of ``package`` to the
+    module that defines it.
+
+    Returns
+    -------
+    index : dict
+      Keys are names (eg. ``"Fireball"``), values are module names
+      relative to ``package`` (eg. ``"spells_f"``).
+
+    """
+    index = {}
+    for module in modules:
+        filename = os.path.join(package_dir(package), f'{module}.py')
+        for name in public_names(filename):
+            index[name] = module
+    return index
+
+
+def build_source_index(package, index):
+    """Group the names in ``index`` by the ``source`` attribute of the
+    objects they refer to.
+
+    Unlike ``build_index()``, this imports the modules.
+
+    """
+    sources = {}
+    for name, module_name in sorted(index.items()):
+        module = importlib.import_module(f'{package}.{module_name}')
+        source = getattr(getattr(module, name), 'source', None)
+        if isinstance(source, str):
+            sources.setdefault(source, []).append(name)
+    return {source: tuple(names) for source, names in sources.items()}
+
+
+def spell_indexes():
+    package = 'dungeonsheets.spells'
+    modules = module_names(package, 'spells_')
+    return {'SPELL_MODULES': build_index(package, modules)}
+
+
+def feature_indexes():
+    package = 'dungeonsheets.features'
+    modules = build_index(package, FEATURE_MODULES)
+    return {'FEATURE_MODULES': modules,
+            'FEATURE_SOURCES': build_source_index(package, modules)}
+
+
+# Index module -> function that builds the variables saved in it
+INDEXES = {
+    'dungeonsheets.spells.spell_index': spell_indexes,
+    'dungeonsheets.features.feature_index': feature_indexes,
+}
+
+
+def render_index(variables):
+    """Source code for an index module."""
+    src = HEADER
+    for variable, index in variables.items():
+        src += f'\n{variable} = {{\n'
+        for key, value in sorted(index.items()):
+            if isinstance(value, tuple):
+                items = ''.join(f'        {v!r},\n' for v in value)
+                src += f'    {key!r}: (\n{items}    ),\n'
+            else:
+                src += f'    {key!r}: {value!r},\n'
+        src += '}\n'
+    return src
+
+
+def write_indexes():
+    """Re-generate the index module for each lazily-loaded package."""
+    for index_module, build in INDEXES.items():
+        package, _, module = index_module.rpartition('.')
+        filename = os.path.join(package_dir(package), f'{module}.py')
+        variables = build()
+        with open(filename, mode='w', encoding='utf-8') as fp:
+            fp.write(render_index(variables))
+        print(f'Wrote {", ".join(variables)} to {filename}')
+
+
+if __name__ == '__main__':
+    write_indexes()
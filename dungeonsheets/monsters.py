@@ -2,9 +2,48 @@
 shape forms."""
 
 
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
 from .stats import Ability
 
 
+SIZES = ('tiny', 'small', 'medium', 'large', 'huge', 'gargantuan')
+
+_description_re = re.compile(
+    r'\s*(?P<size>' + '|'.join(SIZES) + r')?\s*'
+    r'(?P<swarm>swarm of (?:' + '|'.join(SIZES) + r')\s+)?'
+    r'(?P<type>[a-z]+)')
+
+
+@lru_cache(maxsize=None)
+def parse_description(description):
+    """Read the size and creature type from a monster's description.
+    
+    Parameters
+    ----------
+    description : str
+      Eg. "Medium swarm of tiny beasts, unaligned".
+    
+    Returns
+    -------
+    size : str
+      Eg. "medium", or "" if no size is given.
+    creature_type : str
+      Eg. "beast", or "" if the description is empty.
+    
+    """
+    match = _description_re.match(description.lower())
+    if match is None:
+        return '', ''
+    creature_type = match.group('type')
+    if match.group('swarm') and creature_type.endswith('s'):
+        creature_type = creature_type[:-1]
+    return (match.group('size') or ''), creature_type
+
+
 class Monster():
     """A monster that may be encountered when adventuring."""
     name = "Generic Monster"
@@ -26,10 +65,17 @@ class Monster():
     hp_max = 10
     hit_dice = '1d6'
     
+    @property
+    def size(self):
+        return parse_description(self.description)[0]
+    
+    @property
+    def creature_type(self):
+        return parse_description(self.description)[1]
+    
     @property
     def is_beast(self):
-        is_beast = 'beast' in self.description.lower()
-        return is_beast
+        return self.creature_type == 'beast'
 
 
 class Ankylosaurus(Monster):
@@ -279,3 +325,83 @@ class Wolf(Monster):
     speed = 40
     hp_max = 11
     hit_dice = '2d8+2'
+
+
+class MonsterIndex():
+    """Monsters sorted by challenge rating, for fast range queries.
+    
+    The creature type and movement of each monster are read once, when
+    the index is built.
+    
+    Parameters
+    ----------
+    monster_classes
+      The ``Monster`` subclasses to index.
+    
+    """
+    def __init__(self, monster_classes):
+        monster_classes = sorted(monster_classes,
+                                 key=lambda M: (M.challenge_rating, M.name))
+        self.monsters = tuple(monster_classes)
+        self.challenge_ratings = [M.challenge_rating for M in self.monsters]
+        self.creature_types = tuple(parse_description(M.description)[1]
+                                    for M in self.monsters)
+        self.swim_speeds = tuple(M.swim_speed for M in self.monsters)
+        self.fly_speeds = tuple(M.fly_speed for M in self.monsters)
+    
+    def __len__(self):
+        return len(self.monsters)
+    
+    def find(self, max_cr=None, min_cr=None, creature_type=None,
+             max_swim=None, max_fly=None):
+        """Find monsters that meet all the given limits.
+        
+        Limits that are None are not checked.
+        
+        Parameters
+        ----------
+        max_cr, min_cr : optional
+          Range of challenge ratings, inclusive.
+        creature_type : optional
+          Eg. "beast".
+        max_swim, max_fly : optional
+          Fastest allowed swimming and flying speeds.
+        
+        Returns
+        -------
+        monsters : list
+          ``Monster`` subclasses, sorted by challenge rating and name.
+        
+        """
+        start = 0 if min_cr is None else bisect_left(self.challenge_ratings, min_cr)
+        stop = (len(self.monsters) if max_cr is None
+                else bisect_right(self.challenge_ratings, max_cr))
+        found = []
+        for i in range(start, stop):
+            if ((creature_type is None or self.creature_types[i] == creature_type)
+                and (max_swim is None or self.swim_speeds[i] <= max_swim)
+                and (max_fly is None or self.fly_speeds[i] <= max_fly)):
+                found.append(self.monsters[i])
+        return found
+
+
+_monster_index = (None, None)
+
+
+def monster_index():
+    """The ``MonsterIndex`` of all the monsters in this module.
+    
+    The index is re-built if monsters have been added to the module
+    since it was last built.
+    
+    """
+    global _monster_index
+    namespace = vars(sys.modules[__name__])
+    size, index = _monster_index
+    if size != len(namespace):
+        index = MonsterIndex(
+            M for name, M in list(namespace.items())
+            if isinstance(M, type) and issubclass(M, Monster) and M is not Monster
+            and not name.startswith('_'))
+        _monster_index = (len(namespace), index)
+    return index
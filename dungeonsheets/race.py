@@ -24,17 +24,21 @@ class Race():
     charisma_bonus = 0
     hit_point_bonus = 0
     spells_known = ()
+    # Weapons (eg. claws) that every member of the race wields
+    natural_weapons = ()
 
     def __init__(self, owner=None):
         self.owner = owner
         cls = type(self)
         # Instantiate the features
         self.features = tuple([f(owner=self.owner) for f in cls.features])
-        self.features_by_level = defaultdict(list)
-        for i in range(1, 21):
-            self.features_by_level[i] = [f(owner=self.owner)for f in
-                                         cls.features_by_level[i]]
-        self.spells_known = [S() for S in cls.spells_known]
+        self.features_by_level = feats.FeaturesByLevel(
+            owner=self.owner, sources=[cls.features_by_level])
+        self.spells_known = [spells.canonical_spell(S)
+                             for S in cls.spells_known]
+        if self.owner is not None:
+            for weapon in cls.natural_weapons:
+                self.owner.wield_weapon(weapon)
 
     @property
     def spells_prepared(self):
@@ -305,16 +309,13 @@ class Lizardfolk(Race):
     wisdom_bonus = 1
     languages = ('Common', 'Draconic')
     weapon_proficiencies = (weapons.Bite,)
+    natural_weapons = (weapons.Bite,)
     proficiencies_text = ('bite',)
     features = (feats.CunningArtisan, feats.HoldBreath,
                 feats.NaturalArmor, feats.HungryJaws)
     skill_choices = ('animal handling', 'nature', 'perception',
                      'stealth', 'survival')
 
-    def __init__(self, owner=None):
-        super().__init__(owner=owner)
-        self.owner.wield_weapon("bite")
-
 
 # Kenku
 class Kenku(Race):
@@ -339,14 +340,11 @@ class Tabaxi(Race):
     speed = "30 (20 climb)"
     languages = ("Common", "[Choose One]")
     weapon_proficiencies = (weapons.Claws,)
+    natural_weapons = (weapons.Claws,)
     proficiences_text = ('Claws',)
     skill_proficiencies = ('perception', 'stealth')
     features = (feats.Darkvision, feats.FelineAgility,)
 
-    def __init__(self, owner=None):
-        super().__init__(owner=owner)
-        self.owner.wield_weapon("claws")
-
 
 # Triton
 class Triton(Race):
@@ -371,12 +369,9 @@ class Aarakocra(Race):
     wisdom_bonus = 1
     languages = ('Common', 'Aarakocra', 'Auran')
     weapon_proficiencies = (weapons.Talons,)
+    natural_weapons = (weapons.Talons,)
     proficiences_text = ('Talons',)
 
-    def __init__(self, owner=None):
-        super().__init__(owner=owner)
-        self.owner.wield_weapon("talons")
-
 
 # Genasi
 class _Genasi(Race):
@@ -0,0 +1,301 @@
+"""Full-text search over the rules text of spells, features, magic
+items and monsters.
+
+The rules text only exists in the docstrings of the game content
+classes. This module builds an inverted index of those docstrings:
+for each (stemmed) word, the documents that contain it and the word
+positions within them. Results are ranked with Okapi BM25, and
+phrases in double quotes only match if their words appear next to
+each other::
+
+    >>> from dungeonsheets import search
+    >>> search('"saving throw" radius')[0]
+    SearchResult(category='spells', attr='...', name='...', score=...)
+
+Like the catalog (see ``dungeonsheets.catalog``), the index is cached
+on disk and re-built whenever the sources change.
+
+"""
+
+import importlib
+import inspect
+import math
+import os
+import re
+from collections import namedtuple
+
+from .cache import cache_dir, load_json, write_json
+from .catalog import (CATEGORIES, catalog_fingerprint, _category_classes,
+                      _field_value)
+
+
+# Bump this whenever the structure of the index changes
+INDEX_FORMAT = 1
+
+INDEX_FILENAME = 'search_index.json'
+
+# Categories whose docstrings are indexed
+SEARCH_CATEGORIES = ('spells', 'features', 'magic_items', 'monsters')
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Extra weight (in multiples of the term's idf) for terms in the name
+NAME_BOOST = 2.0
+
+STOPWORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if',
+    'in', 'into', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the',
+    'this', 'to', 'was', 'when', 'which', 'with', 'you', 'your',
+])
+
+_SUFFIXES = ('ingly', 'ings', 'ing', 'edly', 'ied', 'ies', 'ed', 'es', 'ly',
+             's')
+
+_word_re = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_phrase_re = re.compile(r'"([^"]*)"')
+
+SearchResult = namedtuple('SearchResult', ('category', 'attr', 'name', 'score'))
+
+
+def stem(word):
+    """Reduce an English word to a crude stem, eg. "saving" -> "sav".
+
+    Only common suffixes are removed, so this is much simpler than a
+    full stemming algorithm, but it is applied the same way to the
+    documents and the query.
+
+    """
+    if word.endswith("'s"):
+        word = word[:-2]
+    for suffix in _SUFFIXES:
+        if (word.endswith(suffix) and len(word) - len(suffix) >= 3
+            and not (suffix == 's' and word[-2] in 'su')):
+            word = word[:-len(suffix)]
+            if suffix in ('ied', 'ies'):
+                word += 'y'
+            break
+    if len(word) > 3 and word.endswith('e'):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    """Split ``text`` into (position, term) pairs.
+
+    Terms are lower-case and stemmed. Stopwords are dropped, but still
+    count towards the positions of the words after them.
+
+    """
+    words = _word_re.findall(text.lower())
+    return [(pos, stem(word)) for pos, word in enumerate(words)
+            if word not in STOPWORDS]
+
+
+def parse_query(query):
+    """Split a query into phrases and loose terms.
+
+    Returns
+    -------
+    phrases : list
+      For each quoted phrase, a list of (offset, term) pairs.
+    terms : list
+      Every term in the query, including those inside phrases.
+
+    """
+    phrases = []
+    for phrase in _phrase_re.findall(query):
+        tokens = tokenize(phrase)
+        if len(tokens) > 1:
+            start = tokens[0][0]
+            phrases.append([(pos - start, term) for pos, term in tokens])
+    terms = [term for pos, term in tokenize(query.replace('"', ' '))]
+    return phrases, terms
+
+
+def index_fingerprint():
+    """Describes the sources and format of a search index."""
+    return dict(catalog_fingerprint(), index_format=INDEX_FORMAT)
+
+
+def build_index_data():
+    """Import the game content and index its docstrings.
+
+    Returns
+    -------
+    data : dict
+      JSON-serializable index, including its fingerprint.
+      "docs" holds ``[category, attr, name, length, name_length]``
+      for each document (the name is indexed as the first
+      ``name_length`` words), and "postings" maps each term to a flat list of
+      ``doc, count, pos1, pos2, ...`` runs.
+
+    """
+    docs = []
+    postings = {}
+    for category in SEARCH_CATEGORIES:
+        module, base, _ = CATEGORIES[category]
+        for attr, cls in _category_classes(module, base):
+            name = _field_value(cls, 'name') or attr
+            name_length = len(_word_re.findall(name.lower()))
+            text = f'{name}\n{inspect.cleandoc(cls.__doc__ or "")}'
+            tokens = tokenize(text)
+            doc_id = len(docs)
+            docs.append([category, attr, name, len(tokens), name_length])
+            positions = {}
+            for pos, term in tokens:
+                positions.setdefault(term, []).append(pos)
+            for term, term_positions in positions.items():
+                postings.setdefault(term, []).extend(
+                    [doc_id, len(term_positions), *term_positions])
+    return {'fingerprint': index_fingerprint(), 'docs': docs,
+            'postings': postings}
+
+
+class SearchIndex():
+    """An inverted index of the rules text, with ranked search."""
+    def __init__(self, data):
+        self.fingerprint = data['fingerprint']
+        self.docs = [tuple(doc) for doc in data['docs']]
+        self.postings = data['postings']
+        self.avg_length = (sum(doc[3] for doc in self.docs) / len(self.docs)
+                           if self.docs else 0)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __repr__(self):
+        return f'<SearchIndex: {len(self)} documents, {len(self.postings)} terms>'
+
+    def positions(self, term):
+        """The documents containing ``term``.
+
+        Returns
+        -------
+        positions : dict
+          Maps document number to a list of word positions.
+
+        """
+        flat = self.postings.get(term, ())
+        positions = {}
+        i = 0
+        while i < len(flat):
+            doc, count = flat[i], flat[i+1]
+            positions[doc] = flat[i+2:i+2+count]
+            i += 2 + count
+        return positions
+
+    def _has_phrase(self, doc, phrase, term_positions):
+        _, first = phrase[0]
+        for start in term_positions[first].get(doc, ()):
+            if all(start + offset in term_positions[term].get(doc, ())
+                   for offset, term in phrase[1:]):
+                return True
+        return False
+
+    def search(self, query, n=10, categories=None):
+        """Find the documents that best match ``query``.
+
+        Parameters
+        ----------
+        query : str
+          Words to search for. Words in double quotes must appear
+          together as a phrase.
+        n : optional
+          Maximum number of results.
+        categories : optional
+          Only return results from these categories (eg. "spells").
+
+        Returns
+        -------
+        results : list
+          ``SearchResult`` tuples, best match first.
+
+        """
+        phrases, terms = parse_query(query)
+        term_positions = {term: self.positions(term) for term in set(terms)}
+        num_docs = len(self.docs)
+        scores = {}
+        for term in terms:
+            docs = term_positions[term]
+            idf = math.log(1 + (num_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc, positions in docs.items():
+                tf = len(positions)
+                norm = K1 * (1 - B + B * self.docs[doc][3] / self.avg_length)
+                score = idf * tf * (K1 + 1) / (tf + norm)
+                if positions[0] < self.docs[doc][4]:
+                    score += NAME_BOOST * idf
+                scores[doc] = scores.get(doc, 0) + score
+        # Drop documents without the requested phrases
+        for phrase in phrases:
+            scores = {doc: score for doc, score in scores.items()
+                      if self._has_phrase(doc, phrase, term_positions)}
+        if categories is not None:
+            categories = {categories} if isinstance(categories, str) else set(categories)
+            scores = {doc: score for doc, score in scores.items()
+                      if self.docs[doc][0] in categories}
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [SearchResult(*self.docs[doc][:3], round(score, 4))
+                for doc, score in ranked[:n]]
+
+    def resolve(self, result):
+        """Import the class described by a search ``result``."""
+        module = importlib.import_module(CATEGORIES[result.category][0])
+        return getattr(module, result.attr)
+
+
+def index_path():
+    """Where the cached search index is stored."""
+    return os.path.join(cache_dir(), INDEX_FILENAME)
+
+
+def build_search_index(filename=None):
+    """Build the search index and save it to the cache."""
+    filename = filename or index_path()
+    data = build_index_data()
+    write_json(filename, data)
+    return SearchIndex(data)
+
+
+_loaded_indexes = {}
+
+
+def load_search_index(filename=None, rebuild=True):
+    """Load the cached search index, re-building it if it is out of
+    date.
+
+    Parameters
+    ----------
+    filename : optional
+      Path to the cached index. Defaults to ``search_index.json`` in
+      ``cache.cache_dir()``.
+    rebuild : optional
+      If true, a missing or out-of-date index will be re-built (which
+      imports all the game content), otherwise ``None`` is returned.
+
+    """
+    filename = filename or index_path()
+    fingerprint = index_fingerprint()
+    index = _loaded_indexes.get(filename)
+    if index is not None and index.fingerprint == fingerprint:
+        return index
+    data = load_json(filename, fingerprint, build_index_data, rebuild=rebuild)
+    if data is None:
+        return None
+    index = SearchIndex(data)
+    _loaded_indexes[filename] = index
+    return index
+
+
+def search(query, n=10, categories=None):
+    """Search the rules text of spells, features, magic items and
+    monsters.
+
+    See ``SearchIndex.search()`` for the parameters.
+
+    """
+    return load_search_index().search(query, n=n, categories=categories)
+
+
+if __name__ == '__main__':
+    print(build_search_index())
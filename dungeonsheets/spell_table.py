@@ -0,0 +1,220 @@
+"""Fast filtering of spells by their metadata.
+
+The spells in the catalog (see ``dungeonsheets.catalog``) are indexed
+column by column: for each possible value of a column (eg. each
+school, class or level) there is a bitset of the spells that have it.
+Bit ``i`` of a bitset is the ``i``-th spell in the table. A query combines bitsets with ``&`` and ``|``, so
+it never looks at individual spells until the results are collected::
+
+    >>> from dungeonsheets.spell_table import query_spells
+    >>> query_spells(level=range(1, 4), school='Divination', ritual=True,
+    ...              classes='Wizard')
+    [<class 'dungeonsheets.spells.spells_c.ComprehendLanguages'>, ...]
+
+"""
+
+import weakref
+
+from .catalog import load_catalog
+
+
+COMPONENTS = ('V', 'S', 'M')
+
+CASTING_TIMES = ('action', 'bonus action', 'reaction', 'minutes', 'hours',
+                 'special')
+
+
+def casting_time_category(casting_time):
+    """Sort a casting time (eg. "1 bonus action") into one of
+    ``CASTING_TIMES``."""
+    casting_time = casting_time.lower()
+    if 'bonus action' in casting_time:
+        return 'bonus action'
+    elif 'reaction' in casting_time:
+        return 'reaction'
+    elif 'action' in casting_time:
+        return 'action'
+    elif 'minute' in casting_time:
+        return 'minutes'
+    elif 'hour' in casting_time:
+        return 'hours'
+    return 'special'
+
+
+def iter_bits(bitset):
+    """The positions of the set bits in ``bitset``, lowest first."""
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+def _as_tuple(value):
+    if isinstance(value, (str, int)):
+        return (value,)
+    return tuple(value)
+
+
+class SpellTable():
+    """Bitsets of the spells with each value of their metadata.
+
+    Parameters
+    ----------
+    entries : sequence
+      ``catalog.SpellInfo`` tuples, one per spell.
+
+    Attributes
+    ----------
+    entries : tuple
+      The spells, in table order.
+
+    """
+    def __init__(self, entries):
+        self.entries = tuple(entries)
+        # Bitsets of the spells with each value of a column
+        self._all = (1 << len(self.entries)) - 1
+        self._by_level = {}
+        self._by_school = {}
+        self._by_component = {}
+        self._by_casting_time = {}
+        self._by_class = {}
+        self._ritual = 0
+        self._concentration = 0
+        for i, entry in enumerate(self.entries):
+            bit = 1 << i
+            self._add(self._by_level, entry.level, bit)
+            self._add(self._by_school, entry.magic_school.lower(), bit)
+            for c in entry.components:
+                self._add(self._by_component, c, bit)
+            self._add(self._by_casting_time,
+                      casting_time_category(entry.casting_time), bit)
+            for c in entry.classes:
+                self._add(self._by_class, c.lower(), bit)
+            if entry.ritual:
+                self._ritual |= bit
+            if entry.concentration:
+                self._concentration |= bit
+
+    @staticmethod
+    def _add(index, key, bit):
+        index[key] = index.get(key, 0) | bit
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f'<SpellTable: {len(self)} spells>'
+
+    @staticmethod
+    def _any_of(index, values, normalize=None):
+        bitset = 0
+        for value in _as_tuple(values):
+            if normalize is not None:
+                value = normalize(value)
+            bitset |= index.get(value, 0)
+        return bitset
+
+    def mask(self, level=None, school=None, ritual=None, concentration=None,
+             components=None, casting_time=None, classes=None):
+        """The bitset of the spells matching all of the given criteria.
+
+        Criteria that are None are ignored. Criteria that accept
+        several values match spells with any one of them.
+
+        Parameters
+        ----------
+        level : optional
+          A spell level, or several (eg. ``range(1, 4)``).
+        school : optional
+          Name of a magic school (eg. "Evocation"), or several.
+        ritual : optional
+          Whether the spell can be cast as a ritual.
+        concentration : optional
+          Whether the spell requires concentration.
+        components : optional
+          The components that the caster can provide (eg. "VS"). Only
+          spells that need no other components will match.
+        casting_time : optional
+          One of ``CASTING_TIMES``, or several.
+        classes : optional
+          Name of a character class (eg. "Wizard"), or several.
+
+        Returns
+        -------
+        bitset : int
+          Bit ``i`` is set if the ``i``-th spell matches.
+
+        """
+        bitset = self._all
+        if level is not None:
+            bitset &= self._any_of(self._by_level, level)
+        if school is not None:
+            bitset &= self._any_of(self._by_school, school, str.lower)
+        if ritual is not None:
+            bitset &= self._ritual if ritual else ~self._ritual
+        if concentration is not None:
+            bitset &= self._concentration if concentration else ~self._concentration
+        if components is not None:
+            for c in COMPONENTS:
+                if c not in components:
+                    bitset &= ~self._by_component.get(c, 0)
+        if casting_time is not None:
+            bitset &= self._any_of(self._by_casting_time, casting_time)
+        if classes is not None:
+            bitset &= self._any_of(self._by_class, classes, str.lower)
+        return bitset
+
+    def select(self, **criteria):
+        """The catalog entries of the matching spells.
+
+        Accepts the same criteria as ``mask()``. The spell modules are
+        not imported.
+
+        Returns
+        -------
+        entries : list
+          ``catalog.SpellInfo`` for each spell, in table order.
+
+        """
+        return [self.entries[i] for i in iter_bits(self.mask(**criteria))]
+
+    def query(self, **criteria):
+        """The spell classes matching the given criteria.
+
+        Accepts the same criteria as ``mask()``.
+
+        Returns
+        -------
+        spells : list
+          Subclasses of ``spells.Spell``, in table order.
+
+        """
+        from . import spells
+        return [getattr(spells, entry.attr) for entry in self.select(**criteria)]
+
+
+_tables = weakref.WeakKeyDictionary()
+
+
+def spell_table(catalog=None):
+    """The ``SpellTable`` for the spells in ``catalog``.
+
+    The table is built once per catalog. By default, the current
+    cached catalog is used (see ``catalog.load_catalog()``).
+
+    """
+    if catalog is None:
+        catalog = load_catalog()
+    try:
+        return _tables[catalog]
+    except KeyError:
+        return _tables.setdefault(catalog, SpellTable(catalog.spells))
+
+
+def query_spells(**criteria):
+    """The spell classes matching the given criteria.
+
+    See ``SpellTable.mask()`` for the available criteria.
+
+    """
+    return spell_table().query(**criteria)
@@ -1,27 +1,23 @@
-from .spells import Spell, create_spell
-from .spells_a import *
-from .spells_b import *
-from .spells_c import *
-from .spells_d import *
-from .spells_e import *
-from .spells_f import *
-from .spells_g import *
-from .spells_h import *
-from .spells_i import *
-from .spells_j import *
-from .spells_k import *
-from .spells_l import *
-from .spells_m import *
-from .spells_n import *
-from .spells_o import *
-from .spells_p import *
-from .spells_q import *
-from .spells_r import *
-from .spells_s import *
-from .spells_t import *
-from .spells_u import *
-from .spells_v import *
-from .spells_w import *
-from .spells_x import *
-from .spells_y import *
-from .spells_z import *
+"""Spells, one class per spell.
+
+The spells are split across modules ``spells_a`` to ``spells_z``,
+which are only imported when one of their spells is first requested
+(eg. ``spells.Fireball``). ``spell_index.py`` records which module
+defines each spell; re-generate it with ``python -m
+dungeonsheets.module_index`` after adding new spells.
+
+"""
+
+from .spells import Spell, create_spell, canonical_spell
+from .spell_index import SPELL_MODULES
+from ..module_index import import_lazy_name
+
+__all__ = ('Spell', 'create_spell', 'canonical_spell') + tuple(SPELL_MODULES)
+
+
+def __getattr__(name):
+    return import_lazy_name(globals(), SPELL_MODULES, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SPELL_MODULES))
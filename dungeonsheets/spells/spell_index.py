@@ -0,0 +1,465 @@
+# This file is generated by "python -m dungeonsheets.module_index".
+# Do not edit it directly.
+
+SPELL_MODULES = {
+    'AbiDalzimsHorridWilting': 'spells_a',
+    'AbsorbElements': 'spells_a',
+    'AcidSplash': 'spells_a',
+    'AganazzarsScorcher': 'spells_a',
+    'Aid': 'spells_a',
+    'Alarm': 'spells_a',
+    'AlterSelf': 'spells_a',
+    'AnimalFriendship': 'spells_a',
+    'AnimalMessenger': 'spells_a',
+    'AnimalShapes': 'spells_a',
+    'AnimateDead': 'spells_a',
+    'AnimateObjects': 'spells_a',
+    'AntilifeShell': 'spells_a',
+    'AntimagicField': 'spells_a',
+    'Antipathysympathy': 'spells_a',
+    'ArcaneEye': 'spells_a',
+    'ArcaneGate': 'spells_a',
+    'ArcaneLock': 'spells_a',
+    'ArmorOfAgathys': 'spells_a',
+    'ArmsOfHadar': 'spells_a',
+    'AstralProjection': 'spells_a',
+    'Augury': 'spells_a',
+    'AuraOfLife': 'spells_a',
+    'AuraOfPurity': 'spells_a',
+    'AuraOfVitality': 'spells_a',
+    'Awaken': 'spells_a',
+    'Bane': 'spells_b',
+    'BanishingSmite': 'spells_b',
+    'Banishment': 'spells_b',
+    'Barkskin': 'spells_b',
+    'BeaconOfHope': 'spells_b',
+    'BeastBond': 'spells_b',
+    'BeastSense': 'spells_b',
+    'BestowCurse': 'spells_b',
+    'BigbysHand': 'spells_b',
+    'BladeBarrier': 'spells_b',
+    'BladeWard': 'spells_b',
+    'Bless': 'spells_b',
+    'Blight': 'spells_b',
+    'BlindingSmite': 'spells_b',
+    'Blindnessdeafness': 'spells_b',
+    'Blink': 'spells_b',
+    'Blur': 'spells_b',
+    'BonesOfTheEarth': 'spells_b',
+    'BoomingBlade': 'spells_b',
+    'BrandingSmite': 'spells_b',
+    'BurningHands': 'spells_b',
+    'CallLightning': 'spells_c',
+    'CalmEmotions': 'spells_c',
+    'Catapult': 'spells_c',
+    'Catnap': 'spells_c',
+    'CauseFear': 'spells_c',
+    'Ceremony': 'spells_c',
+    'ChainLightning': 'spells_c',
+    'ChaosBolt': 'spells_c',
+    'CharmMonster': 'spells_c',
+    'CharmPerson': 'spells_c',
+    'ChillTouch': 'spells_c',
+    'ChromaticOrb': 'spells_c',
+    'CircleOfDeath': 'spells_c',
+    'CircleOfPower': 'spells_c',
+    'Clairvoyance': 'spells_c',
+    'Clone': 'spells_c',
+    'CloudOfDaggers': 'spells_c',
+    'Cloudkill': 'spells_c',
+    'ColorSpray': 'spells_c',
+    'Command': 'spells_c',
+    'Commune': 'spells_c',
+    'CommuneWithNature': 'spells_c',
+    'CompelledDuel': 'spells_c',
+    'ComprehendLanguages': 'spells_c',
+    'Compulsion': 'spells_c',
+    'ConeOfCold': 'spells_c',
+    'Confusion': 'spells_c',
+    'ConjureAnimals': 'spells_c',
+    'ConjureBarrage': 'spells_c',
+    'ConjureCelestial': 'spells_c',
+    'ConjureElemental': 'spells_c',
+    'ConjureFey': 'spells_c',
+    'ConjureMinorElementals': 'spells_c',
+    'ConjureVolley': 'spells_c',
+    'ConjureWoodlandBeings': 'spells_c',
+    'ContactOtherPlane': 'spells_c',
+    'Contagion': 'spells_c',
+    'Contingency': 'spells_c',
+    'ContinualFlame': 'spells_c',
+    'ControlFlames': 'spells_c',
+    'ControlWater': 'spells_c',
+    'ControlWeather': 'spells_c',
+    'ControlWinds': 'spells_c',
+    'CordonOfArrows': 'spells_c',
+    'Counterspell': 'spells_c',
+    'CreateBonfire': 'spells_c',
+    'CreateFoodAndWater': 'spells_c',
+    'CreateHomunculus': 'spells_c',
+    'CreateOrDestroyWater': 'spells_c',
+    'CreateUndead': 'spells_c',
+    'Creation': 'spells_c',
+    'CrownOfMadness': 'spells_c',
+    'CrownOfStars': 'spells_c',
+    'CrusadersMantle': 'spells_c',
+    'CureWounds': 'spells_c',
+    'DancingLights': 'spells_d',
+    'DanseMacabre': 'spells_d',
+    'Darkness': 'spells_d',
+    'Darkvision': 'spells_d',
+    'Dawn': 'spells_d',
+    'Daylight': 'spells_d',
+    'DeathWard': 'spells_d',
+    'DelayedBlastFireball': 'spells_d',
+    'Demiplane': 'spells_d',
+    'DestructiveWave': 'spells_d',
+    'DetectEvilAndGood': 'spells_d',
+    'DetectMagic': 'spells_d',
+    'DetectPoisonAndDisease': 'spells_d',
+    'DetectThoughts': 'spells_d',
+    'DimensionDoor': 'spells_d',
+    'DisguiseSelf': 'spells_d',
+    'Disintegrate': 'spells_d',
+    'DispelEvilAndGood': 'spells_d',
+    'DispelMagic': 'spells_d',
+    'DissonantWhispers': 'spells_d',
+    'Divination': 'spells_d',
+    'DivineFavor': 'spells_d',
+    'DivineWord': 'spells_d',
+    'DominateBeast': 'spells_d',
+    'DominateMonster': 'spells_d',
+    'DominatePerson': 'spells_d',
+    'DragonsBreath': 'spells_d',
+    'DrawmijsInstantSummons': 'spells_d',
+    'Dream': 'spells_d',
+    'DruidGrove': 'spells_d',
+    'Druidcraft': 'spells_d',
+    'DustDevil': 'spells_d',
+    'EarthTremor': 'spells_e',
+    'Earthbind': 'spells_e',
+    'Earthquake': 'spells_e',
+    'EldritchBlast': 'spells_e',
+    'ElementalBane': 'spells_e',
+    'ElementalWeapon': 'spells_e',
+    'EnemiesAbound': 'spells_e',
+    'Enervation': 'spells_e',
+    'EnhanceAbility': 'spells_e',
+    'Enlargereduce': 'spells_e',
+    'EnsnaringStrike': 'spells_e',
+    'Entangle': 'spells_e',
+    'Enthrall': 'spells_e',
+    'EruptingEarth': 'spells_e',
+    'Etherealness': 'spells_e',
+    'EvardsBlackTentacles': 'spells_e',
+    'ExpeditiousRetreat': 'spells_e',
+    'Eyebite': 'spells_e',
+    'Fabricate': 'spells_f',
+    'FaerieFire': 'spells_f',
+    'FalseLife': 'spells_f',
+    'FarStep': 'spells_f',
+    'Fear': 'spells_f',
+    'FeatherFall': 'spells_f',
+    'Feeblemind': 'spells_f',
+    'FeignDeath': 'spells_f',
+    'FindFamiliar': 'spells_f',
+    'FindGreaterSteed': 'spells_f',
+    'FindSteed': 'spells_f',
+    'FindThePath': 'spells_f',
+    'FindTraps': 'spells_f',
+    'FingerOfDeath': 'spells_f',
+    'FireBolt': 'spells_f',
+    'FireShield': 'spells_f',
+    'FireStorm': 'spells_f',
+    'Fireball': 'spells_f',
+    'FlameArrows': 'spells_f',
+    'FlameBlade': 'spells_f',
+    'FlameStrike': 'spells_f',
+    'FlamingSphere': 'spells_f',
+    'FleshToStone': 'spells_f',
+    'Fly': 'spells_f',
+    'FogCloud': 'spells_f',
+    'Forbiddance': 'spells_f',
+    'Forcecage': 'spells_f',
+    'Foresight': 'spells_f',
+    'FreedomOfMovement': 'spells_f',
+    'Friends': 'spells_f',
+    'Frostbite': 'spells_f',
+    'GaseousForm': 'spells_g',
+    'Gate': 'spells_g',
+    'Geas': 'spells_g',
+    'GentleRepose': 'spells_g',
+    'GiantInsect': 'spells_g',
+    'Glibness': 'spells_g',
+    'GlobeOfInvulnerability': 'spells_g',
+    'GlyphOfWarding': 'spells_g',
+    'Goodberry': 'spells_g',
+    'GraspingVine': 'spells_g',
+    'Grease': 'spells_g',
+    'GreaterInvisibility': 'spells_g',
+    'GreaterRestoration': 'spells_g',
+    'GreenFlameBlade': 'spells_g',
+    'GuardianOfFaith': 'spells_g',
+    'GuardianOfNature': 'spells_g',
+    'GuardsAndWards': 'spells_g',
+    'Guidance': 'spells_g',
+    'GuidingBolt': 'spells_g',
+    'Gust': 'spells_g',
+    'GustOfWind': 'spells_g',
+    'HailOfThorns': 'spells_h',
+    'Hallow': 'spells_h',
+    'HallucinatoryTerrain': 'spells_h',
+    'Harm': 'spells_h',
+    'Haste': 'spells_h',
+    'Heal': 'spells_h',
+    'HealingSpirit': 'spells_h',
+    'HealingWord': 'spells_h',
+    'HeatMetal': 'spells_h',
+    'HellishRebuke': 'spells_h',
+    'HeroesFeast': 'spells_h',
+    'Heroism': 'spells_h',
+    'Hex': 'spells_h',
+    'HoldMonster': 'spells_h',
+    'HoldPerson': 'spells_h',
+    'HolyAura': 'spells_h',
+    'HolyWeapon': 'spells_h',
+    'HungerOfHadar': 'spells_h',
+    'HuntersMark': 'spells_h',
+    'HypnoticPattern': 'spells_h',
+    'IceKnife': 'spells_i',
+    'IceStorm': 'spells_i',
+    'Identify': 'spells_i',
+    'IllusoryDragon': 'spells_i',
+    'IllusoryScript': 'spells_i',
+    'Immolation': 'spells_i',
+    'Imprisonment': 'spells_i',
+    'IncendiaryCloud': 'spells_i',
+    'InfernalCalling': 'spells_i',
+    'Infestation': 'spells_i',
+    'InflictWounds': 'spells_i',
+    'InsectPlague': 'spells_i',
+    'InvestitureOfFlame': 'spells_i',
+    'InvestitureOfIce': 'spells_i',
+    'InvestitureOfStone': 'spells_i',
+    'InvestitureOfWind': 'spells_i',
+    'Invisibility': 'spells_i',
+    'Invulnerability': 'spells_i',
+    'Jump': 'spells_j',
+    'Knock': 'spells_k',
+    'LegendLore': 'spells_l',
+    'LeomundsSecretChest': 'spells_l',
+    'LeomundsTinyHut': 'spells_l',
+    'LesserRestoration': 'spells_l',
+    'Levitate': 'spells_l',
+    'LifeTransference': 'spells_l',
+    'Light': 'spells_l',
+    'LightningArrow': 'spells_l',
+    'LightningBolt': 'spells_l',
+    'LightningLure': 'spells_l',
+    'LocateAnimalsOrPlants': 'spells_l',
+    'LocateCreature': 'spells_l',
+    'LocateObject': 'spells_l',
+    'Longstrider': 'spells_l',
+    'MaddeningDarkness': 'spells_m',
+    'Maelstrom': 'spells_m',
+    'MageArmor': 'spells_m',
+    'MageHand': 'spells_m',
+    'MagicCircle': 'spells_m',
+    'MagicJar': 'spells_m',
+    'MagicMissile': 'spells_m',
+    'MagicMouth': 'spells_m',
+    'MagicStone': 'spells_m',
+    'MagicWeapon': 'spells_m',
+    'MajorImage': 'spells_m',
+    'MassCureWounds': 'spells_m',
+    'MassHeal': 'spells_m',
+    'MassHealingWord': 'spells_m',
+    'MassPolymorph': 'spells_m',
+    'MassSuggestion': 'spells_m',
+    'MaximiliansEarthenGrasp': 'spells_m',
+    'Maze': 'spells_m',
+    'MeldIntoStone': 'spells_m',
+    'MelfsAcidArrow': 'spells_m',
+    'MelfsMinuteMeteors': 'spells_m',
+    'Mending': 'spells_m',
+    'MentalPrison': 'spells_m',
+    'Message': 'spells_m',
+    'MeteorSwarm': 'spells_m',
+    'MightyFortress': 'spells_m',
+    'MindBlank': 'spells_m',
+    'MindSpike': 'spells_m',
+    'MinorIllusion': 'spells_m',
+    'MirageArcane': 'spells_m',
+    'MirrorImage': 'spells_m',
+    'Mislead': 'spells_m',
+    'MistyStep': 'spells_m',
+    'ModifyMemory': 'spells_m',
+    'MoldEarth': 'spells_m',
+    'Moonbeam': 'spells_m',
+    'MordenkainensFaithfulHound': 'spells_m',
+    'MordenkainensMagnificentMansion': 'spells_m',
+    'MordenkainensPrivateSanctum': 'spells_m',
+    'MordenkainensSword': 'spells_m',
+    'MoveEarth': 'spells_m',
+    'NegativeEnergyFlood': 'spells_n',
+    'Nondetection': 'spells_n',
+    'NystulsMagicAura': 'spells_n',
+    'OtilukesFreezingSphere': 'spells_o',
+    'OtilukesResilientSphere': 'spells_o',
+    'OttosIrresistibleDance': 'spells_o',
+    'PassWithoutTrace': 'spells_p',
+    'Passwall': 'spells_p',
+    'PhantasmalForce': 'spells_p',
+    'PhantasmalKiller': 'spells_p',
+    'PhantomSteed': 'spells_p',
+    'PlanarAlly': 'spells_p',
+    'PlanarBinding': 'spells_p',
+    'PlaneShift': 'spells_p',
+    'PlantGrowth': 'spells_p',
+    'PoisonSpray': 'spells_p',
+    'Polymorph': 'spells_p',
+    'PowerWordHeal': 'spells_p',
+    'PowerWordKill': 'spells_p',
+    'PowerWordPain': 'spells_p',
+    'PowerWordStun': 'spells_p',
+    'PrayerOfHealing': 'spells_p',
+    'Prestidigitation': 'spells_p',
+    'PrimalSavagery': 'spells_p',
+    'PrimordialWard': 'spells_p',
+    'PrismaticSpray': 'spells_p',
+    'PrismaticWall': 'spells_p',
+    'ProduceFlame': 'spells_p',
+    'ProgrammedIllusion': 'spells_p',
+    'ProjectImage': 'spells_p',
+    'ProtectionFromEnergy': 'spells_p',
+    'ProtectionFromEvilAndGood': 'spells_p',
+    'ProtectionFromPoison': 'spells_p',
+    'PsychicScream': 'spells_p',
+    'PurifyFoodAndDrink': 'spells_p',
+    'Pyrotechnics': 'spells_p',
+    'RaiseDead': 'spells_r',
+    'RarysTelepathicBond': 'spells_r',
+    'RayOfEnfeeblement': 'spells_r',
+    'RayOfFrost': 'spells_r',
+    'RayOfSickness': 'spells_r',
+    'Regenerate': 'spells_r',
+    'Reincarnate': 'spells_r',
+    'RemoveCurse': 'spells_r',
+    'Resistance': 'spells_r',
+    'Resurrection': 'spells_r',
+    'ReverseGravity': 'spells_r',
+    'Revivify': 'spells_r',
+    'RopeTrick': 'spells_r',
+    'SacredFlame': 'spells_s',
+    'Sanctuary': 'spells_s',
+    'Scatter': 'spells_s',
+    'ScorchingRay': 'spells_s',
+    'Scrying': 'spells_s',
+    'SearingSmite': 'spells_s',
+    'SeeInvisibility': 'spells_s',
+    'Seeming': 'spells_s',
+    'Sending': 'spells_s',
+    'Sequester': 'spells_s',
+    'ShadowBlade': 'spells_s',
+    'ShadowOfMoil': 'spells_s',
+    'ShapeWater': 'spells_s',
+    'Shapechange': 'spells_s',
+    'Shatter': 'spells_s',
+    'Shield': 'spells_s',
+    'ShieldOfFaith': 'spells_s',
+    'Shillelagh': 'spells_s',
+    'ShockingGrasp': 'spells_s',
+    'SickeningRadiance': 'spells_s',
+    'Silence': 'spells_s',
+    'SilentImage': 'spells_s',
+    'Simulacrum': 'spells_s',
+    'SkillEmpowerment': 'spells_s',
+    'Skywrite': 'spells_s',
+    'Sleep': 'spells_s',
+    'SleetStorm': 'spells_s',
+    'Slow': 'spells_s',
+    'Snare': 'spells_s',
+    'SnillocsSnowballSwarm': 'spells_s',
+    'SoulCage': 'spells_s',
+    'SpareTheDying': 'spells_s',
+    'SpeakWithAnimals': 'spells_s',
+    'SpeakWithDead': 'spells_s',
+    'SpeakWithPlants': 'spells_s',
+    'SpiderClimb': 'spells_s',
+    'SpikeGrowth': 'spells_s',
+    'SpiritGuardians': 'spells_s',
+    'SpiritualWeapon': 'spells_s',
+    'StaggeringSmite': 'spells_s',
+    'SteelWindStrike': 'spells_s',
+    'StinkingCloud': 'spells_s',
+    'StoneShape': 'spells_s',
+    'Stoneskin': 'spells_s',
+    'StormOfVengeance': 'spells_s',
+    'StormSphere': 'spells_s',
+    'Suggestion': 'spells_s',
+    'SummonGreaterDemon': 'spells_s',
+    'SummonLesserDemons': 'spells_s',
+    'Sunbeam': 'spells_s',
+    'Sunburst': 'spells_s',
+    'SwiftQuiver': 'spells_s',
+    'SwordBurst': 'spells_s',
+    'Symbol': 'spells_s',
+    'SynapticStatic': 'spells_s',
+    'TashasHideousLaughter': 'spells_t',
+    'Telekinesis': 'spells_t',
+    'Telepathy': 'spells_t',
+    'Teleport': 'spells_t',
+    'TeleportationCircle': 'spells_t',
+    'TempleOfTheGods': 'spells_t',
+    'TensersFloatingDisk': 'spells_t',
+    'TensersTransformation': 'spells_t',
+    'Thaumaturgy': 'spells_t',
+    'ThornWhip': 'spells_t',
+    'ThunderStep': 'spells_t',
+    'Thunderclap': 'spells_t',
+    'ThunderousSmite': 'spells_t',
+    'Thunderwave': 'spells_t',
+    'TidalWave': 'spells_t',
+    'TimeStop': 'spells_t',
+    'TinyServant': 'spells_t',
+    'TollTheDead': 'spells_t',
+    'Tongues': 'spells_t',
+    'TransmuteRock': 'spells_t',
+    'TransportViaPlants': 'spells_t',
+    'TreeStride': 'spells_t',
+    'TruePolymorph': 'spells_t',
+    'TrueResurrection': 'spells_t',
+    'TrueSeeing': 'spells_t',
+    'TrueStrike': 'spells_t',
+    'Tsunami': 'spells_t',
+    'UnseenServant': 'spells_u',
+    'VampiricTouch': 'spells_v',
+    'ViciousMockery': 'spells_v',
+    'VitriolicSphere': 'spells_v',
+    'WallOfFire': 'spells_w',
+    'WallOfForce': 'spells_w',
+    'WallOfIce': 'spells_w',
+    'WallOfLight': 'spells_w',
+    'WallOfSand': 'spells_w',
+    'WallOfStone': 'spells_w',
+    'WallOfThorns': 'spells_w',
+    'WallOfWater': 'spells_w',
+    'WardingBond': 'spells_w',
+    'WardingWind': 'spells_w',
+    'WaterBreathing': 'spells_w',
+    'WaterWalk': 'spells_w',
+    'WaterySphere': 'spells_w',
+    'Web': 'spells_w',
+    'Weird': 'spells_w',
+    'Whirlwind': 'spells_w',
+    'WindWalk': 'spells_w',
+    'WindWall': 'spells_w',
+    'Wish': 'spells_w',
+    'WitchBolt': 'spells_w',
+    'WordOfRadiance': 'spells_w',
+    'WordOfRecall': 'spells_w',
+    'WrathOfNature': 'spells_w',
+    'WrathfulSmite': 'spells_w',
+    'ZephyrStrike': 'spells_z',
+    'ZoneOfTruth': 'spells_z',
+}
@@ -14,12 +14,48 @@ def create_spell(**params):
     NewSpell
       New spell class, subclass of ``Spell``, with given params.
     """
-    NewSpell = Spell
-    NewSpell.name = params.get('name', 'Unknown Spell')
-    NewSpell.level = params.get('level', 9)
+    params.setdefault('name', 'Unknown Spell')
+    params.setdefault('level', 9)
+    params['_placeholder'] = True
+    NewSpell = type('UnknownSpell', (Spell,), params)
     return NewSpell
 
 
+# (name, level) -> shared instance
+_canonical_spells = {}
+
+
+def canonical_spell(spell):
+    """Retrieve the shared instance of a spell class.
+    
+    Spells carry no per-character state, so every character (and
+    every feature, class and race) can share one instance of each
+    spell. The returned instance should not be modified.
+    
+    Instances are shared by name and level, like spell equality, so
+    placeholders from ``create_spell()`` with the same name and level
+    share one instance too. Another class with the same name and level
+    (eg. a replacement registered by ``content``) takes the place of
+    the old one.
+    
+    Parameters
+    ----------
+    spell : type
+      A subclass of ``Spell``.
+    
+    Returns
+    -------
+    Spell
+      The one instance of ``spell`` handed out by the registry.
+    """
+    key = (spell.name, spell.level)
+    instance = _canonical_spells.get(key)
+    if type(instance) is not spell and not (
+            spell._placeholder and getattr(instance, '_placeholder', False)):
+        instance = _canonical_spells[key] = spell()
+    return instance
+
+
 class Spell():
     """A magical spell castable by a player character."""
     level = 0
@@ -31,6 +67,7 @@ class Spell():
     duration = "instantaneous"
     ritual = False
     _concentration = False
+    _placeholder = False
     magic_school = ""
     classes = ()
     
@@ -53,7 +90,7 @@ class Spell():
         return (self.name == other.name) and (self.level == other.level)
 
     def __hash__(self):
-        return 0
+        return hash((self.name, self.level))
     
     @property
     def component_string(self):
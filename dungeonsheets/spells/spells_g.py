@@ -84,7 +84,7 @@ class Geas(Spell):
     wish spell also ends it.
     
     At Higher Levels: When you cast this spell usinga 
-    spell slot of 7th or 8th level, the duration is 1 year.
+    spell slot of 7th or 8th level, the duration is 1 year.
     When you cast this 
     spell using a spell slot of 9th level, the spell lasts until it is ended by one 
     of the spells mentioned above.
@@ -248,7 +248,12 @@ class GlyphOfWarding(Spell):
     attack it. If the spell requires concentration, it lasts until the end of its 
     full duration.
     
-    At Higher Levels: 
+    At Higher Levels: When you cast this spell using a spell slot of 4th
+    level or higher, the damage of an explosive runes glyph increases by
+    1d8 for each slot level above 3rd. If you create a spell glyph, you
+    can store any spell of up to the same level as the slot you use for
+    the glyph of warding.
+    
     """
     name = "Glyph Of Warding"
     level = 3
@@ -259,7 +264,7 @@ class GlyphOfWarding(Spell):
     duration = "Until dispelled or triggered"
     ritual = False
     magic_school = "Abjuration"
-    classes = ('you', 'cast', 'this', 'spell', 'using', 'a', 'spell', 'slot', 'of', '4th', 'level', 'or', 'higher', 'the', 'damage', 'of', 'an', 'explosive', 'runes', 'glyph', 'increases', 'by', '1d8', 'for', 'each', 'slot', 'level', 'above', '3rd.', 'If', 'you', 'create', 'a', 'spell', 'glyph', 'you', 'can', 'store', 'any', 'spell', 'of', 'up', 'to', 'the', 'same', 'level', 'as', 'the', 'slot', 'you', 'use', 'for', 'the', 'glyph', 'of')
+    classes = ('Bard', 'Cleric', 'Wizard')
 
 
 class Goodberry(Spell):
@@ -0,0 +1,179 @@
+"""Measure the start-up cost of making character sheets.
+
+Every ``makesheets`` process pays to import dungeonsheets and its
+dependencies, and to prepare the templates, before any character is
+processed. This module measures that cost in a fresh python
+interpreter, so that previous imports don't hide it. Run it with::
+
+    $ makesheets --profile-startup
+
+or set the environment variable ``DUNGEONSHEETS_PROFILE_STARTUP=1``
+to print the report alongside normal processing.
+
+"""
+
+import json
+import subprocess
+import sys
+from collections import namedtuple
+
+
+PROFILE_ENV = 'DUNGEONSHEETS_PROFILE_STARTUP'
+
+StartupCost = namedtuple('StartupCost', ('name', 'seconds', 'memory'))
+
+# Runs in a fresh interpreter. Imports ``make_sheets``, then prepares
+# the templates, and prints the cost of each step as JSON.
+_CHILD_CODE = '''
+import os, sys, time, tracemalloc
+costs = {}
+def measure(name, func):
+    mem = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = func()
+    costs[name] = (time.perf_counter() - start,
+                   tracemalloc.get_traced_memory()[0] - mem)
+    return result
+make_sheets = measure('import', lambda: __import__('dungeonsheets.make_sheets',
+                                                   fromlist=['make_sheets']))
+# Attribute memory allocated during imports to the modules that did it
+files = {os.path.abspath(m.__file__): name for name, m in list(sys.modules.items())
+         if getattr(m, '__file__', None)}
+import_memory = {}
+if tracemalloc.is_tracing():
+    for stat in tracemalloc.take_snapshot().statistics('filename'):
+        module = files.get(os.path.abspath(stat.traceback[0].filename))
+        if module is not None:
+            import_memory[module] = import_memory.get(module, 0) + stat.size
+forms = os.path.join(os.path.dirname(make_sheets.__file__), 'forms')
+env = measure('Jinja environment', make_sheets.latex_env)
+measure('LaTeX templates', lambda: [env.get_template(f) for f in os.listdir(forms)
+                                    if f.endswith('.tex')])
+measure('PDF templates', lambda: [make_sheets.pdfrw.PdfReader(os.path.join(forms, f))
+                                  for f in os.listdir(forms) if f.endswith('.pdf')])
+import json
+print(json.dumps({'costs': costs, 'import_memory': import_memory}))
+'''
+
+
+def module_group(module):
+    """The package that ``module``'s cost is reported under.
+
+    Sub-packages of dungeonsheets are reported separately (eg.
+    ``dungeonsheets.spells.spells_a`` -> ``dungeonsheets.spells``),
+    other libraries are grouped by top-level package (eg.
+    ``jinja2.nodes`` -> ``jinja2``).
+
+    """
+    parts = module.split('.')
+    if parts[0] == 'dungeonsheets':
+        return '.'.join(parts[:2])
+    return parts[0]
+
+
+def parse_importtime(output):
+    """Total the self-time of each group of modules in the output of
+    ``python -X importtime``.
+
+    Returns
+    -------
+    times : dict
+      Keys are module groups (see ``module_group()``), values are
+      times in seconds.
+
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            self_us = int(fields[0])
+        except ValueError:
+            # The header line
+            continue
+        group = module_group(fields[2].strip())
+        times[group] = times.get(group, 0) + self_us / 1e6
+    return times
+
+
+def _run_child(*options):
+    result = subprocess.run([sys.executable, *options, '-c', _CHILD_CODE],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    return json.loads(result.stdout), result.stderr
+
+
+def profile_startup(min_seconds=0.002):
+    """Measure the start-up cost of ``makesheets`` in a new interpreter.
+
+    Times are measured in one interpreter, and memory in a second one
+    with tracemalloc enabled, so that tracing does not distort the
+    times.
+
+    Parameters
+    ----------
+    min_seconds : optional
+      Libraries outside of dungeonsheets that take less time than
+      this to import are reported together.
+
+    Returns
+    -------
+    costs : list
+      A ``StartupCost`` for the import of each package, followed by
+      each preparation step. ``memory`` is the number of bytes
+      allocated.
+
+    """
+    timed, importtime = _run_child('-X', 'importtime')
+    traced, _ = _run_child('-X', 'tracemalloc')
+    import_times = parse_importtime(importtime)
+    import_memory = {}
+    for module, size in traced['import_memory'].items():
+        group = module_group(module)
+        import_memory[group] = import_memory.get(group, 0) + size
+    # Report dungeonsheets and expensive libraries, lump the rest together
+    costs = []
+    other = StartupCost('import (other modules)', 0, 0)
+    for group, seconds in sorted(import_times.items(), key=lambda item: -item[1]):
+        memory = import_memory.get(group, 0)
+        if group.startswith('dungeonsheets') or seconds >= min_seconds:
+            costs.append(StartupCost(f'import {group}', seconds, memory))
+        else:
+            other = StartupCost(other.name, other.seconds + seconds,
+                                other.memory + memory)
+    costs.append(other)
+    for step, (seconds, _) in timed['costs'].items():
+        if step != 'import':
+            memory = traced['costs'][step][1]
+            costs.append(StartupCost(step, seconds, memory))
+    return costs
+
+
+def format_report(costs):
+    """Render a list of ``StartupCost`` as a table."""
+    lines = ['{:<40} {:>10} {:>12}'.format('Step', 'Time (ms)', 'Memory (KiB)')]
+    for cost in costs:
+        lines.append('{:<40} {:>10.1f} {:>12,.0f}'.format(
+            cost.name, cost.seconds * 1000, cost.memory / 1024))
+    lines.append('{:<40} {:>10.1f} {:>12,.0f}'.format(
+        'Total', sum(c.seconds for c in costs) * 1000,
+        sum(c.memory for c in costs) / 1024))
+    return '\n'.join(lines)
+
+
+def import_time(module='dungeonsheets.make_sheets', repeat=3):
+    """Wall time, in seconds, to import ``module`` in a new interpreter.
+
+    The best of ``repeat`` attempts is used, to reduce noise from
+    other processes.
+
+    """
+    code = ('import time; start = time.perf_counter(); '
+            f'import {module}; print(time.perf_counter() - start)')
+    times = []
+    for i in range(repeat):
+        result = subprocess.run([sys.executable, '-c', code], check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True)
+        times.append(float(result.stdout))
+    return min(times)
@@ -1,17 +1,199 @@
 import math
+import re
+import string
+import types
+import weakref
 from collections import namedtuple
 from .armor import NoArmor, NoShield, HeavyArmor, Shield, Armor
 from .weapons import Weapon
-from .features import (UnarmoredDefenseMonk, UnarmoredDefenseBarbarian,
-                       DraconicResilience, Defense, FastMovement,
-                       UnarmoredMovement, GiftOfTheDepths, RemarkableAthelete,
-                       SeaSoul, JackOfAllTrades, SoulOfTheForge, QuickDraw,
-                       NaturalExplorerRevised, FeralInstinct, DreadAmbusher,
-                       SuperiorMobility, AmbushMaster, RakishAudacity,
-                       NaturalArmor)
+from . import features
+from .catalog import CATEGORIES, _field_value, load_catalog
+from .exceptions import UnknownNameError
+from .suggestions import TrigramIndex
 from math import ceil
 
 
+# Characters removed when comparing names, so that eg. "Tasha's
+# Hideous Laughter", "tashas_hideous_laughter" and "TashasHideousLaughter"
+# all match, as do "Crossbow, hand" and "crossbow hand".
+_name_translation = str.maketrans(
+    '', '', string.whitespace + string.punctuation + '\u2018\u2019\u02bc')
+
+_bonus_re = re.compile(r'\s*\+\s*(\d+)\s*')
+
+_name_indexes = weakref.WeakKeyDictionary()
+_suggestion_indexes = weakref.WeakKeyDictionary()
+
+
+def normalize_name(name):
+    """Reduce a name to a canonical form for forgiving comparisons.
+    
+    Case, whitespace and punctuation (including underscores, hyphens,
+    commas and curly apostrophes) are ignored, eg. ``"Tasha's
+    Hideous-Laughter"`` becomes ``"tashashideouslaughter"``.
+    
+    """
+    return name.lower().translate(_name_translation)
+
+
+def display_names(obj):
+    """The display names of the game objects (eg. spells) in ``obj``.
+    
+    For modules of game content (see ``catalog.CATEGORIES``), these
+    are the subclasses of the module's base classes. Packages that
+    load their modules lazily (eg. ``spells``) are read from the
+    catalog, so that their modules are not imported, along with any
+    classes added since the catalog was built (eg. registered
+    content). For anything else, these are the public classes with a
+    ``name``.
+    
+    Returns
+    -------
+    names : dict
+      Maps attribute names to display names. Display names may be
+      empty or None, eg. for placeholder classes.
+    
+    """
+    if isinstance(obj, types.ModuleType):
+        namespace = vars(obj)
+        categories = [(category, base) for category, (module, base, _)
+                      in CATEGORIES.items() if module == obj.__name__]
+    else:
+        namespace = {attr: getattr(obj, attr) for attr in dir(obj)}
+        categories = []
+    names = {}
+    if '__getattr__' in namespace:
+        for category, base_name in categories:
+            names.update((entry.attr, entry.name)
+                         for entry in getattr(load_catalog(), category))
+    bases = tuple(namespace[base] for _, base in categories)
+    for attr, value in list(namespace.items()):
+        if (attr.startswith('_') or not isinstance(value, type)
+            or value in bases or (bases and not issubclass(value, bases))):
+            continue
+        if categories or isinstance(getattr(value, 'name', None), str):
+            names[attr] = _field_value(value, 'name')
+    return names
+
+
+def _indexes(obj, display=True):
+    """The name index and display names of ``obj``, cached until its
+    namespace changes.
+    
+    If ``display`` is false, the display names may not have been read
+    yet (the index only holds attribute names, and ``names`` is None).
+    
+    """
+    size = len(getattr(obj, '__all__', None) or getattr(obj, '__dict__', ()))
+    try:
+        cached_size, index, names = _name_indexes[obj]
+    except (KeyError, TypeError):
+        cached_size = None
+    if cached_size != size:
+        index, names = {}, None
+        for attr in dir(obj):
+            if attr.startswith('_'):
+                continue
+            key = normalize_name(attr)
+            # Prefer classes (eg. spells, weapons) if two names collide
+            if key not in index or (isinstance(getattr(obj, attr), type) and
+                                    not isinstance(getattr(obj, index[key]), type)):
+                index[key] = attr
+    if display and names is None:
+        # Display names, unless they are shared by several objects, or
+        # match another object's attribute name
+        names = display_names(obj)
+        by_name = {}
+        for attr, name in names.items():
+            if isinstance(name, str) and normalize_name(name):
+                by_name.setdefault(normalize_name(name), set()).add(attr)
+        index = dict(index)
+        for key, attrs in by_name.items():
+            if len(attrs) == 1 and key not in index:
+                index[key] = attrs.pop()
+    try:
+        _name_indexes[obj] = (size, index, names)
+    except TypeError:
+        # Not a weak-referenceable object, so don't cache
+        pass
+    return index, names
+
+
+def _lookup(obj, name):
+    """The attribute name in ``obj`` for ``name``, or None.
+    
+    Display names are only read if ``name`` is not an attribute name,
+    since that may mean loading the catalog.
+    
+    """
+    key = normalize_name(name)
+    attr_name = _indexes(obj, display=False)[0].get(key)
+    if attr_name is None:
+        attr_name = name_index(obj).get(key)
+    return attr_name
+
+
+def name_index(obj):
+    """A mapping of normalized names to attribute names for ``obj``.
+    
+    Both the attribute names and the display names of game objects
+    (see ``display_names()``) are included, unless a display name is
+    shared by several objects. For modules, the index is
+    built once and re-used until the module's namespace changes.
+    Lazily-loaded packages list all their names in ``__all__``, so
+    loading more of them does not count as a change.
+    
+    """
+    return _indexes(obj)[0]
+
+
+def suggest_names(obj, name, n=3):
+    """Find the known names in ``obj`` that are closest to ``name``.
+    
+    Useful for suggesting corrections when ``findattr`` fails. Only
+    game objects with a display name (see ``display_names()``) are
+    suggested, by that name if ``findattr`` can find them with it,
+    otherwise by their python name.
+    
+    Returns
+    -------
+    suggestions : list
+      Up to ``n`` names, closest first.
+    
+    """
+    index, names = _indexes(obj)
+    try:
+        cached_index, suggestions = _suggestion_indexes[obj]
+    except (KeyError, TypeError):
+        cached_index = None
+    if cached_index is not index:
+        suggestions = TrigramIndex(normalize=normalize_name)
+        for attr_name, display_name in sorted(names.items()):
+            if not isinstance(display_name, str) or not display_name.strip():
+                continue
+            if index.get(normalize_name(display_name)) != attr_name:
+                display_name = attr_name
+            suggestions.add(display_name, aliases=(attr_name,))
+        try:
+            _suggestion_indexes[obj] = (index, suggestions)
+        except TypeError:
+            pass
+    return suggestions.suggest(name, n=n)
+
+
+def did_you_mean(obj, name):
+    """A hint for error messages listing close matches to ``name``.
+    
+    Returns an empty string if nothing similar is found.
+    
+    """
+    suggestions = suggest_names(obj, name)
+    if not suggestions:
+        return ''
+    return ' Did you mean {}?'.format(
+        ', '.join(f'"{s}"' for s in suggestions))
+
+
 def findattr(obj, name):
     """Similar to builtin getattr(obj, name) but more forgiving to
     whitespace and capitalization.
@@ -19,29 +201,57 @@ def findattr(obj, name):
     """
     # Come up with several options
     name = name.strip()
-    # check for +X weapons, armor, shields
     bonus = 0
-    for i in range(1, 11):
-        if (f'+{i}' in name) or (f'+ {i}' in name):
-            bonus = i
-            name = name.replace(f'+{i}', '').replace(f'+ {i}', '')
-            break
-    py_name = name.replace('-', '_').replace(' ', '_').replace("'", "")
-    camel_case = "".join([s.capitalize() for s in py_name.split('_')])
-    if hasattr(obj, py_name):
-        # Direct lookup
-        attr = getattr(obj, py_name)
-    elif hasattr(obj, camel_case):
-        # CamelCase lookup
-        attr = getattr(obj, camel_case)
+    attr_name = _lookup(obj, name)
+    # check for +X weapons, armor, shields, unless part of the name
+    # (eg. "Flame Tongue +1")
+    match = _bonus_re.search(name)
+    if attr_name is None and match is not None:
+        bonus = int(match.group(1))
+        name = (name[:match.start()] + ' ' + name[match.end():]).strip()
+        attr_name = _lookup(obj, name)
+    if attr_name is not None:
+        attr = getattr(obj, attr_name)
     else:
-        raise AttributeError(f'{obj} has no attribute {name}')
+        py_name = name.replace('-', '_').replace(' ', '_').replace("'", "")
+        camel_case = "".join([s.capitalize() for s in py_name.split('_')])
+        if hasattr(obj, py_name):
+            # Direct lookup
+            attr = getattr(obj, py_name)
+        elif hasattr(obj, camel_case):
+            # CamelCase lookup
+            attr = getattr(obj, camel_case)
+        else:
+            raise UnknownNameError(f'{obj} has no attribute {name}.',
+                                   hint=did_you_mean(obj, name))
     if bonus > 0:
         if issubclass(attr, Weapon) or issubclass(attr, Shield) or issubclass(attr, Armor):
             attr = attr.improved_version(bonus)
     return attr
 
 
+def get_feature(char, name):
+    """The character's feature called ``name``, or None.
+    
+    Unlike ``char.get_feature()``, the feature is given by name, and
+    its module is not imported unless some character already has it.
+    
+    """
+    feature = features.loaded_feature(name)
+    if feature is None:
+        return None
+    return char.get_feature(feature)
+
+
+def has_feature(char, name):
+    """Whether the character has a feature called ``name``.
+    
+    See ``get_feature()``.
+    
+    """
+    return get_feature(char, name) is not None
+
+
 def mod_str(modifier):
     """Converts a modifier to a string, eg 2 -> '+2'."""
     return '{:+d}'.format(modifier)
@@ -55,13 +265,104 @@ AbilityScore = namedtuple('AbilityScore',
                           ('value', 'modifier', 'saving_throw'))
 
 
-class Ability():
+# Derived stats (ability scores, skills, armor class, etc.) are cached
+# on the object they describe, along with a fingerprint of each input
+# they were computed from. A value is only recomputed once one of its
+# own inputs has changed. Inputs that are themselves derived (eg
+# ``proficiency_bonus`` or ``dexterity``) are validated the same way,
+# so changes propagate through the dependency graph.
+
+def _item_fingerprint(item, *attrs):
+    if item is None:
+        return None
+    return (item,) + tuple(getattr(item, attr, None) for attr in attrs)
+
+
+_input_fingerprints = {
+    'armor': lambda obj: _item_fingerprint(
+        obj.armor, 'base_armor_class', 'dexterity_mod_max'),
+    'shield': lambda obj: _item_fingerprint(obj.shield, 'base_armor_class'),
+    'race': lambda obj: _item_fingerprint(obj.race, 'speed'),
+    'magic_items': lambda obj: tuple(
+        _item_fingerprint(m, 'ac_bonus') for m in obj.magic_items),
+}
+
+
+def input_fingerprint(obj, name):
+    """A cheap value that changes whenever input ``name`` of ``obj``
+    changes."""
+    if name in _input_fingerprints:
+        return _input_fingerprints[name](obj)
+    val = getattr(obj, name, None)
+    if isinstance(val, list):
+        val = tuple(val)
+    return val
+
+
+def cached_value(obj, key, depends_on, compute):
+    """Retrieve a derived value, only re-computing it if an input changed.
+    
+    Parameters
+    ----------
+    obj
+      The character (or monster) that the value describes.
+    key
+      Hashable name for this value in the cache.
+    depends_on
+      Names of the attributes of ``obj`` that this value is computed
+      from.
+    compute
+      Callable that takes ``obj`` and returns the new value.
+    
+    """
+    fingerprint = tuple(input_fingerprint(obj, name) for name in depends_on)
+    cache = obj.__dict__.setdefault('_derived_values', {})
+    if key in cache:
+        old_fingerprint, value = cache[key]
+        if old_fingerprint == fingerprint:
+            return value
+    value = compute(obj)
+    cache[key] = (fingerprint, value)
+    return value
+
+
+def invalidate_value(obj, key):
+    """Force a derived value to be re-computed on its next access."""
+    obj.__dict__.get('_derived_values', {}).pop(key, None)
+
+
+class DerivedStat():
+    """A stat that is computed from other attributes of its owner.
+    
+    Subclasses list the names of these attributes in ``depends_on``,
+    and implement ``compute()``. The value is cached until one of the
+    attributes changes.
+    
+    """
+    name = None
+    depends_on = ()
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+        return cached_value(obj, self.name, self.depends_on, self.compute)
+    
+    def compute(self, obj):
+        raise NotImplementedError()
+
+
+class Ability(DerivedStat):
     ability_name = None
+    depends_on = ('saving_throw_proficiencies', 'proficiency_bonus')
     
     def __init__(self, default_value=10):
         self.default_value = default_value
     
     def __set_name__(self, character, name):
+        super().__set_name__(character, name)
         self.ability_name = name
     
     def _check_dict(self, obj):
@@ -74,7 +375,7 @@ class Ability():
             # ability score dictionary exists but doesn't have this ability
             obj._ability_scores[self.ability_name] = self.default_value
     
-    def __get__(self, character, Character):
+    def compute(self, character):
         self._check_dict(character)
         score = character._ability_scores[self.ability_name]
         modifier = math.floor((score - 10) / 2)
@@ -91,32 +392,54 @@ class Ability():
     def __set__(self, character, val):
         self._check_dict(character)
         character._ability_scores[self.ability_name] = val
+        invalidate_value(character, self.name)
         self.value = val
 
 
-class Skill():
+class ProficiencyBonus(DerivedStat):
+    """A character's proficiency bonus, based on total level."""
+    depends_on = ('level',)
+    
+    def compute(self, char):
+        if char.level < 5:
+            prof = 2
+        elif 5 <= char.level < 9:
+            prof = 3
+        elif 9 <= char.level < 13:
+            prof = 4
+        elif 13 <= char.level < 17:
+            prof = 5
+        elif 17 <= char.level:
+            prof = 6
+        return prof
+
+
+class Skill(DerivedStat):
     """An ability-based skill, such as athletics."""
     
     def __init__(self, ability):
         self.ability_name = ability
+        self.depends_on = (ability, 'skill_proficiencies', 'skill_expertise',
+                           'proficiency_bonus', 'features')
     
     def __set_name__(self, character, name):
+        super().__set_name__(character, name)
         self.skill_name = name.lower().replace('_', ' ')
         self.character = character
     
-    def __get__(self, character, owner):
+    def compute(self, character):
         ability = getattr(character, self.ability_name)
         modifier = ability.modifier
         # Check for proficiency
         is_proficient = self.skill_name in character.skill_proficiencies
         if is_proficient:
             modifier += character.proficiency_bonus
-        elif character.has_feature(JackOfAllTrades):
+        elif has_feature(character, 'JackOfAllTrades'):
             modifier += character.proficiency_bonus // 2
-        elif character.has_feature(RemarkableAthelete):
+        elif has_feature(character, 'RemarkableAthelete'):
             if self.ability_name.lower() in ('strength',
                                              'dexterity', 'constitution'):
-                modifier += ceil(character.proficienc_bonus / 2.)
+                modifier += ceil(character.proficiency_bonus / 2.)
         
         # Check for expertise
         is_expert = self.skill_name in character.skill_expertise
@@ -125,12 +448,14 @@ class Skill():
         return modifier
 
 
-class ArmorClass():
+class ArmorClass(DerivedStat):
     """
     The Armor Class of a character
     """
+    depends_on = ('dexterity', 'wisdom', 'constitution', 'armor', 'shield',
+                  'magic_items', 'features')
 
-    def __get__(self, char, Character):
+    def compute(self, char):
         armor = char.armor or NoArmor()
         ac = armor.base_armor_class
         # calculate and apply modifiers
@@ -138,24 +463,24 @@ class ArmorClass():
             ac += char.dexterity.modifier
         else:
             ac += min(char.dexterity.modifier, armor.dexterity_mod_max)
-        if char.has_feature(NaturalArmor):
+        if has_feature(char, 'NaturalArmor'):
             ac = max(ac, 13 + char.dexterity.modifier)
         shield = char.shield or NoShield()
         ac += shield.base_armor_class
         # Compute feature-specific additions
-        if char.has_feature(UnarmoredDefenseMonk):
+        if has_feature(char, 'UnarmoredDefenseMonk'):
             if (isinstance(armor, NoArmor) and isinstance(shield, NoShield)):
                 ac += char.wisdom.modifier
-        if char.has_feature(UnarmoredDefenseBarbarian):
+        if has_feature(char, 'UnarmoredDefenseBarbarian'):
             if isinstance(armor, NoArmor):
                 ac += char.constitution.modifier
-        if char.has_feature(DraconicResilience):
+        if has_feature(char, 'DraconicResilience'):
             if isinstance(armor, NoArmor):
                 ac += 3
-        if char.has_feature(Defense):
+        if has_feature(char, 'Defense'):
             if not isinstance(armor, NoArmor):
                 ac += 1
-        if char.has_feature(SoulOfTheForge):
+        if has_feature(char, 'SoulOfTheForge'):
             if isinstance(armor, HeavyArmor):
                 ac += 1
         # Check if any magic items add to AC
@@ -165,50 +490,53 @@ class ArmorClass():
         return ac
         
 
-class Speed():
+class Speed(DerivedStat):
     """
     The speed of a character
     """
+    depends_on = ('race', 'armor', 'level', 'features')
 
-    def __get__(self, char, Character):
+    def compute(self, char):
         speed = char.race.speed
         other_speed = ''
         if isinstance(speed, str):
             other_speed = speed[2:]
             speed = int(speed[:2])  # ignore other speeds, like fly
-        if char.has_feature(FastMovement):
+        if has_feature(char, 'FastMovement'):
             if not isinstance(char.armor, HeavyArmor):
                 speed += 10
-        if char.has_feature(SuperiorMobility):
+        if has_feature(char, 'SuperiorMobility'):
             speed += 10
         if isinstance(char.armor, NoArmor) or (char.armor is None):
-            for f in char.features:
-                if isinstance(f, UnarmoredMovement):
-                    speed += f.speed_bonus
-        if char.has_feature(GiftOfTheDepths):
+            unarmored_movement = get_feature(char, 'UnarmoredMovement')
+            if unarmored_movement is not None:
+                speed += unarmored_movement.speed_bonus
+        if has_feature(char, 'GiftOfTheDepths'):
             if 'swim' not in other_speed:
                 other_speed += ' ({:d} swim)'.format(speed)
-        if char.has_feature(SeaSoul):
+        if has_feature(char, 'SeaSoul'):
             if 'swim' not in other_speed:
                 other_speed += ' (30 swim)'
         return '{:d}{:s}'.format(speed, other_speed)
 
 
-class Initiative():
+class Initiative(DerivedStat):
     """A character's initiative"""
-    def __get__(self, char, Character):
+    depends_on = ('dexterity', 'wisdom', 'charisma', 'proficiency_bonus',
+                  'features')
+
+    def compute(self, char):
         ini = char.dexterity.modifier
-        if char.has_feature(QuickDraw):
+        if has_feature(char, 'QuickDraw'):
             ini += char.proficiency_bonus
-        if char.has_feature(DreadAmbusher):
+        if has_feature(char, 'DreadAmbusher'):
             ini += char.wisdom.modifier
-        if char.has_feature(RakishAudacity):
+        if has_feature(char, 'RakishAudacity'):
             ini += char.charisma.modifier
         ini = '{:+d}'.format(ini)
-        has_advantage = (char.has_feature(NaturalExplorerRevised) or
-                         char.has_feature(FeralInstinct) or
-                         char.has_feature(AmbushMaster))
+        has_advantage = (has_feature(char, 'NaturalExplorerRevised') or
+                         has_feature(char, 'FeralInstinct') or
+                         has_feature(char, 'AmbushMaster'))
         if has_advantage:
             ini += '(A)'
         return ini
-    
@@ -0,0 +1,102 @@
+"""Ranked "did you mean" suggestions for names that could not be found."""
+
+import heapq
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+
+def trigrams(text):
+    """The set of three-character substrings of ``text``, padded so that
+    the beginning and end of the text carry extra weight."""
+    padded = f'  {text} '
+    return {padded[i:i+3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex():
+    """An index of names for quickly finding close matches.
+
+    Candidates that share trigrams with the query are short-listed
+    using an inverted index, and then ranked by edit similarity.
+
+    Parameters
+    ----------
+    names : optional
+      Initial names to add to the index.
+    normalize : optional
+      Callable used to put names and queries in a canonical form
+      before comparing them.
+
+    """
+    def __init__(self, names=(), normalize=str.lower):
+        self.normalize = normalize
+        self.names = {}
+        self._postings = defaultdict(list)
+        self._num_trigrams = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, aliases=()):
+        """Add ``name`` to the index.
+
+        Any ``aliases`` given will also match, but ``name`` is what
+        gets suggested.
+
+        """
+        for alias in (name, *aliases):
+            key = self.normalize(alias)
+            if not key or key in self.names:
+                continue
+            self.names[key] = name
+            grams = trigrams(key)
+            self._num_trigrams[key] = len(grams)
+            for gram in grams:
+                self._postings[gram].append(key)
+
+    def suggest(self, name, n=3, cutoff=0.6):
+        """Find the names most similar to ``name``.
+
+        Parameters
+        ----------
+        name : str
+          The (possibly misspelled) name to look up.
+        n : optional
+          Maximum number of suggestions to return.
+        cutoff : optional
+          Minimum similarity (0 to 1) for a name to be suggested.
+
+        Returns
+        -------
+        suggestions : list
+          Up to ``n`` names, most similar first.
+
+        """
+        key = self.normalize(name)
+        if key in self.names:
+            return [self.names[key]]
+        grams = trigrams(key)
+        shared = defaultdict(int)
+        for gram in grams:
+            for candidate in self._postings.get(gram, ()):
+                shared[candidate] += 1
+        # Short-list by the fraction of shared trigrams (Dice coefficient)
+        shortlist = heapq.nlargest(
+            max(10, 3 * n), shared,
+            key=lambda c: shared[c] / (len(grams) + self._num_trigrams[c]))
+        # Rank the short-list by edit similarity
+        matcher = SequenceMatcher()
+        matcher.set_seq2(key)
+        scored = []
+        for candidate in shortlist:
+            matcher.set_seq1(candidate)
+            ratio = matcher.ratio()
+            if ratio >= cutoff:
+                scored.append((-ratio, candidate))
+        scored.sort()
+        suggestions = []
+        for _, candidate in scored:
+            if self.names[candidate] not in suggestions:
+                suggestions.append(self.names[candidate])
+        return suggestions[:n]
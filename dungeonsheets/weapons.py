@@ -1,3 +1,83 @@
+import re
+import sys
+from collections import namedtuple
+from enum import IntFlag
+from functools import lru_cache
+
+
+class WeaponProperty(IntFlag):
+    """The standard weapon properties, as bit flags."""
+    AMMUNITION = 1
+    FINESSE = 2
+    HEAVY = 4
+    LIGHT = 8
+    LOADING = 16
+    REACH = 32
+    SPECIAL = 64
+    THROWN = 128
+    TWO_HANDED = 256
+    VERSATILE = 512
+    RELOAD = 1024
+    MISFIRE = 2048
+
+
+WeaponProperties = namedtuple(
+    'WeaponProperties', ('flags', 'normal_range', 'long_range',
+                         'versatile_damage', 'reload', 'misfire', 'other'))
+
+_property_item_re = re.compile(r'[^,(]+(?:\([^)]*\))?|\([^)]*\)')
+_property_re = re.compile(r'\s*([a-z][a-z -]*?)?\s*(\d+)?\s*(?:\((.*)\))?\s*$')
+_range_re = re.compile(r'range\s*(\d+)\s*/\s*(\d+)')
+
+
+@lru_cache(maxsize=None)
+def parse_properties(properties):
+    """Read a weapon's properties text.
+    
+    Parameters
+    ----------
+    properties : str
+      Eg. "Finesse, light, thrown (range 20/60)".
+    
+    Returns
+    -------
+    WeaponProperties
+      ``flags`` is a ``WeaponProperty`` combining the properties
+      found. ``normal_range`` and ``long_range`` are in feet, or None
+      for melee weapons; ``versatile_damage`` is a dice string (eg.
+      "1d8") or None; ``reload`` and ``misfire`` are numbers or
+      None. Any unrecognized properties are listed in ``other``.
+    
+    """
+    flags = WeaponProperty(0)
+    normal_range = long_range = versatile_damage = reload = misfire = None
+    other = []
+    for item in _property_item_re.findall(properties.lower()):
+        match = _property_re.match(item)
+        if match is None:
+            other.append(item.strip())
+            continue
+        name, number, argument = match.groups()
+        name = (name or '').strip()
+        range_match = _range_re.search(argument or '')
+        if range_match is not None:
+            normal_range, long_range = (int(r) for r in range_match.groups())
+        flag_name = re.sub('[ -]', '_', name.upper())
+        flag = WeaponProperty.__members__.get(flag_name)
+        if flag is not None:
+            flags |= flag
+        elif name:
+            other.append(name)
+        if flag is WeaponProperty.VERSATILE:
+            versatile_damage = argument
+        elif flag is WeaponProperty.RELOAD and number is not None:
+            reload = int(number)
+        elif flag is WeaponProperty.MISFIRE and number is not None:
+            misfire = int(number)
+    return WeaponProperties(flags, normal_range, long_range, versatile_damage,
+                            reload, misfire, tuple(other))
+
+
 class Weapon():
     name = ""
     cost = "0 gp"
@@ -11,13 +91,41 @@ class Weapon():
     is_finesse = False
     features_applied = False
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Finesse weapons are marked in the properties
+        if 'is_finesse' not in vars(cls):
+            cls.is_finesse = bool(parse_properties(cls.properties).flags
+                                  & WeaponProperty.FINESSE)
+    
     def __init__(self, wielder=None):
         self.wielder = wielder
+    
+    @property
+    def property_info(self):
+        """The parsed ``properties`` of this weapon, as
+        ``WeaponProperties``."""
+        return parse_properties(self.properties)
+    
+    @property
+    def property_flags(self):
+        """The standard properties of this weapon, as a
+        ``WeaponProperty``."""
+        return parse_properties(self.properties).flags
 
     @classmethod
     def improved_version(cls, bonus):
-        bonus = int(bonus)
+        """A magical version of this item with a +``bonus``.
+        
+        The same class is returned for repeated calls with the same
+        bonus.
         
+        """
+        return cls._improved_version(int(bonus))
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _improved_version(cls, bonus):
         class NewWeapon(cls):
             name = f'+{bonus} ' + cls.name
             damage_bonus = bonus
@@ -105,7 +213,6 @@ class Dagger(SimpleWeapon, MeleeWeapon):
     damage_type = "p"
     weight = 1
     properties = "Finesse, light, thrown (range 20/60)"
-    is_finesse = True
     ability = 'strength'
 
 
@@ -206,7 +313,6 @@ class Dart(SimpleWeapon, RangedWeapon):
     damage_type = "p"
     weight = 0.25
     properties = "Finesse, thrown (range 20/60)"
-    is_finesse = True
     ability = 'dexterity'
 
 
@@ -347,7 +453,6 @@ class Rapier(MartialWeapon, MeleeWeapon):
     damage_type = "p"
     weight = 2
     properties = "Finesse"
-    is_finesse = True
     ability = 'strength'
 
 
@@ -358,7 +463,6 @@ class Scimitar(MartialWeapon, MeleeWeapon):
     damage_type = "s"
     weight = 3
     properties = "Finesse, light"
-    is_finesse = True
     ability = 'strength'
 
 
@@ -369,7 +473,6 @@ class Shortsword(MartialWeapon, MeleeWeapon):
     damage_type = "p"
     weight = 0
     properties = "Finesse, light"
-    is_finesse = True
     ability = 'strength'
 
 
@@ -420,7 +523,6 @@ class Whip(MartialWeapon, MeleeWeapon):
     damage_type = "s"
     weight = 3
     properties = "Finesse, reach"
-    is_finesse = True
     ability = 'strength'
 
 
@@ -450,7 +552,7 @@ class HeavyCrossbow(MartialWeapon, RangedWeapon):
     base_damage = "1d10"
     damage_type = "p"
     weight = 18
-    properties = "Ammunition (range 100/400), heaving, loading, two-handed"
+    properties = "Ammunition (range 100/400), heavy, loading, two-handed"
     ability = 'dexterity'
 
 
@@ -597,3 +699,54 @@ monk_weapons = (Shortsword, Unarmed, Club, Dagger, Handaxe, Javelin,
                 LightHammer, Mace, Quarterstaff, Sickle, Spear, SunBolt)
 
 firearms = (Firearm, Blunderbuss, Pistol, Musket)
+
+
+_weapon_index = (None, ())
+
+
+def weapon_index():
+    """All the weapons in this module, each with its property flags.
+    
+    Returns
+    -------
+    index : tuple
+      (weapon class, ``WeaponProperty``) pairs.
+    
+    """
+    global _weapon_index
+    namespace = vars(sys.modules[__name__])
+    size, index = _weapon_index
+    if size != len(namespace):
+        index = tuple((W, parse_properties(W.properties).flags)
+                      for name, W in list(namespace.items())
+                      if isinstance(W, type) and issubclass(W, Weapon)
+                      and not name.startswith('_'))
+        _weapon_index = (len(namespace), index)
+    return index
+
+
+def find_weapons(include=WeaponProperty(0), exclude=WeaponProperty(0),
+                 candidates=None):
+    """Find the weapons with all the ``include`` properties and none of
+    the ``exclude`` properties.
+    
+    Parameters
+    ----------
+    include, exclude : WeaponProperty, optional
+      Properties to look for or avoid, eg. ``WeaponProperty.FINESSE |
+      WeaponProperty.LIGHT``.
+    candidates : optional
+      Only consider these weapon classes. By default, all the weapons
+      in this module are considered.
+    
+    Returns
+    -------
+    weapons : list
+      Matching weapon classes.
+    
+    """
+    if candidates is not None:
+        candidates = set(candidates)
+    return [W for W, flags in weapon_index()
+            if (flags & include) == include and not (flags & exclude)
+            and (candidates is None or W in candidates)]
@@ -33,14 +33,17 @@ setup(name='dungeonsheets',
               'create-character = dungeonsheets.create_character:main',
           ]
       },
-      python_requires='>=3.6',
+      python_requires='>=3.7',
       classifiers=[
           'Development Status :: 3 - Alpha',
           'Environment :: Console',
           'License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)',
           'Natural Language :: English',
-          'Programming Language :: Python :: 3.6',
           'Programming Language :: Python :: 3.7',
+          'Programming Language :: Python :: 3.8',
+          'Programming Language :: Python :: 3.9',
+          'Programming Language :: Python :: 3.10',
+          'Programming Language :: Python :: 3.11',
           'Topic :: Games/Entertainment :: Role-Playing',
       ],
      )
@@ -0,0 +1,19 @@
+import os
+import tempfile
+
+from dungeonsheets.cache import CACHE_ENV
+
+
+_cache_dir = None
+
+
+def pytest_configure(config):
+    # Keep the tests out of the user's own cache, and vice versa
+    global _cache_dir
+    _cache_dir = tempfile.TemporaryDirectory()
+    os.environ[CACHE_ENV] = _cache_dir.name
+
+
+def pytest_unconfigure(config):
+    os.environ.pop(CACHE_ENV, None)
+    _cache_dir.cleanup()
@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from dungeonsheets import batch, load_many
+from dungeonsheets.character import Character
+from dungeonsheets.exceptions import (CharacterFileFormatError,
+                                      UnsafeCharacterFileError)
+
+
+EG_DIR = os.path.abspath(os.path.join(os.path.split(__file__)[0], '../examples/'))
+
+
+def attributes(value):
+    """The attributes of a character as plain values, with other
+    objects (eg. weapons) replaced by the name of their class."""
+    if isinstance(value, (list, tuple)):
+        return [attributes(v) for v in value]
+    if isinstance(value, dict):
+        return {k: attributes(v) for k, v in value.items()}
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    if isinstance(value, Character):
+        # Cache statistics depend on how often the sheet was used
+        return {k: attributes(v) for k, v in vars(value).items()
+                if k not in ('_features_hits', '_features_misses')}
+    return type(value).__qualname__
+
+
+class LoadManyTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        for name in ('rogue1.py', 'wizard1.py'):
+            shutil.copy(os.path.join(EG_DIR, name), self.tmpdir)
+        Character.load(os.path.join(EG_DIR, 'bard1.py')).save(
+            os.path.join(self.tmpdir, 'bard1.json'))
+        self.write('broken.py', 'name = "No version"\n')
+        self.write('code.py', 'dungeonsheets_version = "1.0"\n'
+                   'import os\nname = "Code"\n')
+        self.write('unknown_spell.py', 'dungeonsheets_version = "1.0"\n'
+                   'name = "Clara"\nclasses = ["Wizard"]\nlevels = [1]\n'
+                   'spells = ["Not a real spell"]\n')
+        self.write('extra.py', 'dungeonsheets_version = "1.0"\n'
+                   'name = "Extra"\nclasses = ["Fighter"]\nlevels = [2]\n'
+                   'age = 30\nhp_current = 7\n')
+        self.write('notes.txt', 'Not a character\n')
+
+    def write(self, filename, text):
+        with open(os.path.join(self.tmpdir, filename), mode='w') as fp:
+            fp.write(text)
+
+    def results(self, **kwargs):
+        return {os.path.basename(r.filename): r
+                for r in load_many(self.tmpdir, **kwargs)}
+
+    def check_results(self, results, warnings=True):
+        self.assertEqual(sorted(results), [
+            'bard1.json', 'broken.py', 'code.py', 'extra.py', 'rogue1.py',
+            'unknown_spell.py', 'wizard1.py'])
+        self.assertEqual(results['rogue1.py'].character.name, 'Rogue1')
+        self.assertIsNone(results['rogue1.py'].error)
+        self.assertEqual(results['bard1.json'].character.name, 'Bard1')
+        self.assertIsNone(results['broken.py'].character)
+        self.assertIsInstance(results['broken.py'].error, CharacterFileFormatError)
+        self.assertEqual(results['code.py'].character.name, 'Code')
+        self.assertEqual(results['unknown_spell.py'].character.name, 'Clara')
+        if warnings:
+            self.assertIn('Not a real spell', results['unknown_spell.py'].warnings[0])
+
+    def test_serial(self):
+        self.check_results(self.results(workers=1))
+
+    def test_threads(self):
+        with self.assertWarns(UserWarning):
+            results = self.results(workers=2, executor='thread')
+        self.check_results(results, warnings=False)
+
+    def test_processes(self):
+        results = self.results(workers=2)
+        self.check_results(results)
+        self.assertIsInstance(results['wizard1.py'].character, Character)
+
+    def test_same_as_serial(self):
+        serial = self.results(workers=1)
+        processes = self.results(workers=2)
+        self.assertEqual(processes['extra.py'].character.age, 30)
+        self.assertEqual(processes['extra.py'].character.hp_current, 7)
+        for filename, result in serial.items():
+            if result.character is not None:
+                # Serial characters were validated in this process
+                char = processes[filename].character
+                char.compute_sheet()
+                self.assertEqual(attributes(char),
+                                 attributes(result.character), filename)
+
+    def test_strict(self):
+        results = self.results(workers=1, strict=True)
+        self.assertIsInstance(results['code.py'].error, UnsafeCharacterFileError)
+
+    def test_arguments(self):
+        with self.assertRaises(ValueError):
+            load_many(self.tmpdir, executor='gpu')
+        filename = os.path.join(self.tmpdir, 'rogue1.py')
+        self.assertEqual(batch.character_files(filename), [filename])
+        results = list(load_many([filename], workers=4))
+        self.assertEqual(len(results), 1)
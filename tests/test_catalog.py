@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from dungeonsheets import catalog, cache, spells
+
+
+class CacheTestCase(TestCase):
+    def test_cache_dir(self):
+        with mock.patch.dict(os.environ, {'DUNGEONSHEETS_CACHE_DIR': '/tmp/ds-cache'}):
+            self.assertEqual(cache.cache_dir(), '/tmp/ds-cache')
+        env = {'DUNGEONSHEETS_CACHE_DIR': '', 'XDG_CACHE_HOME': '/tmp/xdg'}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(cache.cache_dir(), '/tmp/xdg/dungeonsheets')
+
+    def test_write_atomic(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'new', 'file.txt')
+            cache.write_atomic(filename, b'hello')
+            with open(filename, 'rb') as fp:
+                self.assertEqual(fp.read(), b'hello')
+            self.assertEqual(os.listdir(os.path.dirname(filename)), ['file.txt'])
+
+
+class CatalogTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, 'catalog.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_build_and_load(self):
+        # Nothing cached yet
+        self.assertIsNone(catalog.load_catalog(self.filename, rebuild=False))
+        built = catalog.build_catalog(self.filename)
+        loaded = catalog.load_catalog(self.filename, rebuild=False)
+        self.assertEqual(loaded.spells, built.spells)
+        self.assertEqual(loaded.monsters, built.monsters)
+        # Check some metadata
+        fireball = [s for s in loaded.spells if s.attr == 'Fireball'][0]
+        self.assertEqual(fireball.name, 'Fireball')
+        self.assertEqual(fireball.level, 3)
+        self.assertIn('Wizard', fireball.classes)
+        self.assertIs(loaded.resolve('spells', fireball), spells.Fireball)
+        martial_arts = [f for f in loaded.features if f.attr == 'MartialArts'][0]
+        self.assertEqual(martial_arts.source, 'Monk')
+
+    def test_stale_catalog(self):
+        catalog.build_catalog(self.filename)
+        # Pretend that the catalog was built from an older version
+        with open(self.filename) as fp:
+            data = json.load(fp)
+        data['fingerprint']['version'] = '0.0.1'
+        with open(self.filename, 'w') as fp:
+            json.dump(data, fp)
+        self.assertIsNone(catalog.load_catalog(self.filename, rebuild=False))
+        # Re-build the out-of-date catalog
+        rebuilt = catalog.load_catalog(self.filename)
+        self.assertEqual(rebuilt.fingerprint, catalog.catalog_fingerprint())
+        with open(self.filename) as fp:
+            self.assertEqual(json.load(fp)['fingerprint'],
+                             catalog.catalog_fingerprint())
+
+    def test_unwritable_cache(self):
+        # The cache "directory" is a file, so the catalog can't be saved
+        with open(os.path.join(self.tmpdir.name, 'cache'), 'w'):
+            pass
+        filename = os.path.join(self.tmpdir.name, 'cache', 'catalog.json')
+        loaded = catalog.load_catalog(filename)
+        self.assertEqual(loaded.fingerprint, catalog.catalog_fingerprint())
+        self.assertFalse(os.path.exists(filename))
@@ -3,7 +3,7 @@
 from unittest import TestCase
 import warnings
 
-from dungeonsheets import race, monsters, exceptions, spells
+from dungeonsheets import race, monsters, exceptions, spells, features
 from dungeonsheets.character import Character, Wizard, Druid
 from dungeonsheets.weapons import Weapon, Shortsword
 from dungeonsheets.armor import Armor, LeatherArmor, Shield
@@ -159,6 +159,67 @@ class TestCharacter(TestCase):
         char.wield_shield(Shield)
         self.assertEqual(char.armor_class, 15)
     
+    def test_features_cache(self):
+        char = Character(classes=['Monk'], levels=[1])
+        feats = char.features
+        # Repeated access re-uses the cached collection
+        self.assertIs(char.features, feats)
+        info = char.features_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertGreaterEqual(info.hits, 1)
+        # Leveling up rebuilds the features
+        char.level = 2
+        self.assertIn('Unarmored Movement', [f.name for f in char.features])
+        self.assertEqual(char.features_cache_info().misses, 2)
+        # So does changing the race
+        char.race = 'hill dwarf'
+        self.assertIn('Stonecunning', [f.name for f in char.features])
+        # Manual invalidation
+        feats = char.features
+        char.invalidate_features()
+        self.assertIsNot(char.features, feats)
+
+    def test_has_feature(self):
+        char = Character(classes=['Monk'], levels=[1])
+        self.assertTrue(char.has_feature(features.MartialArts))
+        self.assertFalse(char.has_feature(features.UnarmoredMovement))
+        self.assertIsNone(char.get_feature(features.UnarmoredMovement))
+        # Base classes are indexed too
+        self.assertTrue(char.has_feature(features.Feature))
+        # Level up and check again
+        char.level = 2
+        self.assertTrue(char.has_feature(features.UnarmoredMovement))
+        feat = char.get_feature(features.UnarmoredMovement)
+        self.assertIsInstance(feat, features.UnarmoredMovement)
+        self.assertEqual(char.speed, '40')
+
+    def test_lazy_class_features(self):
+        char = Character(classes=['Monk'], levels=[1])
+        char.features
+        # Only features for levels reached so far are created
+        self.assertEqual(max(char.Monk.features_by_level.keys()), 1)
+        char.level = 5
+        self.assertTrue(char.has_feature(features.ExtraAttackMonk))
+        self.assertEqual(max(char.Monk.features_by_level.keys()), 5)
+
+    def test_compute_sheet(self):
+        char = Character(classes=['Wizard'], levels=[5], dexterity=14,
+                         intelligence=16, skill_proficiencies=['arcana'],
+                         spells=['fireball'], weapons=['dagger'])
+        sheet = char.compute_sheet()
+        self.assertEqual(sheet.proficiency_bonus, 3)
+        self.assertEqual(sheet.abilities.dexterity, char.dexterity)
+        self.assertEqual(sheet.skills.arcana, 6)
+        self.assertEqual(sheet.armor_class, char.armor_class)
+        self.assertEqual(sheet.passive_perception, 10 + char.perception)
+        self.assertEqual(sheet.weapons[0].name, 'Dagger')
+        self.assertEqual(sheet.spellcasting[0].save_dc, 14)
+        self.assertIn(spells.Fireball(), sheet.spells)
+        self.assertEqual(sheet.spell_slots[3], 2)
+        # The snapshot is read-only
+        with self.assertRaises(AttributeError):
+            sheet.armor_class = 20
+
     def test_speed(self):
         # Check that the speed pulls from the character's race
         char = Character(race='lightfoot halfling')
@@ -210,6 +271,24 @@ class DruidTestCase(TestCase):
         self.assertEqual(len(char.wild_shapes), 1)
         self.assertIsInstance(char.wild_shapes[0], monsters.Ankylosaurus)
     
+    def test_eligible_shapes(self):
+        # Compare against checking every monster individually
+        all_beasts = [monsters.Wolf(), monsters.Ape(), monsters.Rat(),
+                      monsters.Crocodile(), monsters.GiantEagle(),
+                      monsters.Ankylosaurus(), monsters.Spider(),
+                      monsters.SwarmOfRats()]
+        for level, circle in [(1, ''), (2, ''), (4, ''), (8, ''),
+                              (2, 'moon'), (9, 'moon')]:
+            druid = Druid(level=level, circle=circle)
+            eligible = druid.eligible_shapes()
+            expected = [type(b) for b in all_beasts if druid.can_assume_shape(b)]
+            self.assertEqual(sorted(type(s).__name__ for s in eligible),
+                             sorted(M.__name__ for M in expected))
+        druid = Druid(level=4)
+        names = [s.name for s in druid.eligible_shapes()]
+        self.assertIn('Crocodile', names)
+        self.assertNotIn('Giant Eagle', names)
+    
     def test_can_assume_shape(self):
         class Beast(monsters.Monster):
             description = 'beast'
@@ -0,0 +1,157 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import warnings
+from unittest import TestCase
+
+from dungeonsheets import character_data, weapons
+from dungeonsheets.character import Character
+from dungeonsheets.exceptions import CharacterFileFormatError
+
+
+EG_DIR = os.path.abspath(os.path.join(os.path.split(__file__)[0], '../examples/'))
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class CharacterDataTestCase(TestCase):
+    def setUp(self):
+        self.char = Character(
+            name='Clara', classes=['Wizard', 'Fighter'], levels=[5, 2],
+            subclasses=['Necromancy', None], race='Tabaxi',
+            background='Acolyte', dexterity=16, intelligence=18,
+            skill_proficiencies=['arcana', 'history'],
+            weapons=['shortsword', 'dagger +1'], armor='leather armor',
+            shield='shield', spells=['magic missile', 'mage armor'],
+            spells_prepared=['mage armor'], features=['lucky'],
+            feature_choices=['archery'], gp=15)
+
+    def test_to_dict(self):
+        data = character_data.character_to_dict(self.char)
+        self.assertEqual(data['schema_version'], character_data.SCHEMA_VERSION)
+        self.assertEqual(data['classes'], [
+            {'id': 'Wizard', 'level': 5, 'subclass': 'Necromancy'},
+            {'id': 'Fighter', 'level': 2, 'subclass': None}])
+        self.assertEqual(data['race'], 'Tabaxi')
+        self.assertEqual(data['spells'], ['MageArmor', 'MagicMissile'])
+        self.assertEqual(data['features'], ['Lucky'])
+        self.assertEqual(data['abilities']['intelligence'], 18)
+        # Magic weapons use their name, and natural weapons are left out
+        self.assertEqual(data['weapons'], ['Shortsword', '+1 Dagger'])
+        # Only plain data is stored
+        self.assertEqual(json.loads(json.dumps(data)), data)
+
+    def test_round_trip(self):
+        char = character_data.loads(character_data.dumps(self.char))
+        self.assertEqual(char.name, 'Clara')
+        self.assertEqual(char.classes_and_levels, 'Wizard 5 / Fighter 2')
+        self.assertEqual(str(char.Wizard.subclass), 'School of Necromancy')
+        self.assertEqual(char.dexterity.value, 16)
+        self.assertEqual([type(w) for w in char.weapons],
+                         [type(w) for w in self.char.weapons])
+        self.assertEqual(char.weapons.count(char.weapons[0]), 1)
+        self.assertEqual(char.armor_class, self.char.armor_class)
+        self.assertEqual(char.spells, self.char.spells)
+        self.assertEqual([f.name for f in char.features],
+                         [f.name for f in self.char.features])
+        self.assertEqual(char.to_dict(), self.char.to_dict())
+
+    def test_examples(self):
+        filenames = [f for f in sorted(os.listdir(EG_DIR)) if f.endswith('.py')]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for filename in filenames:
+                char = Character.load(os.path.join(EG_DIR, filename))
+                new_char = Character.from_dict(char.to_dict())
+                self.assertEqual(new_char.to_dict(), char.to_dict(), filename)
+
+    def test_schema(self):
+        data = self.char.to_dict()
+        data['schema_version'] = character_data.SCHEMA_VERSION + 1
+        with self.assertRaises(CharacterFileFormatError):
+            character_data.character_from_dict(data)
+        with self.assertRaises(CharacterFileFormatError):
+            character_data.character_from_dict({'name': 'Clara'})
+        with self.assertRaises(CharacterFileFormatError):
+            character_data.loads(b'{not json')
+
+    def test_invalid_data(self):
+        for key, value in [('classes', [{'level': 3}]),
+                           ('classes', [{'id': 'Wizard', 'level': '3'}]),
+                           ('classes', ['Wizard']),
+                           ('race', 5),
+                           ('spells', 'MagicMissile'),
+                           ('weapons', [None]),
+                           ('abilities', {'strength': True}),
+                           ('abilities', {'luck': 10}),
+                           ('name', ['Clara'])]:
+            data = self.char.to_dict()
+            data[key] = value
+            with self.assertRaises(CharacterFileFormatError, msg=key):
+                character_data.character_from_dict(data)
+        # Unknown classes and equipment, and impossible levels
+        for key, value in [('classes', [{'id': 'NotAClass', 'level': 1}]),
+                           ('classes', [{'id': 'Wizard', 'level': 0}]),
+                           ('weapons', ['NotAWeapon']),
+                           ('armor', 'NotArmor')]:
+            data = self.char.to_dict()
+            data[key] = value
+            with self.assertRaises(CharacterFileFormatError, msg=key):
+                character_data.character_from_dict(data)
+        # Anything that isn't MessagePack is read as JSON
+        for data in (b'[1,2]', b'"Clara"', b'', b'\xff'):
+            with self.assertRaises(CharacterFileFormatError) as cm:
+                character_data.loads(data)
+            self.assertNotIn('msgpack', str(cm.exception))
+
+    def test_unknown_ids(self):
+        # Unknown spells get the usual warning instead of failing
+        data = self.char.to_dict()
+        data['spells'] = ['NotASpell']
+        with self.assertWarns(UserWarning):
+            char = character_data.character_from_dict(data)
+        self.assertEqual([s.name for s in char._spells], ['NotASpell'])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'clara.json')
+            self.char.save(filename)
+            with open(filename) as fp:
+                self.assertEqual(json.load(fp)['name'], 'Clara')
+            char = Character.load(filename)
+            self.assertEqual(char.to_dict(), self.char.to_dict())
+            data = self.char.to_dict()
+            data['weapons'] = ['NotAWeapon']
+            with open(filename, 'w') as fp:
+                json.dump(data, fp)
+            with self.assertRaises(CharacterFileFormatError):
+                Character.load(filename)
+
+    def test_stream(self):
+        other = Character(name='Ben', classes=['Rogue'], levels=[3],
+                          race='Lizardfolk')
+        fp = io.BytesIO()
+        self.assertEqual(character_data.dump_all([self.char, other], fp), 2)
+        fp.seek(0)
+        chars = list(character_data.load_all(fp))
+        self.assertEqual([c.name for c in chars], ['Clara', 'Ben'])
+        self.assertEqual([type(w) for w in chars[1].weapons], [weapons.Bite])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            character_data.dumps(self.char, format='yaml')
+
+    @unittest.skipIf(msgpack is None, 'msgpack is not installed')
+    def test_msgpack(self):
+        data = character_data.dumps(self.char, format='msgpack')
+        char = character_data.loads(data)
+        self.assertEqual(char.to_dict(), self.char.to_dict())
+        fp = io.BytesIO()
+        character_data.dump_all([self.char, char], fp, format='msgpack')
+        fp.seek(0)
+        self.assertEqual(len(list(character_data.load_all(fp, format='msgpack'))), 2)
@@ -0,0 +1,177 @@
+import ast
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from dungeonsheets import character_file
+from dungeonsheets.exceptions import (CharacterFileFormatError,
+                                      UnsafeCharacterFileError)
+
+
+EG_DIR = os.path.abspath(os.path.join(os.path.split(__file__)[0], '../examples/'))
+
+
+# Python 3.7 parses literals into these nodes instead of ``Constant``
+_Str = type('Str', (ast.AST,), {'_fields': ('s',)})
+_Num = type('Num', (ast.AST,), {'_fields': ('n',)})
+_NameConstant = type('NameConstant', (ast.AST,), {'_fields': ('value',)})
+_parse = ast.parse
+
+
+class _LegacyLiterals(ast.NodeTransformer):
+    def visit_Constant(self, node):
+        if isinstance(node.value, str):
+            return _Str(s=node.value)
+        elif node.value is None or isinstance(node.value, bool):
+            return _NameConstant(value=node.value)
+        return _Num(n=node.value)
+
+
+def legacy_parse(source, filename='<unknown>'):
+    return _LegacyLiterals().visit(_parse(source, filename=filename))
+
+
+class ParseSourceTestCase(TestCase):
+    def parse(self, source):
+        return character_file.parse_character_source(source)
+
+    def test_literals(self):
+        props = self.parse('"""A docstring."""\n'
+                           'dungeonsheets_version = "0.9.4"\n'
+                           'name = "Clara"\n'
+                           'levels = [3, 2]\n'
+                           'skill_proficiencies = ("arcana",)\n'
+                           'feature_choices = {"a": 1}\n'
+                           'hp_max = -(-10)\n'
+                           '__hidden = ["Mage Hand"]\n'
+                           'spells = ["Light"] + __hidden\n')
+        self.assertEqual(props, {
+            'dungeonsheets_version': '0.9.4', 'name': 'Clara', 'levels': [3, 2],
+            'skill_proficiencies': ('arcana',), 'feature_choices': {'a': 1},
+            'hp_max': 10, 'spells': ['Light', 'Mage Hand']})
+
+    def test_legacy_literals(self):
+        source = ('"""A docstring."""\n'
+                  'dungeonsheets_version = "0.9.4"\n'
+                  'name = "Clara"\n'
+                  'levels = [3, -2]\n'
+                  'inspiration = True\n'
+                  'subclasses = [None]\n')
+        with mock.patch('ast.parse', legacy_parse):
+            props = self.parse(source)
+        self.assertEqual(props, {
+            'dungeonsheets_version': '0.9.4', 'name': 'Clara', 'levels': [3, -2],
+            'inspiration': True, 'subclasses': [None]})
+
+    def test_not_a_character(self):
+        with self.assertRaises(CharacterFileFormatError):
+            self.parse('import os\nos.remove("important_file")\n')
+        with self.assertRaises(CharacterFileFormatError):
+            self.parse('dungeonsheets_version = "1.0"\nname = \n')
+        with self.assertRaises(CharacterFileFormatError):
+            self.parse('dungeonsheets_version = "1.0"\nspells = missing\n')
+
+    def test_rejects_code(self):
+        unsafe = ['import os',
+                  'name = open("secrets").read()',
+                  'class Homebrew: pass',
+                  'name = "a" * 10000000',
+                  'weapons = [x for x in range(3)]',
+                  'levels[0] = 1',
+                  # Values that grow too large
+                  'a0 = [1]\n' + ''.join(f'a{n} = a{n-1} + a{n-1}\n'
+                                          for n in range(1, 23)),
+                  'b0 = 3\n' + ''.join(f'b{n} = b{n-1} * b{n-1}\n'
+                                        for n in range(1, 25)),
+                  'hp_max = 1e300 * 1e300']
+        for line in unsafe:
+            with self.assertRaises(UnsafeCharacterFileError, msg=line):
+                self.parse(f'dungeonsheets_version = "1.0"\nlevels = [1]\n{line}\n')
+
+    def test_example_files(self):
+        # Reading safely gives the same result as importing
+        for fname in os.listdir(EG_DIR):
+            if not fname.endswith('.py'):
+                continue
+            filename = os.path.join(EG_DIR, fname)
+            self.assertEqual(character_file.load_character_file(filename, strict=True),
+                             character_file.exec_character_file(filename))
+
+    def test_strict(self):
+        source = ('dungeonsheets_version = "1.0"\n'
+                  'import math\n'
+                  'hp_max = math.floor(10.5)\n')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'homebrew.py')
+            with open(filename, mode='w') as fp:
+                fp.write(source)
+            with self.assertRaises(UnsafeCharacterFileError):
+                character_file.load_character_file(filename, strict=True)
+            # Trusted files can still use code
+            props = character_file.load_character_file(filename)
+            self.assertEqual(props['hp_max'], 10)
+
+
+class CharacterCacheTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        env = {'DUNGEONSHEETS_CACHE_DIR': os.path.join(self.tmpdir.name, 'cache')}
+        self.env = mock.patch.dict(os.environ, env)
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def write(self, fname, source):
+        filename = os.path.join(self.tmpdir.name, fname)
+        with open(filename, mode='w') as fp:
+            fp.write(source)
+        return filename
+
+    def test_cached_result(self):
+        filename = self.write('clara.py', 'dungeonsheets_version = "1.0"\n'
+                              'name = "Clara"\nlevels = (2,)\n')
+        props = character_file.load_character_file(filename)
+        self.assertEqual(props, {'dungeonsheets_version': '1.0',
+                                 'name': 'Clara', 'levels': (2,)})
+        self.assertTrue(os.listdir(character_file.character_cache_dir()))
+        # The second time, the file is not parsed again
+        with mock.patch.object(character_file, 'parse_character_source') as parse:
+            cached = character_file.load_character_file(filename)
+        parse.assert_not_called()
+        self.assertEqual(cached, props)
+        # Changing the file gives the new values
+        self.write('clara.py', 'dungeonsheets_version = "1.0"\nname = "Clarabelle"\n')
+        props = character_file.load_character_file(filename)
+        self.assertEqual(props['name'], 'Clarabelle')
+
+    def test_cached_invalid(self):
+        filename = self.write('setup.py', 'import setuptools\n')
+        with self.assertRaises(CharacterFileFormatError):
+            character_file.load_character_file(filename)
+        # Remembered as invalid, without opening the file again
+        with mock.patch('builtins.open', side_effect=open) as open_:
+            with self.assertRaises(CharacterFileFormatError):
+                character_file.load_character_file(filename)
+        self.assertNotIn(filename, [c.args[0] for c in open_.call_args_list])
+
+    def test_cached_unsafe(self):
+        filename = self.write('homebrew.py', 'dungeonsheets_version = "1.0"\n'
+                              'import math\nhp_max = math.floor(10.5)\n')
+        for i in range(2):
+            with self.assertRaises(UnsafeCharacterFileError):
+                character_file.load_character_file(filename, strict=True)
+            self.assertEqual(character_file.load_character_file(filename)['hp_max'], 10)
+
+    def test_new_parser(self):
+        filename = self.write('clara.py', 'dungeonsheets_version = "1.0"\n'
+                              'name = "Clara"\n')
+        character_file.load_character_file(filename)
+        # Results from an older parser are not used
+        with mock.patch.object(character_file, 'PARSER_FORMAT',
+                               character_file.PARSER_FORMAT + 1):
+            with mock.patch.object(character_file, 'parse_character_source',
+                                   return_value={'name': 'Clara'}) as parse:
+                character_file.load_character_file(filename)
+        parse.assert_called_once()
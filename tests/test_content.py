@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from dungeonsheets import content, spells, features
+from dungeonsheets.character import Character
+from dungeonsheets.exceptions import ContentError
+
+
+SPELLS_JSON = {
+    "spells": {
+        "Frost Fingers": {
+            "level": 1,
+            "casting_time": "1 action",
+            "components": "V, S, M (a sliver of ice)",
+            "duration": "Instantaneous",
+            "school": "Evocation",
+            "classes": ["Wizard"],
+            "description": "Freezing cold blasts from your fingertips.",
+        },
+    },
+    "features": [
+        {"name": "Frost Touch", "source": "Test Source",
+         "spells_known": ["Frost Fingers", "Fire Bolt"]},
+    ],
+}
+
+
+class ContentTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, filename, text):
+        path = os.path.join(self.tmpdir.name, filename)
+        with open(path, mode='w') as fp:
+            fp.write(text)
+        return path
+
+    def test_parse_components(self):
+        self.assertEqual(content.parse_components('V'), (('V',), ''))
+        self.assertEqual(content.parse_components('S, V'), (('S', 'V'), ''))
+        self.assertEqual(content.parse_components('V, S, M (a tiny strip of white cloth)'),
+                         (('V', 'S', 'M'), 'a tiny strip of white cloth'))
+        with self.assertRaises(ValueError):
+            content.parse_components('V, X')
+
+    def test_class_name(self):
+        self.assertEqual(content.class_name("Tenser's Floating Disk"),
+                         'TensersFloatingDisk')
+
+    def test_load_json(self):
+        path = self.write('content.json', json.dumps(SPELLS_JSON))
+        loaded = content.load_content(path, register=False)
+        FrostFingers, = loaded['spells']
+        self.assertTrue(issubclass(FrostFingers, spells.Spell))
+        self.assertEqual(FrostFingers.__name__, 'FrostFingers')
+        self.assertEqual(FrostFingers.level, 1)
+        self.assertEqual(FrostFingers.components, ('V', 'S', 'M'))
+        self.assertEqual(FrostFingers.materials, 'a sliver of ice')
+        self.assertEqual(FrostFingers.magic_school, 'Evocation')
+        self.assertEqual(FrostFingers.__doc__, 'Freezing cold blasts from your fingertips.')
+        FrostTouch, = loaded['features']
+        self.assertEqual(FrostTouch.source, 'Test Source')
+        self.assertEqual(FrostTouch.spells_known, (FrostFingers, spells.FireBolt))
+        # Not registered
+        self.assertFalse(hasattr(spells, 'FrostFingers'))
+
+    def test_load_jsonl_and_register(self):
+        lines = [{"type": "spell", "name": "Data Bolt", "level": 0,
+                  "classes": "Wizard, Sorcerer"},
+                 {"type": "feature", "name": "Data Sense", "source": "Data Source"}]
+        path = self.write('content.jsonl', '\n'.join(json.dumps(l) for l in lines))
+        self.restore_after_test(spells)
+        self.restore_after_test(features)
+        content.load_content(path)
+        self.assertEqual(spells.DataBolt.classes, ('Wizard', 'Sorcerer'))
+        self.assertEqual(features.features_by_source('Data Source'), [features.DataSense])
+        # Characters can use the new content
+        char = Character(classes=['Wizard'], spells=['data bolt'],
+                         features=['data sense'])
+        self.assertEqual(char.spells[0].name, 'Data Bolt')
+        self.assertTrue(char.has_feature(features.DataSense))
+
+    def test_registered_content_removed(self):
+        # Content registered by other tests doesn't leak into this one
+        self.test_load_jsonl_and_register()
+        self.doCleanups()
+        self.assertFalse(hasattr(spells, 'DataBolt'))
+        self.assertNotIn('DataBolt', spells.__all__)
+        self.assertEqual(features.features_by_source('Data Source'), [])
+
+    def test_load_toml(self):
+        path = self.write('content.toml', '[spells."Toml Ray"]\nlevel = 2\n')
+        try:
+            loaded = content.load_content(path, register=False)
+        except ContentError:
+            self.skipTest('No TOML parser available')
+        self.assertEqual(loaded['spells'][0].level, 2)
+
+    def test_invalid(self):
+        bad_entries = [
+            {"Bad Spell": {"level": 12}},
+            {"Bad Spell": {"level": "one"}},
+            {"Bad Spell": {"levle": 1}},
+            {"Bad Spell": {"duration": "1 minute"}},
+            {"features": {"Bad Feature": {"spells_known": ["Not A Real Spell"]}}},
+        ]
+        for entry in bad_entries:
+            path = self.write('bad.json', json.dumps(entry))
+            with self.assertRaises(ContentError):
+                content.load_content(path)
+        # Nothing was registered
+        self.assertFalse(hasattr(spells, 'BadSpell'))
+
+    def restore_after_test(self, package):
+        """Undo any content registered in ``package`` by the test."""
+        namespace = vars(package)
+        saved = dict(namespace)
+        saved_sources = dict(getattr(package, 'registered_sources', {}))
+
+        def restore():
+            namespace.clear()
+            namespace.update(saved)
+            if hasattr(package, 'registered_sources'):
+                package.registered_sources.clear()
+                package.registered_sources.update(saved_sources)
+        self.addCleanup(restore)
+
+    def forget_module(self, package, index, module):
+        """Make ``package`` lazily load ``module`` again, and restore its
+        namespace after the test."""
+        self.restore_after_test(package)
+        namespace = vars(package)
+        for name, mod in index.items():
+            if mod == module:
+                namespace.pop(name, None)
+
+    def test_register_before_lazy_load(self):
+        from dungeonsheets.spells.spell_index import SPELL_MODULES
+        from dungeonsheets.features.feature_index import FEATURE_MODULES
+        self.forget_module(spells, SPELL_MODULES, 'spells_w')
+        self.forget_module(features, FEATURE_MODULES, 'monk')
+        path = self.write('homebrew.json', json.dumps({
+            "spells": {"Wish": {"level": 9, "description": "Homebrew wish."}},
+            "features": {"Martial Arts": {"source": "Monk",
+                                          "description": "Homebrew arts."}},
+        }))
+        content.load_content(path)
+        # Loading a sibling from the same module keeps the new content
+        spells.Web
+        features.FlurryOfBlows
+        self.assertEqual(spells.Wish.__doc__, 'Homebrew wish.')
+        self.assertEqual(features.MartialArts.__doc__, 'Homebrew arts.')
+        self.assertEqual(spells.Web.__module__,
+                         'dungeonsheets.spells.spells_w')
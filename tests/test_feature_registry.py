@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+from dungeonsheets import features, race, background
+from dungeonsheets.character import Character
+from dungeonsheets.classes import Druid, Wizard
+from dungeonsheets.feature_registry import feature_registry
+
+
+class FeatureRegistryTestCase(TestCase):
+    def setUp(self):
+        self.registry = feature_registry()
+
+    def test_shared_registry(self):
+        self.assertIs(feature_registry(), self.registry)
+
+    def test_class_features(self):
+        self.assertEqual(self.registry.features_at('Druid', 2),
+                         [features.WildShape])
+        self.assertEqual(self.registry.features_at(Druid, 6, subclass='Circle of the Moon'),
+                         [features.PrimalStrike])
+        # Matches the features of an instantiated class
+        char = Character(classes=['Wizard'], levels=[10],
+                         subclasses=['School of Evocation'])
+        self.assertEqual(self.registry.features_up_to(Wizard, 10,
+                                                      subclass='School of Evocation'),
+                         [type(f) for f in char.Wizard.features])
+
+    def test_progression(self):
+        progression = self.registry.progression('Monk', max_level=3)
+        self.assertEqual(list(progression), [1, 2, 3])
+        self.assertIn(features.MartialArts, progression[1])
+        self.assertIn(features.Ki, progression[2])
+
+    def test_race_and_background(self):
+        self.assertEqual(self.registry.features_at('Hill Dwarf', 1),
+                         list(race.HillDwarf.features))
+        self.assertEqual(self.registry.features_at(background.Acolyte, 1),
+                         [features.ShelterOfTheFaithful])
+        with self.assertRaises(KeyError):
+            self.registry.owner('Not a real class')
+
+    def test_sources_and_options(self):
+        sources = self.registry.sources_of(features.Darkvision)
+        self.assertIn(race.HillDwarf, [g.owner for g in sources])
+        self.assertEqual({g.kind for g in sources} - {'race', 'subclass'}, set())
+        self.assertIn(features.BearSpirit, self.registry.options(features.TotemSpirit))
+        grants = self.registry.grants_at('Path of the Totem Warrior', 3, options=True)
+        self.assertIn(features.BearSpirit, [g.feature for g in grants])
+        self.assertNotIn(features.BearSpirit,
+                         self.registry.features_at('Path of the Totem Warrior', 3))
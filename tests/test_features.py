@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
 from unittest import TestCase
+import subprocess
+import sys
 
+from dungeonsheets import features, module_index
 from dungeonsheets.features import create_feature, Feature
 
 
@@ -14,3 +17,75 @@ class TestFeatures(TestCase):
         self.assertEqual(NewFeature.name, 'Hello world')
         feature = NewFeature()
         print(feature, feature.__class__, type(feature))
+
+    def test_feature_hash(self):
+        feat1 = features.Darkvision()
+        feat2 = features.Darkvision()
+        self.assertEqual(hash(feat1), hash(feat2))
+        self.assertEqual(len({feat1, feat2, features.Stonecunning()}), 2)
+
+    def test_features_by_level(self):
+        source = {1: [features.Darkvision], 3: [features.Stonecunning]}
+        fbl = features.FeaturesByLevel(owner=None, sources=[source])
+        # Nothing is instantiated until requested
+        self.assertEqual(len(fbl), 0)
+        self.assertIsInstance(fbl[1][0], features.Darkvision)
+        self.assertEqual(list(fbl.keys()), [1])
+        self.assertEqual(fbl[2], [])
+        # New sources extend levels that were already created
+        fbl.add_source({1: [features.Lucky]})
+        self.assertEqual([type(f) for f in fbl[1]],
+                         [features.Darkvision, features.Lucky])
+        self.assertEqual([f.name for f in fbl[3]], ['Stonecunning'])
+
+    def test_features_by_level_selector(self):
+        # Resolving a selector may look up the owner's other levels
+        class Owner():
+            def has_feature(self, feat):
+                return any(isinstance(f, feat) for f in fbl[20])
+        class Selector(features.FeatureSelector):
+            options = {'lucky': features.Lucky}
+        fbl = features.FeaturesByLevel(owner=Owner(), sources=[{}],
+                                       feature_choices=['lucky'])
+        fbl[1]
+        fbl.add_source({1: [Selector], 20: [features.Darkvision]})
+        self.assertEqual([type(f) for f in fbl[1]], [features.Lucky])
+        self.assertEqual([type(f) for f in fbl[20]], [features.Darkvision])
+
+    def test_lazy_features(self):
+        self.assertIn('MartialArts', dir(features))
+        self.assertEqual(features.MartialArts.__module__,
+                         'dungeonsheets.features.monk')
+        self.assertIs(features.loaded_feature('MartialArts'),
+                      features.MartialArts)
+        self.assertIsNone(features.loaded_feature('NotARealFeature'))
+        with self.assertRaises(AttributeError):
+            features.NotARealFeature
+        # Features can be found by source
+        monk_features = features.features_by_source('Monk')
+        self.assertIn(features.MartialArts, monk_features)
+        for feat in monk_features:
+            self.assertEqual(feat.source, 'Monk')
+
+    def test_unused_modules_not_imported(self):
+        """A fighter should not need the wizard's classes or features."""
+        code = ("import sys; from dungeonsheets import Character; "
+                "char = Character(classes=['Fighter'], race='human'); "
+                "char.compute_sheet(); "
+                "print(' '.join(sys.modules))")
+        result = subprocess.run([sys.executable, '-c', code], check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True)
+        modules = result.stdout.split()
+        self.assertIn('dungeonsheets.classes.fighter', modules)
+        self.assertNotIn('dungeonsheets.classes.wizard', modules)
+        self.assertNotIn('dungeonsheets.features.wizard', modules)
+
+    def test_feature_index(self):
+        """Check that the generated feature index is up-to-date.
+        
+        If this fails, run ``python -m dungeonsheets.module_index``.
+        
+        """
+        index = module_index.feature_indexes()
+        self.assertEqual(features.FEATURE_MODULES, index['FEATURE_MODULES'])
+        self.assertEqual(features.FEATURE_SOURCES, index['FEATURE_SOURCES'])
@@ -1,5 +1,8 @@
+import io
 import unittest
 import os
+import tempfile
+from unittest import mock
 
 from dungeonsheets import make_sheets, character
 
@@ -47,3 +50,91 @@ class MarkdownTestCase(unittest.TestCase):
     def test_no_text(self):
         text = make_sheets.rst_to_latex(None)
         self.assertEqual(text, '')
+
+
+class JinjaEnvTestCase(unittest.TestCase):
+    def test_shared_env(self):
+        self.assertIs(make_sheets.latex_env(), make_sheets.latex_env())
+
+    def test_jinja_env_alias(self):
+        self.assertIs(make_sheets.jinja_env, make_sheets.latex_env())
+        with self.assertRaises(AttributeError):
+            make_sheets.not_an_env
+    
+    def test_bytecode_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.dict(os.environ, {'DUNGEONSHEETS_CACHE_DIR': tmpdir}):
+                env = make_sheets.create_jinja_env()
+                env.get_template('features_template.tex')
+            cached = os.listdir(os.path.join(tmpdir, 'jinja'))
+            self.assertEqual(len(cached), 1)
+            # A new environment loads the compiled template from the cache
+            with mock.patch.dict(os.environ, {'DUNGEONSHEETS_CACHE_DIR': tmpdir}):
+                env = make_sheets.create_jinja_env()
+                with mock.patch('jinja2.Environment.compile') as compile_:
+                    env.get_template('features_template.tex')
+            compile_.assert_not_called()
+
+
+class ParallelBuildTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, filename, text):
+        filename = os.path.join(self.tmpdir.name, filename)
+        with open(filename, mode='w') as fp:
+            fp.write(text)
+        return filename
+
+    def test_build_sheet(self):
+        with mock.patch('dungeonsheets.make_sheets.make_sheet') as make_sheet:
+            result = make_sheets._build_sheet('clara.py', flatten=True)
+            self.assertEqual(result, ('clara.py', 'done', None))
+            make_sheet.side_effect = RuntimeError('pdftk crashed')
+            result = make_sheets._build_sheet('clara.py', flatten=True)
+        self.assertEqual(result.status, 'failed')
+        self.assertIn('pdftk crashed', result.error)
+
+    def test_make_sheets(self):
+        # Neither file gets as far as calling pdftk or pdflatex
+        filenames = [
+            self.write('notes.py', 'name = "Not a character"\n'),
+            self.write('bad.py', 'dungeonsheets_version = "1.0"\n'
+                       'weapons = ["laser sword"]\n'),
+            self.write('notes2.py', 'x = 1\n'),
+        ]
+        results = list(make_sheets.make_sheets(filenames, jobs=2))
+        self.assertEqual([r.filename for r in results], filenames)
+        self.assertEqual([r.status for r in results],
+                         ['invalid', 'failed', 'invalid'])
+        self.assertIn('laser sword', results[1].error)
+
+    def test_main(self):
+        results = [make_sheets.BuildResult('a.py', 'done', None),
+                   make_sheets.BuildResult('b.py', 'invalid', 'No version'),
+                   make_sheets.BuildResult('c.py', 'failed', 'Traceback')]
+        argv = ['makesheets', '--jobs', '3', 'a.py', 'b.py', 'c.py']
+        with mock.patch('sys.argv', argv), \
+             mock.patch('dungeonsheets.make_sheets.make_sheets',
+                        return_value=iter(results)) as build, \
+             mock.patch('sys.stdout', new_callable=io.StringIO) as stdout, \
+             mock.patch('sys.stderr', new_callable=io.StringIO):
+            exit_code = make_sheets.main()
+        self.assertEqual(exit_code, 1)
+        build.assert_called_once_with(['a.py', 'b.py', 'c.py'], jobs=3,
+                                      flatten=True)
+        self.assertEqual(stdout.getvalue().splitlines(), [
+            'Processing a...done', 'Processing b...invalid',
+            'Processing c...failed', '1 built, 1 invalid, 1 failed.'])
+
+    def test_negative_jobs(self):
+        argv = ['makesheets', '-j', '-2', 'a.py', 'b.py']
+        with mock.patch('sys.argv', argv), \
+             mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            with self.assertRaises(SystemExit) as cm:
+                make_sheets.main()
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn('must be 0 or more', stderr.getvalue())
+        with self.assertRaises(ValueError):
+            list(make_sheets.make_sheets(['a.py'], jobs=-2))
@@ -11,3 +11,28 @@ class MonsterTestCase(TestCase):
         self.assertEqual(wolf.strength.value, 12)
         self.assertEqual(wolf.strength.modifier, 1)
         self.assertEqual(wolf.strength.saving_throw, 1)
+    
+    def test_parse_description(self):
+        self.assertEqual(monsters.parse_description('Huge beast, unaligned'),
+                         ('huge', 'beast'))
+        self.assertEqual(
+            monsters.parse_description('Medium swarm of tiny beasts, unaligned'),
+            ('medium', 'beast'))
+        self.assertEqual(monsters.parse_description(''), ('', ''))
+        self.assertTrue(monsters.Wolf().is_beast)
+    
+    def test_monster_index(self):
+        index = monsters.monster_index()
+        self.assertIs(index, monsters.monster_index())
+        self.assertIn(monsters.Wolf, index.monsters)
+        crs = [M.challenge_rating for M in index.monsters]
+        self.assertEqual(crs, sorted(crs))
+        # Range queries
+        found = index.find(min_cr=1/4, max_cr=1/2)
+        self.assertIn(monsters.Wolf, found)
+        self.assertIn(monsters.Ape, found)
+        self.assertNotIn(monsters.Rat, found)
+        self.assertNotIn(monsters.GiantEagle, found)
+        # Movement limits
+        self.assertNotIn(monsters.Crocodile, index.find(max_swim=0))
+        self.assertNotIn(monsters.GiantEagle, index.find(max_fly=0))
@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from dungeonsheets import rules_search, spells
+
+
+class TokenizeTestCase(TestCase):
+    def test_stem(self):
+        self.assertEqual(rules_search.stem('saving'), rules_search.stem('save'))
+        self.assertEqual(rules_search.stem('throws'), 'throw')
+        self.assertEqual(rules_search.stem('enemies'), 'enemy')
+        self.assertEqual(rules_search.stem('radius'), 'radius')
+
+    def test_tokenize(self):
+        tokens = rules_search.tokenize('Make a Dexterity saving throw')
+        # "a" is dropped, but still takes up a position
+        self.assertEqual(tokens, [(0, 'mak'), (2, 'dexterity'), (3, 'sav'),
+                                  (4, 'throw')])
+
+    def test_parse_query(self):
+        phrases, terms = rules_search.parse_query('"saving throw" radius')
+        self.assertEqual(phrases, [[(0, 'sav'), (1, 'throw')]])
+        self.assertEqual(terms, ['sav', 'throw', 'radius'])
+
+
+class SearchIndexTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.filename = os.path.join(cls.tmpdir.name, 'search_index.json')
+        cls.index = rules_search.build_search_index(cls.filename)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_search(self):
+        results = self.index.search('fireball', n=5)
+        self.assertEqual(results[0].attr, 'Fireball')
+        self.assertIs(self.index.resolve(results[0]), spells.Fireball)
+        # Filter by category
+        results = self.index.search('darkvision', categories='features')
+        self.assertTrue(results)
+        self.assertEqual({r.category for r in results}, {'features'})
+        # Unknown words match nothing
+        self.assertEqual(self.index.search('xyzzyplugh'), [])
+
+    def test_phrase(self):
+        results = self.index.search('"saving throw" radius', n=20)
+        self.assertTrue(results)
+        for result in results:
+            doc = self.index.resolve(result).__doc__.lower()
+            self.assertRegex(doc, r'saving\s+throw')
+
+    def test_load_cached(self):
+        loaded = rules_search.load_search_index(self.filename, rebuild=False)
+        self.assertEqual(loaded.search('cure wounds'),
+                         self.index.search('cure wounds'))
+        # Out-of-date indexes are not used
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'search_index.json')
+            with open(self.filename) as fp:
+                data = json.load(fp)
+            data['fingerprint']['index_format'] = 0
+            with open(filename, 'w') as fp:
+                json.dump(data, fp)
+            self.assertIsNone(rules_search.load_search_index(filename, rebuild=False))
@@ -2,7 +2,8 @@
 
 from unittest import TestCase
 
-from dungeonsheets.spells import create_spell, Spell
+from dungeonsheets import spells, module_index, spell_table
+from dungeonsheets.spells import create_spell, canonical_spell, Spell
 
 
 class TestSpells(TestCase):
@@ -25,3 +26,81 @@ class TestSpells(TestCase):
         # Try with a ritual and a concentration
         spell.concentration = True
         self.assertEqual(str(spell), 'My spell (R, C)')
+
+    def test_spell_hash(self):
+        # Equal spells should hash equally so sets work
+        self.assertEqual(hash(spells.Fireball()), hash(spells.Fireball()))
+        self.assertEqual(len({spells.Fireball(), spells.Fireball(),
+                              spells.MagicMissile()}), 2)
+
+    def test_canonical_spell(self):
+        fireball = canonical_spell(spells.Fireball)
+        self.assertIsInstance(fireball, spells.Fireball)
+        self.assertIs(canonical_spell(spells.Fireball), fireball)
+        # Placeholder spells don't change the base class
+        create_spell(name="Made up spell", level=2)
+        self.assertEqual(Spell.name, "Unknown spell")
+
+    def test_canonical_placeholders(self):
+        # Placeholders for the same unknown spell share one entry
+        size = len(spells.spells._canonical_spells)
+        made_up = [canonical_spell(create_spell(name="Made up spell", level=2))
+                   for i in range(3)]
+        self.assertIs(made_up[1], made_up[0])
+        self.assertIs(made_up[2], made_up[0])
+        self.assertEqual(len(spells.spells._canonical_spells), size + 1)
+        # A real spell with the same name replaces the placeholder
+        MadeUpSpell = type('MadeUpSpell', (Spell,),
+                           {'name': "Made up spell", 'level': 2})
+        self.assertIsInstance(canonical_spell(MadeUpSpell), MadeUpSpell)
+        self.assertEqual(len(spells.spells._canonical_spells), size + 1)
+
+    def test_lazy_spells(self):
+        # Spells are available by name and listed by ``dir()``
+        self.assertIn('ZoneOfTruth', dir(spells))
+        self.assertIn('ZoneOfTruth', spells.__all__)
+        self.assertEqual(spells.ZoneOfTruth.name, 'Zone Of Truth')
+        self.assertEqual(spells.ZoneOfTruth.__module__,
+                         'dungeonsheets.spells.spells_z')
+        with self.assertRaises(AttributeError):
+            spells.NotARealSpell
+
+    def test_spell_index(self):
+        """Check that the generated spell index is up-to-date.
+        
+        If this fails, run ``python -m dungeonsheets.module_index``.
+        
+        """
+        index = module_index.spell_indexes()
+        self.assertEqual(spells.SPELL_MODULES, index['SPELL_MODULES'])
+
+
+class SpellTableTestCase(TestCase):
+    def setUp(self):
+        self.table = spell_table.spell_table()
+
+    def test_query(self):
+        results = self.table.query(level=range(1, 4), school='Divination',
+                                   ritual=True, classes='Wizard')
+        self.assertIn(spells.DetectMagic, results)
+        self.assertNotIn(spells.Clairvoyance, results)  # Not a ritual
+
+    def test_matches_entries(self):
+        # Compare against checking each spell one at a time
+        entries = self.table.select(level=(0, 2), classes=('Bard', 'cleric'),
+                                    components='VS', concentration=False,
+                                    casting_time='action')
+        expected = [e for e in self.table.entries
+                    if e.level in (0, 2)
+                    and {'Bard', 'Cleric'} & set(e.classes)
+                    and 'M' not in e.components
+                    and not e.concentration
+                    and spell_table.casting_time_category(e.casting_time) == 'action']
+        self.assertEqual(entries, expected)
+        self.assertTrue(len(entries) > 0)
+
+    def test_casting_time_category(self):
+        self.assertEqual(spell_table.casting_time_category('1 bonus action'),
+                         'bonus action')
+        self.assertEqual(spell_table.casting_time_category('10 minutes'), 'minutes')
+        self.assertEqual(spell_table.casting_time_category('Special'), 'special')
@@ -0,0 +1,43 @@
+import os
+from unittest import TestCase
+
+from dungeonsheets import startup_profile
+
+
+# Maximum time (in seconds) to import ``dungeonsheets.make_sheets`` in a
+# new interpreter. Override with the environment variable
+# DUNGEONSHEETS_IMPORT_BUDGET, eg. on slow machines.
+IMPORT_BUDGET = float(os.environ.get('DUNGEONSHEETS_IMPORT_BUDGET', 1.0))
+
+
+class StartupProfileTestCase(TestCase):
+    def test_module_group(self):
+        self.assertEqual(startup_profile.module_group('dungeonsheets.spells.spells_a'),
+                         'dungeonsheets.spells')
+        self.assertEqual(startup_profile.module_group('dungeonsheets'),
+                         'dungeonsheets')
+        self.assertEqual(startup_profile.module_group('jinja2.nodes'), 'jinja2')
+    
+    def test_parse_importtime(self):
+        output = ("import time: self [us] | cumulative | imported package\n"
+                  "import time:       150 |        150 |     jinja2.nodes\n"
+                  "import time:       100 |        250 |   jinja2\n"
+                  "import time:      1000 |       1000 | dungeonsheets.spells.spells_a\n"
+                  "Some other output\n")
+        times = startup_profile.parse_importtime(output)
+        self.assertEqual(set(times.keys()), {'jinja2', 'dungeonsheets.spells'})
+        self.assertAlmostEqual(times['jinja2'], 250e-6)
+        self.assertAlmostEqual(times['dungeonsheets.spells'], 1000e-6)
+    
+    def test_format_report(self):
+        costs = [startup_profile.StartupCost('import jinja2', 0.02, 2048),
+                 startup_profile.StartupCost('PDF templates', 0.08, 1024)]
+        report = startup_profile.format_report(costs)
+        self.assertIn('import jinja2', report)
+        self.assertIn('100.0', report.splitlines()[-1])
+    
+    def test_import_budget(self):
+        seconds = startup_profile.import_time('dungeonsheets.make_sheets')
+        msg = (f'Importing dungeonsheets.make_sheets took {seconds:.3f} s, '
+               f'more than the budget of {IMPORT_BUDGET:.3f} s.')
+        self.assertLessEqual(seconds, IMPORT_BUDGET, msg)
@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from dungeonsheets import stats, character
 
@@ -74,6 +74,30 @@ class TestStats(TestCase):
         my_class.skill_proficiencies = ['acrobatics']
         self.assertEqual(my_class.acrobatics, 4)
 
+    def test_derived_stat_cache(self):
+        """Check that derived stats are only re-computed when needed."""
+        char = character.Character(classes=['Monk'], levels=[1],
+                                   dexterity=14, wisdom=14)
+        self.assertEqual(char.armor_class, 14)
+        compute = stats.ArmorClass.compute
+        with mock.patch.object(stats.ArmorClass, 'compute', autospec=True,
+                               side_effect=compute) as mocked:
+            # Unchanged inputs use the cached value
+            self.assertEqual(char.armor_class, 14)
+            mocked.assert_not_called()
+            # Changing an unrelated input uses the cached value
+            char.strength = 18
+            self.assertEqual(char.armor_class, 14)
+            mocked.assert_not_called()
+            # Changing a relevant input triggers a re-compute
+            char.wisdom = 16
+            self.assertEqual(char.armor_class, 15)
+            self.assertEqual(mocked.call_count, 1)
+            # Changes propagate through other derived stats
+            char.wear_armor('leather armor')
+            self.assertEqual(char.armor_class, 13)
+            self.assertEqual(mocked.call_count, 2)
+    
     def test_findattr(self):
         """Check if the function can find attributes."""
         class TestClass():
@@ -90,3 +114,53 @@ class TestStats(TestCase):
                          test_class.my_attr)
         self.assertEqual(stats.findattr(test_class, 'your attr'),
                          test_class.YourAttr)
+        # Other spellings
+        self.assertEqual(stats.findattr(test_class, 'My-Attr'),
+                         test_class.my_attr)
+
+    def test_findattr_module(self):
+        """Check that look-ups in modules use the normalized index."""
+        from dungeonsheets import spells, weapons
+        for name in ["Tasha's Hideous Laughter", "tashas_hideous_laughter",
+                     "TASHA’S HIDEOUS-LAUGHTER"]:
+            self.assertIs(stats.findattr(spells, name),
+                          spells.TashasHideousLaughter)
+        index = stats.name_index(spells)
+        self.assertIs(stats.name_index(spells), index)
+        self.assertEqual(index['fireball'], 'Fireball')
+        # Magical bonuses are parsed and removed
+        Longsword2 = stats.findattr(weapons, 'longsword +2')
+        self.assertEqual(Longsword2.attack_bonus, 2)
+        self.assertTrue(issubclass(Longsword2, weapons.Longsword))
+
+    def test_findattr_display_name(self):
+        """Check that display names find the same class as python names."""
+        from dungeonsheets import weapons
+        self.assertEqual(stats.normalize_name('Crossbow, hand'), 'crossbowhand')
+        for name in ['Crossbow, hand', 'crossbow hand', 'HandCrossbow']:
+            self.assertIs(stats.findattr(weapons, name), weapons.HandCrossbow)
+        self.assertIs(stats.findattr(weapons, 'Crossbow, heavy'),
+                      weapons.HeavyCrossbow)
+        self.assertIs(stats.findattr(weapons, 'Crossbow, hand +1').__bases__[0],
+                      weapons.HandCrossbow)
+        self.assertIs(stats.findattr(weapons, 'Flame Tongue +1'),
+                      weapons.FlameTongue)
+        # Only lazily-loaded packages need the catalog, and only for
+        # names that aren't attribute names
+        from dungeonsheets import spells
+        stats._name_indexes.pop(spells, None)
+        stats._name_indexes.pop(weapons, None)
+        with mock.patch.object(stats, 'load_catalog',
+                               wraps=stats.load_catalog) as load_catalog:
+            self.assertIs(stats.findattr(spells, 'fireball'), spells.Fireball)
+            self.assertIs(stats.findattr(weapons, 'Crossbow, hand'),
+                          weapons.HandCrossbow)
+            load_catalog.assert_not_called()
+            self.assertIs(stats.findattr(spells, "Tasha's Hideous Laughter"),
+                          spells.TashasHideousLaughter)
+        # Every weapon can be found by its display name, except where
+        # it is also the name of a list (eg. ``simple_weapons``)
+        for attr, name in stats.display_names(weapons).items():
+            if name and attr not in ('SimpleWeapon', 'MartialWeapon'):
+                self.assertIs(stats.findattr(weapons, name),
+                              getattr(weapons, attr), name)
@@ -0,0 +1,68 @@
+from unittest import TestCase, mock
+import warnings
+
+from dungeonsheets import features, monsters, spells, stats, weapons
+from dungeonsheets.character import Character
+from dungeonsheets.exceptions import UnknownNameError
+from dungeonsheets.stats import suggest_names, findattr
+from dungeonsheets.suggestions import TrigramIndex, trigrams
+
+
+class TestSuggestions(TestCase):
+    def test_trigrams(self):
+        self.assertEqual(trigrams('ab'), {'  a', ' ab', 'ab '})
+    
+    def test_trigram_index(self):
+        index = TrigramIndex(['Fireball', 'Fire Bolt', 'Wish'])
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.suggest('fireball'), ['Fireball'])
+        self.assertEqual(index.suggest('firebal')[0], 'Fireball')
+        self.assertEqual(index.suggest('fire bolt', n=1), ['Fire Bolt'])
+        self.assertEqual(index.suggest('xyzzy'), [])
+        # Aliases match but the main name is suggested
+        index.add('Tasha\'s Hideous Laughter', aliases=('TashasHideousLaughter',))
+        self.assertEqual(index.suggest('tashashideouslaughter'),
+                         ["Tasha's Hideous Laughter"])
+    
+    def test_suggest_names(self):
+        self.assertEqual(suggest_names(spells, 'magic misile')[0],
+                         'Magic Missile')
+        self.assertIn('Longsword', suggest_names(weapons, 'lonsword'))
+        with self.assertRaisesRegex(AttributeError, 'Did you mean "Shortsword"'):
+            findattr(weapons, 'shortswerd')
+
+    def test_only_game_objects(self):
+        # Helpers, placeholders and empty names are not suggested
+        self.assertEqual(suggest_names(weapons, 'laser sword'),
+                         ['Shortsword', 'Longsword', 'Greatsword'])
+        self.assertEqual(suggest_names(weapons, 'find weapons')[:2],
+                         ['Ranged Weapons', 'Melee Weapons'])
+        self.assertEqual(suggest_names(spells, 'unknown spel'), [])
+        self.assertEqual(suggest_names(monsters, 'generic monstr'), [])
+        self.assertEqual(suggest_names(weapons, 'crosbow hand')[0],
+                         'Crossbow, hand')
+        # Shared names are suggested by their python name instead
+        self.assertIn('CelestialResilience',
+                      suggest_names(features, 'celestial resilence'))
+        # Every suggestion can be found
+        for module, name in [(weapons, 'crosbow'), (features, 'expertice'),
+                             (features, 'fighting style'), (spells, 'wishh')]:
+            for suggestion in suggest_names(module, name):
+                findattr(module, suggestion)
+
+    def test_hint(self):
+        with self.assertRaises(UnknownNameError) as cm:
+            findattr(weapons, 'shortswerd')
+        self.assertTrue(cm.exception.hint.startswith(' Did you mean "Shortsword"'))
+        # Characters re-use the hint rather than searching again
+        with mock.patch.object(stats, 'did_you_mean',
+                               wraps=stats.did_you_mean) as did_you_mean:
+            with self.assertRaisesRegex(AttributeError, 'Did you mean "Shortsword"'):
+                Character(weapons=['shortswerd'])
+        self.assertEqual(did_you_mean.call_count, 1)
+    
+    def test_character_warnings(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            Character(spells=['magic misile'])
+        self.assertIn('Did you mean "Magic Missile"', str(w[-1].message))
@@ -1,6 +1,9 @@
 import unittest
 
-from dungeonsheets.weapons import Weapon
+from dungeonsheets import weapons
+from dungeonsheets.weapons import (Weapon, Longsword, Shortsword, Dagger,
+                                   WeaponProperty, parse_properties)
+from dungeonsheets.armor import Shield, ChainMail
 
 
 class WeaponTestCase(unittest.TestCase):
@@ -11,3 +14,51 @@ class WeaponTestCase(unittest.TestCase):
         # Now add some bonus damage
         weapon.damage_bonus = 2
         self.assertEqual(weapon.damage, '1d6+2')
+
+    def test_improved_version(self):
+        Longsword1 = Longsword.improved_version(1)
+        self.assertEqual(Longsword1.name, '+1 Longsword')
+        self.assertEqual(Longsword1.attack_bonus, 1)
+        self.assertTrue(issubclass(Longsword1, Longsword))
+        # Repeated calls give the same class
+        self.assertIs(Longsword.improved_version('1'), Longsword1)
+        self.assertIsNot(Longsword.improved_version(2), Longsword1)
+        self.assertIsNot(Shortsword.improved_version(1), Longsword1)
+        # Also for shields and armor
+        self.assertIs(Shield.improved_version(1), Shield.improved_version(1))
+        self.assertIs(ChainMail.improved_version(2),
+                      ChainMail.improved_version(2))
+
+    def test_parse_properties(self):
+        props = parse_properties('Finesse, light, thrown (range 20/60)')
+        self.assertEqual(props.flags, (WeaponProperty.FINESSE | WeaponProperty.LIGHT
+                                       | WeaponProperty.THROWN))
+        self.assertEqual((props.normal_range, props.long_range), (20, 60))
+        props = parse_properties('Versatile (1d10)')
+        self.assertEqual(props.flags, WeaponProperty.VERSATILE)
+        self.assertEqual(props.versatile_damage, '1d10')
+        self.assertIsNone(props.normal_range)
+        props = parse_properties('Ammunition (range 60/240), Reload 4, Misfire 1')
+        self.assertEqual((props.reload, props.misfire), (4, 1))
+        props = parse_properties('Heavy, two-handed, glowing')
+        self.assertTrue(props.flags & WeaponProperty.TWO_HANDED)
+        self.assertEqual(props.other, ('glowing',))
+        self.assertEqual(parse_properties('').flags, 0)
+
+    def test_weapon_properties(self):
+        self.assertTrue(Dagger.is_finesse)
+        self.assertFalse(Longsword.is_finesse)
+        self.assertEqual(Dagger().property_info.normal_range, 20)
+        self.assertIn(WeaponProperty.VERSATILE, Longsword().property_flags)
+
+    def test_find_weapons(self):
+        finesse_light = weapons.find_weapons(
+            include=WeaponProperty.FINESSE | WeaponProperty.LIGHT)
+        self.assertIn(Dagger, finesse_light)
+        self.assertIn(Shortsword, finesse_light)
+        self.assertNotIn(weapons.Rapier, finesse_light)
+        one_handed = weapons.find_weapons(exclude=WeaponProperty.TWO_HANDED,
+                                          candidates=weapons.martial_melee_weapons)
+        self.assertIn(Longsword, one_handed)
+        self.assertNotIn(weapons.Greatsword, one_handed)
+        self.assertNotIn(Dagger, one_handed)